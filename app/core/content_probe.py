@@ -0,0 +1,132 @@
+"""Content-type probing for URLs no provider agent claims."""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import OrderedDict
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from app.core.errors import APIError
+from app.core.schemas import ImportMethod
+
+if TYPE_CHECKING:
+    from app.shared.http import HTTPService
+
+logger = logging.getLogger(__name__)
+
+# Extensions that settle the import method without a request
+IMAGE_EXTENSIONS = frozenset(
+    {".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif", ".bmp", ".tif", ".tiff"}
+)
+WEB_EXTENSIONS = frozenset({".html", ".htm", ".php", ".asp", ".aspx", ".jsp"})
+
+# HEAD statuses that mean "HEAD not allowed" rather than "no such page";
+# presigned CDN URLs, for example, are only signed for GET
+HEAD_REFUSED_STATUSES = frozenset({403, 405, 501})
+
+_DIGITS = re.compile(r"\d+")
+
+
+def method_for_content_type(content_type: str) -> ImportMethod:
+    """Map a Content-Type header to the import method that handles it."""
+    content_type = content_type.lower()
+    if content_type.startswith(("image/", "application/octet-stream")):
+        return ImportMethod.IMAGE
+    return ImportMethod.WEB
+
+
+class ContentProbe:
+    """Works out whether a URL serves an image or a web page.
+
+    Obvious file extensions are decided locally. Otherwise the content type
+    is probed with HEAD (or a one-byte ranged GET when HEAD is refused), and
+    the result is cached per host and path pattern, since a host almost
+    always serves the same kind of content under the same directory.
+    """
+
+    def __init__(self: ContentProbe, ttl: float, max_entries: int = 2048) -> None:
+        """Cache probe results for ``ttl`` seconds (0 disables the cache)."""
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._cache: OrderedDict[tuple[str, str, str], tuple[ImportMethod, float]] = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def cache_key(url: str) -> tuple[str, str, str]:
+        """Host, top-level directory (digits collapsed) and file extension."""
+        parsed = urlsplit(url)
+        path = PurePosixPath(parsed.path)
+        directories = [part for part in path.parent.parts if part != "/"]
+        directory = _DIGITS.sub("#", directories[0]) if directories else ""
+        host = (parsed.hostname or "").removeprefix("www.")
+        return host, directory, path.suffix.lower()
+
+    async def detect(
+        self: ContentProbe, url: str, http_service: HTTPService
+    ) -> ImportMethod:
+        """Get the import method for a URL, probing the network if needed."""
+        key = self.cache_key(url)
+        extension = key[2]
+        if extension in IMAGE_EXTENSIONS:
+            return ImportMethod.IMAGE
+        if extension in WEB_EXTENSIONS:
+            return ImportMethod.WEB
+
+        if cached := self._get_cached(key):
+            logger.info(f"Using cached content type for {key[0]}: {cached}")
+            return cached
+
+        try:
+            content_type = await self._probe(url, http_service)
+        except Exception as e:
+            logger.warning(f"Failed to detect content-type: {e}")
+            # Not cached, so the next URL on this host gets a fresh probe
+            return ImportMethod.WEB
+
+        method = method_for_content_type(content_type)
+        logger.info(f"Detected content-type {content_type!r}, using {method}")
+        self._store(key, method)
+        return method
+
+    async def _probe(self: ContentProbe, url: str, http_service: HTTPService) -> str:
+        """Fetch the Content-Type header without reading any body."""
+        try:
+            response = await http_service.head(url, service="URLAnalyzer")
+        except APIError as e:
+            if e.status_code not in HEAD_REFUSED_STATUSES:
+                raise
+            logger.debug(f"HEAD refused ({e.status_code}), trying ranged GET")
+            # Servers may ignore the Range; only the headers are needed
+            async with http_service.stream(
+                "GET", url, service="URLAnalyzer", headers={"Range": "bytes=0-0"}
+            ) as response:
+                return response.headers.get("content-type", "")
+        return response.headers.get("content-type", "")
+
+    def _get_cached(
+        self: ContentProbe, key: tuple[str, str, str]
+    ) -> ImportMethod | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        method, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return method
+
+    def _store(
+        self: ContentProbe, key: tuple[str, str, str], method: ImportMethod
+    ) -> None:
+        if self.ttl <= 0:
+            return
+        self._cache[key] = (method, time.monotonic() + self.ttl)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
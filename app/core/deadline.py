@@ -0,0 +1,121 @@
+"""Import deadlines.
+
+``EventImporter.import_event`` opens a deadline scope for the request's
+timeout. Everything below it (agents, HTTPService, the LLM providers,
+enrichment stages, retries) reads the remaining budget from the context
+instead of using its own fixed timeout, so no single call or retry can
+outlive the caller. Outside a scope nothing changes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+from tenacity import RetryCallState
+
+_current: ContextVar[Deadline | None] = ContextVar("import_deadline", default=None)
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when an import runs out of its time budget."""
+
+    def __init__(self: DeadlineExceededError, budget: float) -> None:
+        """Initialize DeadlineExceededError."""
+        self.budget = budget
+        super().__init__(f"Import did not finish within its {budget:g}s deadline")
+
+
+class Deadline:
+    """A point in time an import has to finish by."""
+
+    def __init__(self: Deadline, budget: float) -> None:
+        """Start a deadline ``budget`` seconds from now."""
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self: Deadline) -> float:
+        """Seconds left, never negative."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self: Deadline) -> bool:
+        """Whether the budget is used up."""
+        return self.remaining() <= 0
+
+
+def current_deadline() -> Deadline | None:
+    """The deadline of the import running in this context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(budget: float | None) -> Iterator[Deadline | None]:
+    """Run the enclosed code under a deadline ``budget`` seconds from now.
+
+    A scope never extends an enclosing deadline. ``None`` keeps whatever
+    deadline (or none) is already in effect.
+    """
+    outer = _current.get()
+    deadline = Deadline(budget) if budget is not None else outer
+    if outer is not None and deadline is not None:
+        deadline = min(outer, deadline, key=lambda d: d.expires_at)
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def time_left(default: float | None = None) -> float | None:
+    """The timeout for the next operation: ``default`` capped by the deadline.
+
+    Raises DeadlineExceededError instead of starting work that can't finish.
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return default
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise DeadlineExceededError(deadline.budget)
+    return remaining if default is None else min(default, remaining)
+
+
+def deadline_passed() -> bool:
+    """Whether the import running in this context is out of time.
+
+    A request whose timeout was shortened to the time left times out just
+    as this turns true; such a timeout says nothing about the service.
+    """
+    deadline = _current.get()
+    return deadline is not None and deadline.expired
+
+
+@asynccontextmanager
+async def enforce_deadline() -> AsyncIterator[None]:
+    """Cancel the enclosed work when the deadline passes.
+
+    Whatever the enclosed work fails with once the deadline has passed
+    (cancellation, a shortened timeout, or an error caused by one) is
+    reported as DeadlineExceededError.
+    """
+    deadline = _current.get()
+    if deadline is None:
+        yield
+        return
+    try:
+        async with asyncio.timeout(deadline.remaining()):
+            yield
+    except Exception as e:
+        if not deadline.expired or isinstance(e, DeadlineExceededError):
+            raise
+        raise DeadlineExceededError(deadline.budget) from e
+
+
+def deadline_exhausted(retry_state: RetryCallState) -> bool:
+    """Tenacity stop condition: no retry that would sleep past the deadline."""
+    deadline = _current.get()
+    return deadline is not None and deadline.remaining() <= retry_state.upcoming_sleep
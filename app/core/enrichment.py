@@ -0,0 +1,130 @@
+"""Dependency-graph scheduling for post-extraction enrichment stages."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.core.deadline import current_deadline
+from app.core.schemas import EventData, ServiceFailure
+from app.core.timing import span
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StageOutcome:
+    """What an enrichment stage produced."""
+
+    # EventData fields to set; only the stage's declared outputs are applied
+    updates: dict[str, Any] = field(default_factory=dict)
+    service_failure: ServiceFailure | None = None
+
+
+@dataclass(frozen=True)
+class EnrichmentStage:
+    """A unit of enrichment work and the EventData fields it reads and writes.
+
+    ``run`` receives a private copy of the event data as it stands once every
+    stage it depends on has finished, and returns the updates to apply.
+    """
+
+    name: str
+    run: Callable[[EventData], Awaitable[StageOutcome]]
+    inputs: frozenset[str]
+    outputs: frozenset[str]
+
+
+class EnrichmentGraph:
+    """Runs enrichment stages as soon as the fields they read are final.
+
+    A stage depends on every stage declared before it that writes a field it
+    reads or writes. Everything else runs concurrently, so e.g. genre and image
+    search don't wait for the description LLM call.
+
+    Under an import deadline, stages still running when it passes are
+    cancelled and reported as failures; updates from finished stages are kept.
+    """
+
+    def __init__(self: EnrichmentGraph, stages: list[EnrichmentStage]) -> None:
+        """Build the graph, resolving dependencies from declaration order."""
+        names = [stage.name for stage in stages]
+        if len(names) != len(set(names)):
+            raise ValueError(f"Duplicate enrichment stage names: {names}")
+
+        self.stages = stages
+        self.dependencies: dict[str, set[str]] = {}
+        for index, stage in enumerate(stages):
+            touched = stage.inputs | stage.outputs
+            self.dependencies[stage.name] = {
+                earlier.name for earlier in stages[:index] if earlier.outputs & touched
+            }
+
+    async def run(
+        self: EnrichmentGraph, event_data: EventData
+    ) -> tuple[EventData, list[ServiceFailure]]:
+        """Run all stages, applying their updates to event_data in place."""
+        failures: list[ServiceFailure] = []
+        tasks: dict[str, asyncio.Task[None]] = {}
+
+        async def run_stage(stage: EnrichmentStage) -> None:
+            # Dependencies never raise; stage errors are recorded as failures
+            await asyncio.gather(*(tasks[dep] for dep in self.dependencies[stage.name]))
+            try:
+                with span(f"enrichment.{stage.name}"):
+                    outcome = await stage.run(event_data.model_copy(deep=True))
+            except Exception as e:
+                logger.exception(f"Enrichment stage '{stage.name}' failed")
+                failures.append(
+                    ServiceFailure(
+                        service=stage.name,
+                        error=str(e),
+                        detail=f"Enrichment stage '{stage.name}' failed",
+                    )
+                )
+                return
+
+            if outcome.service_failure:
+                failures.append(outcome.service_failure)
+            for name, value in outcome.updates.items():
+                if name not in stage.outputs:
+                    logger.warning(
+                        f"Stage '{stage.name}' tried to set undeclared field '{name}'"
+                    )
+                    continue
+                setattr(event_data, name, value)
+
+        # Stages are created in declaration order, so dependencies always exist
+        for stage in self.stages:
+            tasks[stage.name] = asyncio.create_task(run_stage(stage))
+        if tasks:
+            failures.extend(await self._wait(tasks))
+
+        return event_data, failures
+
+    @staticmethod
+    async def _wait(tasks: dict[str, asyncio.Task[None]]) -> list[ServiceFailure]:
+        """Wait for the stage tasks, cancelling those the deadline cuts off."""
+        deadline = current_deadline()
+        _, pending = await asyncio.wait(
+            tasks.values(), timeout=deadline.remaining() if deadline else None
+        )
+        if not pending:
+            return []
+
+        cut_off = [name for name, task in tasks.items() if task in pending]
+        logger.warning(f"Import deadline passed during enrichment: {cut_off}")
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        return [
+            ServiceFailure(
+                service=name,
+                error="Deadline exceeded",
+                detail=f"Enrichment stage '{name}' did not finish in time",
+            )
+            for name in cut_off
+        ]
@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import inspect
 import logging
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
 from tenacity import (
+    AsyncRetrying,
     RetryCallState,
     before_sleep_log,
     retry,
     stop_after_attempt,
-    wait_exponential,
+    stop_any,
+    wait_exponential_jitter,
 )
 
+from app.core.deadline import DeadlineExceededError, deadline_exhausted
+from app.core.retry_budget import retry_budget_exhausted
+from app.core.timing import record_span, span
 from config.retry import get_retry_config
 
 logger = logging.getLogger(__name__)
@@ -29,6 +37,10 @@ class ConfigurationError(EventImporterError):
     """Raised when configuration is invalid or missing."""
 
 
+class CassetteError(EventImporterError):
+    """Raised when a cassette can't be read or has no recorded response."""
+
+
 class ExtractionError(EventImporterError):
     """Base exception for extraction-related errors."""
 
@@ -90,6 +102,15 @@ class RequestTimeoutError(APIError):
         super().__init__("HTTP", message, 408)
 
 
+class CircuitOpenError(APIError):
+    """Raised instead of calling a service whose circuit breaker is open."""
+
+    def __init__(self: CircuitOpenError, service: str, retry_in: float) -> None:
+        """Initialize CircuitOpenError."""
+        self.retry_in = retry_in
+        super().__init__(service, f"Circuit open; next attempt in {retry_in:.0f}s", 503)
+
+
 class UnsupportedURLError(ImporterError):
     """Raised when a URL is not supported by any agent."""
 
@@ -228,6 +249,12 @@ def retry_on_error(
         backoff: Backoff multiplier for exponential backoff (uses config default if None)
         exceptions: Tuple of exceptions to retry on
 
+    Waits grow exponentially plus up to ``jitter`` random seconds. Retries
+    stop early when the import deadline would pass during the wait or the
+    import's retry budget is spent. When a coroutine function is retried,
+    each of its attempts is recorded as a ``retry.<name>`` stage and each
+    wait as ``retry.backoff``; calls that succeed first time record nothing.
+
     """
     retry_config = get_retry_config()
 
@@ -245,17 +272,75 @@ def retry_on_error(
             # Never retry these error types
             if isinstance(
                 exception,
-                AuthenticationError | SecurityPageError | ValidationError,
+                AuthenticationError
+                | CircuitOpenError
+                | SecurityPageError
+                | ValidationError
+                | DeadlineExceededError,
             ):
                 return False
             # Only retry specified exceptions
             return isinstance(exception, exceptions)
         return False
 
-    return retry(
-        stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(multiplier=delay, exp_base=backoff),
-        retry=should_retry,
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
+    log_retry = before_sleep_log(logger, logging.WARNING)
+    options: dict[str, Any] = {
+        "stop": stop_any(
+            stop_after_attempt(max_attempts),
+            deadline_exhausted,
+            # Last, so the budget is only drawn for retries that happen
+            retry_budget_exhausted,
+        ),
+        "wait": wait_exponential_jitter(
+            initial=delay, exp_base=backoff, jitter=retry_config.jitter
+        ),
+        "retry": should_retry,
+        "reraise": True,
+    }
+
+    def decorator(func: Callable) -> Callable:
+        if not inspect.iscoroutinefunction(func):
+            return retry(**options, before_sleep=log_retry)(func)
+        return _retry_coroutine(func, options, log_retry)
+
+    return decorator
+
+
+def _retry_coroutine(
+    func: Callable,
+    options: dict[str, Any],
+    log_retry: Callable[[RetryCallState], None],
+) -> Callable:
+    """Retry a coroutine function, recording the attempts of retried calls."""
+    stage = f"retry.{func.__name__}"
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        first_attempt = time.perf_counter()
+        attempts = 0
+
+        def before_sleep(retry_state: RetryCallState) -> None:
+            log_retry(retry_state)
+            # The first attempt is only recorded once it turns out to be
+            # retried; later attempts are recorded as they run
+            if retry_state.attempt_number == 1:
+                record_span(stage, first_attempt)
+
+        async def attempt() -> Any:  # noqa: ANN401
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                return await func(*args, **kwargs)
+            with span(stage):
+                return await func(*args, **kwargs)
+
+        retrying = AsyncRetrying(**options, before_sleep=before_sleep, sleep=_backoff)
+        return await retrying(attempt)
+
+    return wrapper
+
+
+async def _backoff(seconds: float) -> None:
+    """Sleep between attempts, recorded as a stage of the current import."""
+    with span("retry.backoff"):
+        await asyncio.sleep(seconds)
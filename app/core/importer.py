@@ -5,14 +5,23 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import nullcontext
+from datetime import timedelta
+from functools import partial
 from typing import Any
 
 from pydantic import HttpUrl
 
+from app.core.batch import WEB_SOURCE, BatchImporter
+from app.core.content_probe import ContentProbe
+from app.core.deadline import current_deadline, deadline_scope, enforce_deadline
+from app.core.enrichment import EnrichmentGraph, EnrichmentStage, StageOutcome
 from app.core.errors import AgentNotFoundError, UnsupportedURLError
 from app.core.progress import ProgressTracker
+from app.core.retry_budget import retry_budget_scope
 from app.core.schemas import (
+    BatchImportSummary,
     DescriptionResult,
     EventData,
     GenreResult,
@@ -22,26 +31,66 @@ from app.core.schemas import (
     ImportResult,
     ImportStatus,
     ServiceFailure,
+    StageTiming,
 )
+from app.core.timing import SpanRecorder, span
 from app.extraction_agents.base import BaseExtractionAgent as Agent
-from app.extraction_agents.providers.dice import Dice
 from app.extraction_agents.providers.image import Image
-from app.extraction_agents.providers.ra import ResidentAdvisor
-from app.extraction_agents.providers.ticketmaster import Ticketmaster
 from app.extraction_agents.providers.web import Web
+from app.extraction_agents.registry import get_agent_registry
 from app.services.genre import GenreService
 from app.services.image import ImageService
 from app.services.integration_discovery import get_available_integrations
+from app.services.llm.cache import fresh_llm_responses
 from app.services.llm.service import LLMService
 from app.services.security_detector import SecurityPageDetector
 from app.services.zyte import ZyteService
-from app.shared.database.utils import get_event, save_event
+from app.shared.circuit_breaker import get_circuit_breakers
+from app.shared.database.connection import run_db, run_db_write
+from app.shared.database.utils import (
+    get_event,
+    get_fresh_event,
+    save_event,
+    save_stage_timings,
+)
 from app.shared.http import HTTPService
+from app.shared.timezone import get_timezone_from_location
 from app.shared.url_analyzer import URLAnalyzer
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Agents for URLs no provider route claims, by detected import method
+METHOD_AGENTS: dict[ImportMethod, type[Agent]] = {
+    ImportMethod.IMAGE: Image,
+    ImportMethod.WEB: Web,
+}
+
+# Fields the description prompt draws on; genres and images are enriched
+# independently, so descriptions use the values from extraction
+DESCRIPTION_INPUTS = frozenset(
+    {
+        "title",
+        "venue",
+        "date",
+        "end_date",
+        "time",
+        "location",
+        "lineup",
+        "promoters",
+        "cost",
+        "minimum_age",
+        "short_description",
+        "long_description",
+    }
+)
+
+# Upstream service each optional enrichment stage cannot work without
+ENRICHMENT_UPSTREAMS = {
+    "genre": "GoogleGenreSearch",
+    "image": "GoogleImageSearch",
+}
+
 
 class EventImporter:
     """Orchestrates the event import process."""
@@ -49,8 +98,20 @@ class EventImporter:
     def __init__(self, config: Config) -> None:
         """Initialize the event importer."""
         self.config = config
-        self.url_analyzer = URLAnalyzer()
+        self.agent_registry = get_agent_registry()
+        self.url_analyzer = URLAnalyzer(self.agent_registry.routing_table)
         self.progress_tracker = ProgressTracker()
+        self.circuit_breakers = get_circuit_breakers()
+
+        # Agents hold no per-import state, so one instance per class is shared
+        self._agents: dict[type[Agent], Agent] = {}
+        self.content_probe = ContentProbe(
+            config.importer.probe_cache_ttl, config.importer.probe_cache_size
+        )
+
+        # Imports currently running, keyed by normalized URL and options, so
+        # concurrent requests for the same event share one import
+        self._in_flight: dict[tuple, tuple[str, asyncio.Task[ImportResult]]] = {}
 
         # Initialize shared services
         http_service = HTTPService(config)
@@ -75,10 +136,11 @@ class EventImporter:
 
     async def close(self) -> None:
         """Close any resources held by the importer."""
-        # Close HTTP service
-        http_service = self.services.get("http")
-        if http_service and hasattr(http_service, "close"):
-            await http_service.close()
+        # Close the shared HTTP service and the image download session
+        for name in ("http", "image"):
+            service = self.services.get(name)
+            if service and hasattr(service, "close"):
+                await service.close()
 
     async def _enhance_genres(
         self, event_data: EventData, request_id: str
@@ -149,40 +211,138 @@ class EventImporter:
             ),
         )
 
+    async def _describe_stage(
+        self, event_data: EventData, agent: Agent, request_id: str
+    ) -> StageOutcome:
+        """Enrichment stage: generate missing descriptions with the LLM."""
+        described = await agent.enhance_descriptions(event_data, request_id)
+        return StageOutcome(
+            updates={
+                "short_description": described.short_description,
+                "long_description": described.long_description,
+            }
+        )
+
+    async def _genre_stage(
+        self, event_data: EventData, request_id: str
+    ) -> StageOutcome:
+        """Enrichment stage: fill in genres."""
+        result = await self._enhance_genres(event_data, request_id)
+        return StageOutcome(
+            updates={"genres": result.enhanced_genres},
+            service_failure=result.service_failure,
+        )
+
+    async def _image_stage(
+        self, event_data: EventData, request_id: str
+    ) -> StageOutcome:
+        """Enrichment stage: find a better image."""
+        result = await self._enhance_image(event_data, request_id)
+        updates = {}
+        if result.enhanced_image_url:
+            images = dict(event_data.images or {})
+            images["full"] = result.enhanced_image_url
+            images["thumbnail"] = result.enhanced_image_url
+            updates["images"] = images
+        return StageOutcome(updates=updates, service_failure=result.service_failure)
+
+    @staticmethod
+    async def _timezone_stage(event_data: EventData) -> StageOutcome:
+        """Enrichment stage: derive a missing timezone from the location."""
+        if event_data.time and not event_data.time.timezone and event_data.location:
+            timezone = get_timezone_from_location(event_data.location)
+            if timezone:
+                time = event_data.time.model_copy(update={"timezone": timezone})
+                return StageOutcome(updates={"time": time})
+        return StageOutcome()
+
+    def _build_enrichment_graph(
+        self,
+        request_id: str,
+        agent: Agent | None,
+        enhance_genres: bool,
+        enhance_image: bool,
+    ) -> EnrichmentGraph:
+        """Declare the enrichment stages and the fields each reads and writes."""
+        stages = [
+            EnrichmentStage(
+                name="timezone",
+                run=self._timezone_stage,
+                inputs=frozenset({"time", "location"}),
+                outputs=frozenset({"time"}),
+            )
+        ]
+        if agent is not None:
+            stages.append(
+                EnrichmentStage(
+                    name="descriptions",
+                    run=partial(
+                        self._describe_stage, agent=agent, request_id=request_id
+                    ),
+                    inputs=DESCRIPTION_INPUTS,
+                    outputs=frozenset({"short_description", "long_description"}),
+                )
+            )
+        if enhance_genres:
+            stages.append(
+                EnrichmentStage(
+                    name="genre",
+                    run=partial(self._genre_stage, request_id=request_id),
+                    inputs=frozenset({"title", "venue", "date", "lineup", "genres"}),
+                    outputs=frozenset({"genres"}),
+                )
+            )
+        if enhance_image:
+            stages.append(
+                EnrichmentStage(
+                    name="image",
+                    run=partial(self._image_stage, request_id=request_id),
+                    inputs=frozenset({"title", "venue", "lineup", "images"}),
+                    outputs=frozenset({"images"}),
+                )
+            )
+        return EnrichmentGraph(stages)
+
     async def process_event(
         self,
         event_data: EventData,
         request_id: str,
         enhance_genres: bool = True,
         enhance_image: bool = True,
+        agent: Agent | None = None,
     ) -> tuple[EventData, list[ServiceFailure]]:
-        """Post-process an event after import (genre and image enhancement)."""
-        # Run enhancements concurrently
-        tasks = []
-        if enhance_genres:
-            tasks.append(self._enhance_genres(event_data, request_id))
-        if enhance_image:
-            tasks.append(self._enhance_image(event_data, request_id))
-
-        results = await asyncio.gather(*tasks)
-
-        # Process results and collect failures
-        service_failures = []
-        for result in results:
-            if isinstance(result, GenreResult):
-                event_data.genres = result.enhanced_genres
-                if result.service_failure:
-                    service_failures.append(result.service_failure)
-            elif isinstance(result, ImageResult):
-                if result.enhanced_image_url:
-                    if not event_data.images:
-                        event_data.images = {}
-                    event_data.images["full"] = result.enhanced_image_url
-                    event_data.images["thumbnail"] = result.enhanced_image_url
-                if result.service_failure:
-                    service_failures.append(result.service_failure)
-
-        return event_data, service_failures
+        """Post-process an event after extraction.
+
+        Runs the enrichment stages (timezone, descriptions when an agent is
+        given, genres and image) through an EnrichmentGraph, so each starts as
+        soon as the fields it reads are final. Genre and image enhancement are
+        skipped while the circuit breaker of the search they rely on is open.
+        """
+        skipped: list[ServiceFailure] = []
+        if enhance_genres and (failure := self._upstream_unavailable("genre")):
+            skipped.append(failure)
+            enhance_genres = False
+        if enhance_image and (failure := self._upstream_unavailable("image")):
+            skipped.append(failure)
+            enhance_image = False
+
+        graph = self._build_enrichment_graph(
+            request_id, agent, enhance_genres, enhance_image
+        )
+        event_data, failures = await graph.run(event_data)
+        return event_data, skipped + failures
+
+    def _upstream_unavailable(self, stage: str) -> ServiceFailure | None:
+        """A failure to report if an optional stage's upstream circuit is open."""
+        service = ENRICHMENT_UPSTREAMS[stage]
+        if not self.circuit_breakers.is_open(service):
+            return None
+        logger.info(f"Skipping {stage} enhancement: {service} circuit is open")
+        return ServiceFailure(
+            service=stage,
+            error="Circuit open",
+            detail=f"Skipped while {service} is unavailable",
+        )
 
     async def import_event(
         self,
@@ -190,17 +350,163 @@ class EventImporter:
         enhance_genres: bool = True,
         enhance_image: bool = True,
         progress_callback: Callable[[ImportProgress], Awaitable[None]] | None = None,
+        ignore_cache: bool = False,
+        timeout: float | None = None,
     ) -> ImportResult:
         """Import an event from a URL.
 
-        This is the main entry point for the import process.
+        This is the main entry point for the import process. A previously
+        imported event that is still within its source's cache TTL is returned
+        from the database unless ``ignore_cache`` is set.
+
+        Concurrent calls for the same (normalized) URL and options share a
+        single import. Each caller still gets its own ``request_id``, progress
+        stream and copy of the result.
+
+        With a ``timeout`` (seconds), the import runs under a deadline: fetching
+        and extraction are cancelled when it passes (raising
+        DeadlineExceededError), while enrichment stages still running are cut
+        off and reported as service failures so the extracted event is kept.
+        A shared import runs under the deadline of the caller that started it;
+        callers with an earlier deadline stop waiting when theirs passes.
         """
+        request_id = str(uuid.uuid4())
+        self.progress_tracker.add_listener(request_id, progress_callback)
+        try:
+            with deadline_scope(timeout):
+                flight_id, flight = self._join_flight(
+                    url, enhance_genres, enhance_image, ignore_cache
+                )
+                result = await self._follow_flight(request_id, flight_id, flight)
+            return result.model_copy(update={"request_id": request_id}, deep=True)
+        finally:
+            self.progress_tracker.remove_listener(request_id, progress_callback)
+
+    def _join_flight(
+        self,
+        url: HttpUrl,
+        enhance_genres: bool,
+        enhance_image: bool,
+        ignore_cache: bool,
+    ) -> tuple[str, asyncio.Task[ImportResult]]:
+        """Get the in-flight import for a URL, starting one if needed."""
+        key = (
+            self.url_analyzer.normalize(str(url)),
+            enhance_genres,
+            enhance_image,
+            ignore_cache,
+        )
+        if key in self._in_flight:
+            logger.info(f"Joining in-flight import for {url}")
+            return self._in_flight[key]
+
+        flight_id = str(uuid.uuid4())
+        flight = asyncio.create_task(
+            self._run_import(
+                url, flight_id, enhance_genres, enhance_image, ignore_cache
+            )
+        )
+        self._in_flight[key] = (flight_id, flight)
+
+        def _finish(task: asyncio.Task[ImportResult]) -> None:
+            self._in_flight.pop(key, None)
+            self.progress_tracker.clear(flight_id)
+            # Mark the exception retrieved in case every caller went away
+            if not task.cancelled():
+                task.exception()
+
+        flight.add_done_callback(_finish)
+        return flight_id, flight
+
+    async def _follow_flight(
+        self,
+        request_id: str,
+        flight_id: str,
+        flight: asyncio.Task[ImportResult],
+    ) -> ImportResult:
+        """Await a shared import, re-sending its progress under request_id."""
+        # Late joiners replay the history first; the lock keeps live updates
+        # from overtaking the replay
+        lock = asyncio.Lock()
+
+        async def forward(progress: ImportProgress) -> None:
+            await self.progress_tracker.send_progress(
+                progress.model_copy(update={"request_id": request_id})
+            )
+
+        async def relay(progress: ImportProgress) -> None:
+            async with lock:
+                await forward(progress)
+
+        history = self.progress_tracker.get_history(flight_id)
+        self.progress_tracker.add_listener(flight_id, relay)
+        try:
+            async with lock:
+                for progress in history:
+                    await forward(progress)
+            return await self._await_flight(flight)
+        finally:
+            self.progress_tracker.remove_listener(flight_id, relay)
+
+    @staticmethod
+    async def _await_flight(flight: asyncio.Task[ImportResult]) -> ImportResult:
+        """Wait for a shared import for no longer than this caller's deadline."""
+        # Shield so one caller going away doesn't cancel the others
+        shielded = asyncio.shield(flight)
+        deadline = current_deadline()
+        flight_deadline = flight.get_context().run(current_deadline)
+        if deadline is None or (
+            flight_deadline is not None
+            and flight_deadline.expires_at <= deadline.expires_at
+        ):
+            # The flight stops by itself in time (and keeps partial results)
+            return await shielded
+        async with enforce_deadline():
+            return await shielded
+
+    async def _run_import(
+        self,
+        url: HttpUrl,
+        request_id: str,
+        enhance_genres: bool,
+        enhance_image: bool,
+        ignore_cache: bool,
+    ) -> ImportResult:
+        """Run a single import with its own stage timings and retry budget."""
+        recorder = SpanRecorder()
+        try:
+            with recorder.activate(), retry_budget_scope():
+                result = await self._run_import_stages(
+                    url, request_id, enhance_genres, enhance_image, ignore_cache
+                )
+            result.timings = list(recorder.spans)
+            return result
+        finally:
+            await self._store_timings(recorder.spans)
+
+    async def _store_timings(self, timings: list[StageTiming]) -> None:
+        """Persist stage timings for percentile statistics."""
+        if not timings:
+            return
+        try:
+            await run_db_write(save_stage_timings, timings)
+        except Exception:
+            # Losing a sample is fine; failing the import over it is not
+            logger.warning("Failed to store import stage timings", exc_info=True)
+
+    async def _run_import_stages(
+        self,
+        url: HttpUrl,
+        request_id: str,
+        enhance_genres: bool,
+        enhance_image: bool,
+        ignore_cache: bool,
+    ) -> ImportResult:
+        """Run a single import, reporting progress under request_id."""
         # Ensure URL is a string for internal use
         url_str = str(url)
-        request_id = str(uuid.uuid4())
         start_time = asyncio.get_event_loop().time()
         service_failures: list[ServiceFailure] = []
-        self.progress_tracker.add_listener(request_id, progress_callback)
 
         await self.send_progress(
             request_id,
@@ -210,25 +516,43 @@ class EventImporter:
         )
 
         try:
-            # 1. Select agent
-            agent = await self._select_agent(url_str, request_id)
-
-            # 2. Import event
-            event_data = await agent.import_event(url_str, request_id)
-            if not event_data:
-                raise Exception("The agent failed to import the event.")
+            # Steps 0-2 are cancelled at the deadline; enrichment cuts itself
+            # short and saving always runs, so an extracted event is kept
+            async with enforce_deadline():
+                # 0. Serve a fresh stored copy when we have one
+                if not ignore_cache:
+                    with span("import.cache_lookup"):
+                        cached = await self._get_cached_result(
+                            url, request_id, start_time
+                        )
+                    if cached:
+                        return cached
+
+                # 1. Select agent
+                with span("import.routing"):
+                    agent = await self._select_agent(url_str, request_id)
+
+                # 2. Import event (descriptions are generated as an enrichment stage)
+                event_data = await agent.import_event(
+                    url_str, request_id, with_descriptions=False
+                )
+                if not event_data:
+                    raise Exception("The agent failed to import the event.")
 
-            # 3. Post-processing (enhancements)
+            # 3. Post-processing (enrichment stages)
             event_data, enhancement_failures = await self.process_event(
-                event_data, request_id, enhance_genres, enhance_image
+                event_data, request_id, enhance_genres, enhance_image, agent=agent
             )
             service_failures.extend(enhancement_failures)
 
             # 4. Save to database
             try:
-                save_event(
-                    str(event_data.source_url), event_data.model_dump(mode="json")
-                )
+                with span("import.save"):
+                    await run_db_write(
+                        save_event,
+                        str(event_data.source_url),
+                        event_data.model_dump(mode="json"),
+                    )
             except Exception as db_error:
                 logger.exception(f"Failed to save event to database: {db_error}")
                 # Add database failure to service failures
@@ -273,58 +597,110 @@ class EventImporter:
                 error=str(e),
             )
             raise
-        finally:
-            self.progress_tracker.remove_listener(request_id, progress_callback)
 
-    def _get_agent_for_source(self, source: str) -> Agent:
-        """Get agent for a specific source."""
-        agents: dict[str, type[Agent]] = {
-            "dice.fm": Dice,
-            "ra.co": ResidentAdvisor,
-            "ticketmaster.com": Ticketmaster,
-        }
-        if agent_class := agents.get(source):
-            return agent_class(
+    async def _get_cached_result(
+        self, url: HttpUrl, request_id: str, start_time: float
+    ) -> ImportResult | None:
+        """Build a result from the database if the event is still fresh."""
+        url_str = str(url)
+        ttl = self.config.importer.cache_ttl.get(self.get_source_for_url(url_str), 0)
+        if ttl <= 0:
+            return None
+
+        try:
+            cached = await run_db(get_fresh_event, url_str, timedelta(seconds=ttl))
+            if not cached:
+                return None
+            cached.pop("_db_id", None)
+            event_data = EventData(**cached)
+        except Exception as e:
+            # A broken cache must never block a real import
+            logger.warning(f"Ignoring cached event for {url_str}: {e}")
+            return None
+
+        logger.info(f"Serving cached event for {url_str} (ttl {ttl}s)")
+        await self.send_progress(
+            request_id,
+            ImportStatus.SUCCESS,
+            "Loaded from cache",
+            1,
+            data=event_data,
+        )
+        return ImportResult(
+            request_id=request_id,
+            status=ImportStatus.SUCCESS,
+            url=url,
+            method_used=ImportMethod.CACHE,
+            event_data=event_data,
+            import_time=asyncio.get_event_loop().time() - start_time,
+        )
+
+    async def import_many(
+        self,
+        urls: list[str],
+        enhance_genres: bool = True,
+        enhance_image: bool = True,
+        concurrency: int | None = None,
+        summary: BatchImportSummary | None = None,
+        progress_callback: Callable[[ImportProgress], Awaitable[None]] | None = None,
+        ignore_cache: bool = False,
+        timeout: float | None = None,
+    ) -> AsyncIterator[ImportResult]:
+        """Import many URLs concurrently, yielding results as they finish.
+
+        Concurrency is bounded globally (``concurrency`` or the configured
+        ``batch_concurrency``) and per source bucket. Failed imports are yielded
+        as ``FAILED`` results rather than raised. Pass a ``summary`` to follow
+        totals and throughput while the batch runs. ``timeout`` applies to each
+        import separately, from the moment it gets its slots.
+        """
+        importer_config = self.config.importer
+        batch = BatchImporter(
+            self,
+            concurrency=concurrency or importer_config.batch_concurrency,
+            source_limits=importer_config.source_concurrency,
+            summary=summary,
+        )
+        async for result in batch.run(
+            urls,
+            enhance_genres=enhance_genres,
+            enhance_image=enhance_image,
+            progress_callback=progress_callback,
+            ignore_cache=ignore_cache,
+            timeout=timeout,
+        ):
+            yield result
+
+    def get_source_for_url(self, url: str) -> str:
+        """Get the concurrency bucket (source domain or web) for a URL."""
+        url_type = self.url_analyzer.analyze(url)["type"]
+        return self.url_analyzer.routing_table.source_for(url_type) or WEB_SOURCE
+
+    def _get_agent(self, agent_class: type[Agent]) -> Agent:
+        """Get the shared instance of an agent class, creating it on first use."""
+        if agent_class not in self._agents:
+            self._agents[agent_class] = agent_class(
                 self.config, self.progress_tracker.send_progress, self.services
             )
-        raise UnsupportedURLError(f"No agent available for source: {source}")
+        return self._agents[agent_class]
+
+    def _get_agent_for_url_type(self, url_type: str) -> Agent:
+        """Get the provider agent registered for a URL type."""
+        if agent_class := self.agent_registry.agent_for(url_type):
+            return self._get_agent(agent_class)
+        raise UnsupportedURLError(f"No agent available for URL type: {url_type}")
 
     def _get_agent_for_method(self, import_method: ImportMethod) -> Agent:
         """Get agent for a specific import method."""
-        if import_method == ImportMethod.IMAGE:
-            return Image(
-                self.config, self.progress_tracker.send_progress, self.services
-            )
-        if import_method == ImportMethod.WEB:
-            return Web(self.config, self.progress_tracker.send_progress, self.services)
+        if agent_class := METHOD_AGENTS.get(import_method):
+            return self._get_agent(agent_class)
         raise AgentNotFoundError(
             f"No agent found for import method: {import_method.value}"
         )
 
     async def _detect_import_method(self, url: str) -> ImportMethod | None:
-        """Detect import method by checking content-type via HEAD request."""
-        try:
-            http_service = self.get_service("http")
-            response = await http_service.head(url, service="URLAnalyzer")
-            content_type = response.headers.get("content-type", "").lower()
-
-            # Check if it's an image
-            if content_type.startswith(("image/", "application/octet-stream")):
-                logger.info(f"Detected image content-type: {content_type}")
-                return ImportMethod.IMAGE
-
-            # Default to web for HTML/text content
-            if "html" in content_type or "text" in content_type:
-                logger.info(f"Detected web content-type: {content_type}")
-                return ImportMethod.WEB
-
-            logger.info(f"Unknown content-type: {content_type}, defaulting to WEB")
-            return ImportMethod.WEB
-
-        except Exception as e:
-            logger.warning(f"Failed to detect content-type via HEAD request: {e}")
-            # Default to WEB if we can't determine
-            return ImportMethod.WEB
+        """Detect import method from the URL's extension or content type."""
+        return await self.content_probe.detect(url, self.get_service("http"))
 
     async def _select_agent(self, url: str, request_id: str) -> Agent:  # noqa: ARG002
         """Select the appropriate agent for the given URL."""
@@ -344,21 +720,15 @@ class EventImporter:
         agent = None
         if url_type and url_type != "unknown":
             try:
-                # Map URLType to domain for agent selection
-                source_mapping = {
-                    "resident_advisor": "ra.co",
-                    "ticketmaster": "ticketmaster.com",
-                    "dice": "dice.fm",
-                }
-                source = source_mapping.get(url_type, url_type)
-                agent = self._get_agent_for_source(source)
+                agent = self._get_agent_for_url_type(url_type)
                 logger.info(
-                    f"Selected agent '{agent.name}' for source '{source}'",
-                    extra={"agent": agent.name, "source": source},
+                    f"Selected agent '{agent.name}' for URL type '{url_type}'",
+                    extra={"agent": agent.name, "url_type": url_type},
                 )
             except UnsupportedURLError:
                 logger.warning(
-                    f"No specific agent for source '{source}', falling back to web agent."
+                    f"No specific agent for URL type '{url_type}', "
+                    "falling back to web agent."
                 )
                 agent = self._get_agent_for_method(ImportMethod.WEB)
         elif import_method:
@@ -401,9 +771,14 @@ class EventImporter:
         event_id: int,
         description_type: str,
         supplementary_context: str | None = None,
+        fresh: bool = False,
     ) -> DescriptionResult | None:
-        """Rebuild the description for a cached event."""
-        event_data_dict = get_event(event_id=event_id)
+        """Rebuild the description for a cached event.
+
+        With ``fresh`` the description is generated anew even if the LLM
+        response cache has an answer for the same prompt.
+        """
+        event_data_dict = await run_db(get_event, event_id=event_id)
         if not event_data_dict:
             return None
 
@@ -425,12 +800,13 @@ class EventImporter:
         if not provider:
             raise ValueError("No LLM provider available")
 
-        updated_event = await provider.generate_descriptions(
-            event_data,
-            needs_long=needs_long,
-            needs_short=needs_short,
-            supplementary_context=supplementary_context,
-        )
+        with fresh_llm_responses() if fresh else nullcontext():
+            updated_event = await provider.generate_descriptions(
+                event_data,
+                needs_long=needs_long,
+                needs_short=needs_short,
+                supplementary_context=supplementary_context,
+            )
 
         # Return just the descriptions
         return DescriptionResult(
@@ -442,9 +818,13 @@ class EventImporter:
         self,
         event_id: int,
         supplementary_context: str | None = None,
+        fresh: bool = False,
     ) -> tuple[GenreResult | None, list[ServiceFailure]]:
-        """Rebuild the genres for a cached event."""
-        event_data_dict = get_event(event_id=event_id)
+        """Rebuild the genres for a cached event.
+
+        With ``fresh`` cached LLM responses are not reused.
+        """
+        event_data_dict = await run_db(get_event, event_id=event_id)
         if not event_data_dict:
             return None, []
 
@@ -452,9 +832,10 @@ class EventImporter:
         genre_service: GenreService = self.get_service("genre")
         failures = []
         try:
-            enhanced_genres = await genre_service.enhance_genres(
-                event_data, supplementary_context=supplementary_context
-            )
+            with fresh_llm_responses() if fresh else nullcontext():
+                enhanced_genres = await genre_service.enhance_genres(
+                    event_data, supplementary_context=supplementary_context
+                )
             # Return just the genres
             return GenreResult(
                 original_genres=event_data.genres, enhanced_genres=enhanced_genres
@@ -471,7 +852,7 @@ class EventImporter:
         supplementary_context: str | None = None,
     ) -> tuple[ImageResult | None, list[ServiceFailure]]:
         """Rebuild the image for a cached event."""
-        event_data_dict = get_event(event_id=event_id)
+        event_data_dict = await run_db(get_event, event_id=event_id)
         if not event_data_dict:
             return None, []
 
@@ -496,7 +877,7 @@ class EventImporter:
         updates: dict[str, Any],
     ) -> EventData | None:
         """Update a cached event with new data."""
-        event_data_dict = get_event(event_id=event_id)
+        event_data_dict = await run_db(get_event, event_id=event_id)
         if not event_data_dict:
             return None
 
@@ -504,5 +885,9 @@ class EventImporter:
         merged_data = {**event_data_dict, **updates}
         # Create new EventData to ensure validation
         updated_event = EventData(**merged_data)
-        save_event(str(updated_event.source_url), updated_event.model_dump(mode="json"))
+        await run_db_write(
+            save_event,
+            str(updated_event.source_url),
+            updated_event.model_dump(mode="json"),
+        )
         return updated_event
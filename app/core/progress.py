@@ -81,3 +81,8 @@ class ProgressTracker:
     def get_history(self: "ProgressTracker", request_id: str) -> list[ImportProgress]:
         """Get progress history for a request."""
         return list(self._history.get(request_id, []))
+
+    def clear(self: "ProgressTracker", request_id: str) -> None:
+        """Forget listeners and history for a request."""
+        self._listeners.pop(request_id, None)
+        self._history.pop(request_id, None)
@@ -0,0 +1,100 @@
+"""Per-import retry budget.
+
+Retries nest: ``retry_on_error`` around an LLMService call re-runs the whole
+Claude-then-OpenAI fallback, and genre lookups add a retry layer of their own
+on top. Each layer is modest; together one logical call can fan out into
+several provider calls and exponential sleeps. The importer opens a budget
+for each import, and every retry and provider fallback below it draws from
+that one budget. Once it is spent the last error is raised instead of trying
+again. Outside an import retries are limited only by their own decorator.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from tenacity import RetryCallState
+
+from config.retry import get_retry_config
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[RetryBudget | None] = ContextVar("retry_budget", default=None)
+
+
+class RetryBudget:
+    """Retries and backoff sleep one import may still spend."""
+
+    def __init__(self: RetryBudget, max_retries: int, max_sleep: float) -> None:
+        """Start with nothing spent."""
+        self.max_retries = max_retries
+        self.max_sleep = max_sleep
+        self.retries = 0
+        self.slept = 0.0
+
+    def allows(self: RetryBudget, sleep: float = 0.0) -> bool:
+        """Whether one more retry after ``sleep`` seconds fits the budget."""
+        return self.retries < self.max_retries and self.slept + sleep <= self.max_sleep
+
+    def spend(self: RetryBudget, sleep: float = 0.0) -> None:
+        """Account for one retry and its sleep."""
+        self.retries += 1
+        self.slept += sleep
+
+
+def current_retry_budget() -> RetryBudget | None:
+    """The retry budget of the import running in this context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def retry_budget_scope(
+    max_retries: int | None = None, max_sleep: float | None = None
+) -> Iterator[RetryBudget]:
+    """Share one retry budget across everything run in this context.
+
+    Limits default to the retry config. A nested scope keeps drawing from the
+    enclosing budget.
+    """
+    budget = _current.get()
+    if budget is not None:
+        yield budget
+        return
+    retry_config = get_retry_config()
+    budget = RetryBudget(
+        max_retries if max_retries is not None else retry_config.budget_retries,
+        max_sleep if max_sleep is not None else retry_config.budget_sleep,
+    )
+    token = _current.set(budget)
+    try:
+        yield budget
+    finally:
+        _current.reset(token)
+
+
+def spend_retry(what: str, sleep: float = 0.0) -> bool:
+    """Draw one retry from the current budget; False once it is spent."""
+    budget = _current.get()
+    if budget is None:
+        return True
+    if not budget.allows(sleep):
+        logger.warning(
+            f"Retry budget spent ({budget.retries} retries, {budget.slept:.1f}s "
+            f"backoff); not retrying {what}"
+        )
+        return False
+    budget.spend(sleep)
+    return True
+
+
+def retry_budget_exhausted(retry_state: RetryCallState) -> bool:
+    """Tenacity stop condition: draws the retry about to happen, if allowed.
+
+    Must come last in ``stop_any`` so nothing is spent on a retry another
+    condition stops anyway.
+    """
+    name = getattr(retry_state.fn, "__name__", "call")
+    return not spend_retry(name, retry_state.upcoming_sleep)
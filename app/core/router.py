@@ -7,7 +7,13 @@ import logging
 from typing import Any
 
 from app.core.importer import EventImporter
-from app.core.schemas import ImportRequest, ImportStatus
+from app.core.schemas import (
+    BatchImportRequest,
+    BatchImportSummary,
+    ImportRequest,
+    ImportResult,
+    ImportStatus,
+)
 from config import config
 
 logger = logging.getLogger(__name__)
@@ -41,27 +47,14 @@ class Router:
             logger.info(f"Routing import request for: {request.url}")
 
             # Execute import
-            result = await self.importer.import_event(request.url)
+            result = await self.importer.import_event(
+                request.url,
+                ignore_cache=request.ignore_cache,
+                timeout=request.timeout,
+            )
 
             # Convert to response format
-            response = {
-                "success": result.status == ImportStatus.SUCCESS,
-                "method_used": result.method_used.value if result.method_used else None,
-                "import_time": result.import_time,
-            }
-
-            # Add service failures if any
-            if result.service_failures:
-                response["service_failures"] = [
-                    failure.model_dump() for failure in result.service_failures
-                ]
-
-            if result.status == ImportStatus.SUCCESS and result.event_data:
-                response["data"] = result.event_data.model_dump(mode="json")
-            else:
-                response["error"] = result.error or "Import failed"
-
-            return response
+            return self._format_result(result)
 
         except (ValueError, TypeError, KeyError) as e:
             logger.exception("Router error")
@@ -81,6 +74,72 @@ class Router:
                 "method_used": None,
             }
 
+    async def route_batch_request(
+        self: Router,
+        request_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Route a batch import request.
+
+        Args:
+            request_data: Raw request data with a list of URLs
+
+        Returns:
+            Response data with per-URL results (in completion order) and a
+            throughput summary
+
+        """
+        try:
+            request = BatchImportRequest(**request_data)
+        except (ValueError, TypeError, KeyError) as e:
+            logger.exception("Router error")
+            return {"success": False, "error": str(e)}
+
+        logger.info(f"Routing batch import request for {len(request.urls)} URLs")
+
+        summary = BatchImportSummary()
+        results = [
+            {"url": str(result.url), **self._format_result(result)}
+            async for result in self.importer.import_many(
+                [str(url) for url in request.urls],
+                concurrency=request.concurrency,
+                summary=summary,
+                ignore_cache=request.ignore_cache,
+                timeout=request.timeout,
+            )
+        ]
+
+        return {
+            "success": summary.failed == 0,
+            "results": results,
+            "summary": {
+                **summary.model_dump(),
+                "throughput": round(summary.throughput, 2),
+            },
+        }
+
+    @staticmethod
+    def _format_result(result: ImportResult) -> dict[str, Any]:
+        """Convert an ImportResult to the response format."""
+        response = {
+            "success": result.status == ImportStatus.SUCCESS,
+            "method_used": result.method_used.value if result.method_used else None,
+            "import_time": result.import_time,
+            "timings": [timing.model_dump() for timing in result.timings],
+        }
+
+        # Add service failures if any
+        if result.service_failures:
+            response["service_failures"] = [
+                failure.model_dump() for failure in result.service_failures
+            ]
+
+        if result.status == ImportStatus.SUCCESS and result.event_data:
+            response["data"] = result.event_data.model_dump(mode="json")
+        else:
+            response["error"] = result.error or "Import failed"
+
+        return response
+
     async def get_progress(self: Router, request_id: str) -> dict[str, Any]:
         """Get progress history for a request."""
         history = self.importer.progress_tracker.get_history(request_id)
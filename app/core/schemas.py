@@ -542,6 +542,39 @@ class ImportRequest(BaseModel):
     )
 
 
+class BatchImportRequest(BaseModel):
+    """Request to import many event URLs in one run."""
+
+    urls: list[HttpUrl] = Field(..., min_length=1)
+    concurrency: int | None = Field(default=None, ge=1, le=64)
+    timeout: int = Field(default=60, ge=1, le=300)
+    ignore_cache: bool = Field(
+        default=False,
+        description="Skip cache and force fresh import",
+    )
+
+
+class BatchImportSummary(BaseModel):
+    """Running totals and throughput for a batch import."""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = Field(default=0.0, ge=0.0)
+
+    @property
+    def completed(self: BatchImportSummary) -> int:
+        """Number of imports that have finished, successfully or not."""
+        return self.succeeded + self.failed
+
+    @property
+    def throughput(self: BatchImportSummary) -> float:
+        """Completed imports per minute."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.completed / self.elapsed * 60
+
+
 class ImportProgress(BaseModel):
     """Progress update for import request."""
 
@@ -567,6 +600,15 @@ class ServiceFailure(BaseModel):
     detail: str | None = None
 
 
+class StageTiming(BaseModel):
+    """How long one stage of an import took."""
+
+    stage: str
+    # Seconds since the import started
+    start: float = Field(ge=0.0)
+    duration: float = Field(ge=0.0)
+
+
 class ImportResult(BaseModel):
     """Final result of import request."""
 
@@ -580,6 +622,7 @@ class ImportResult(BaseModel):
     import_time: float = Field(default=0.0, ge=0.0)
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
     service_failures: list[ServiceFailure] = Field(default_factory=list)
+    timings: list[StageTiming] = Field(default_factory=list)
 
     def __bool__(self: ImportResult) -> bool:
         """Check if import was successful."""
@@ -0,0 +1,88 @@
+"""Per-stage timing of imports.
+
+The importer activates a SpanRecorder for each import; code anywhere below it
+(agents, services, child tasks) times its work with ``span`` or ``timed``
+without the recorder being passed around. Outside an import both are no-ops.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from app.core.schemas import StageTiming
+
+_current: ContextVar[SpanRecorder | None] = ContextVar("span_recorder", default=None)
+
+
+class SpanRecorder:
+    """Collects the stage timings of one import."""
+
+    def __init__(self: SpanRecorder) -> None:
+        """Start the import clock."""
+        self.started = time.perf_counter()
+        self.spans: list[StageTiming] = []
+
+    @contextmanager
+    def activate(self: SpanRecorder) -> Iterator[SpanRecorder]:
+        """Record spans from this context (and tasks started in it) here."""
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+    @contextmanager
+    def span(self: SpanRecorder, stage: str) -> Iterator[None]:
+        """Time a block as ``stage``, whether or not it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, start, time.perf_counter())
+
+    def record(self: SpanRecorder, stage: str, start: float, end: float) -> None:
+        """Add a stage timed elsewhere, from ``perf_counter`` readings."""
+        self.spans.append(
+            StageTiming(stage=stage, start=start - self.started, duration=end - start)
+        )
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Time a block as a stage of the current import, if one is recorded."""
+    recorder = _current.get()
+    if recorder is None:
+        yield
+        return
+    with recorder.span(stage):
+        yield
+
+
+def record_span(stage: str, start: float) -> None:
+    """Record a stage that began at ``start`` (perf_counter) and ends now.
+
+    For work whose timing is only worth keeping once it is over.
+    """
+    recorder = _current.get()
+    if recorder is not None:
+        recorder.record(stage, start, time.perf_counter())
+
+
+def timed[**P, T](
+    stage: str,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Decorate a coroutine function so each call is recorded as ``stage``."""
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            with span(stage):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from app.core.error_messages import AgentMessages
 from app.core.schemas import (
@@ -17,6 +18,9 @@ from app.core.schemas import (
     ImportProgress,
     ImportStatus,
 )
+from app.core.timing import span
+from app.extraction_agents.registry import URLRoute
+from app.services.llm.descriptions import fit_descriptions, get_description_stats
 from app.services.llm.service import LLMService
 from app.shared.constants.error_messages import (
     SERVICES_DICT_NOT_INITIALIZED,
@@ -28,12 +32,20 @@ from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Imports whose LLM extraction already wrote both descriptions; they are
+# fitted to the configured lengths locally rather than regenerated
+LOCALLY_FITTED_METHODS = frozenset({ImportMethod.WEB, ImportMethod.IMAGE})
+
 
 class BaseExtractionAgent(ABC):
     """Abstract base class for agents that extract event data."""
 
     state_mapping = US_STATE_MAPPING
 
+    # URLs this agent handles; agents without a route are picked by import
+    # method (web pages, images) rather than by URL
+    route: ClassVar[URLRoute | None] = None
+
     def __init__(
         self: BaseExtractionAgent,
         config: Config,
@@ -84,15 +96,24 @@ class BaseExtractionAgent(ABC):
     async def _perform_extraction(self, url: str, request_id: str) -> EventData | None:
         """Provider-specific logic for extracting event data."""
 
-    async def import_event(self, url: str, request_id: str) -> EventData | None:
-        """Template method for importing an event."""
+    async def import_event(
+        self, url: str, request_id: str, with_descriptions: bool = True
+    ) -> EventData | None:
+        """Template method for importing an event.
+
+        Pass ``with_descriptions=False`` when the caller generates descriptions
+        itself (the importer runs them as an enrichment stage).
+        """
         self.start_timer()
         try:
-            event_data = await self._perform_extraction(url, request_id)
+            with span(f"extraction.{self.name.lower()}"):
+                event_data = await self._perform_extraction(url, request_id)
             if not event_data:
                 raise Exception(f"{self.name} agent failed to extract event data.")
 
-            event_data = await self.enhance_descriptions(event_data, request_id)
+            if with_descriptions:
+                with span("extraction.descriptions"):
+                    event_data = await self.enhance_descriptions(event_data, request_id)
 
             await self.send_progress(
                 request_id,
@@ -162,12 +183,24 @@ class BaseExtractionAgent(ABC):
         self, event_data: EventData, request_id: str
     ) -> EventData:
         """
-        Enhance event descriptions using the LLM service if they are missing
-        or do not meet quality standards.
+        Bring event descriptions within the configured lengths.
+
+        Descriptions from web and image extraction are fitted locally first;
+        the LLM is asked to generate them only when they are missing or
+        cannot be fixed that way.
         """
         llm_service: LLMService = self.get_service("llm")
-        needs_long, needs_short = llm_service.needs_description_generation(event_data)
+        stats = get_description_stats()
+        stats.checked += 1
+        if self.import_method in LOCALLY_FITTED_METHODS and any(
+            llm_service.needs_description_generation(event_data)
+        ):
+            fitted = fit_descriptions(event_data, llm_service.config.processing)
+            if not any(llm_service.needs_description_generation(fitted)):
+                stats.fixed_locally += 1
+            event_data = fitted
 
+        needs_long, needs_short = llm_service.needs_description_generation(event_data)
         if not needs_long and not needs_short:
             return event_data
 
@@ -177,10 +210,15 @@ class BaseExtractionAgent(ABC):
             "Enhancing descriptions with LLM",
             0.85,
         )
+        stats.llm_calls += 1
+        start = time.perf_counter()
         try:
             return await llm_service.generate_descriptions(
                 event_data, force_rebuild=False
             )
         except Exception:
+            stats.llm_failures += 1
             logger.exception(AgentMessages.DESCRIPTION_GENERATION_FAILED)
             return event_data
+        finally:
+            stats.llm_latency += time.perf_counter() - start
@@ -16,7 +16,9 @@ from app.core.schemas import (
     ImportStatus,
 )
 from app.extraction_agents.base import BaseExtractionAgent
+from app.extraction_agents.registry import URLRoute
 from app.shared.http import HTTPService
+from app.shared.url_analyzer import URLType
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,15 @@ class Dice(BaseExtractionAgent):
     Agent for importing events from Dice.fm.
     """
 
+    # /event/{id}-{slug} or /event/{slug}; without an ID the agent searches the
+    # API by slug
+    route = URLRoute(
+        url_type=URLType.DICE,
+        source="dice.fm",
+        domains=("dice.fm",),
+        patterns=(r"/event/(?P<slug>(?P<event_id>[a-zA-Z0-9]{6,}(?=-))?[^/?]+)",),
+    )
+
     http: HTTPService
 
     def __init__(
@@ -49,7 +49,7 @@ class Image(BaseExtractionAgent):
         if not result:
             raise Exception("Invalid or inaccessible image")
 
-        image_data, mime_type = result
+        image_data, mime_type = result.data, result.mime_type
 
         await self.send_progress(
             request_id,
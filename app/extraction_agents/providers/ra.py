@@ -9,8 +9,9 @@ from dateutil import parser as date_parser
 
 from app.core.schemas import EventData, EventLocation, ImportMethod, ImportStatus
 from app.extraction_agents.base import BaseExtractionAgent
+from app.extraction_agents.registry import URLRoute
 from app.shared.http import HTTPService
-from app.shared.url_analyzer import URLAnalyzer
+from app.shared.url_analyzer import URLAnalyzer, URLType
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,14 @@ class ResidentAdvisor(BaseExtractionAgent):
     """Agent for importing events from Resident Advisor."""
 
     GRAPHQL_URL = "https://ra.co/graphql"
+
+    route = URLRoute(
+        url_type=URLType.RESIDENT_ADVISOR,
+        source="ra.co",
+        domains=("ra.co", "residentadvisor.net"),
+        patterns=(r"/events/(?P<event_id>\d+)",),
+    )
+
     http: HTTPService
 
     def __init__(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
@@ -16,6 +16,8 @@ from app.core.schemas import (
     ImportStatus,
 )
 from app.extraction_agents.base import BaseExtractionAgent
+from app.extraction_agents.registry import URLRoute
+from app.shared.url_analyzer import URLType
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,21 @@ logger = logging.getLogger(__name__)
 class Ticketmaster(BaseExtractionAgent):
     """Agent for importing events from Ticketmaster."""
 
+    # Event IDs are alphanumeric with dashes, e.g. /event/G5vYZ9v1AUf-G. URLs
+    # without one are still ours; the agent falls back to search.
+    route = URLRoute(
+        url_type=URLType.TICKETMASTER,
+        source="ticketmaster.com",
+        domains=(
+            "ticketmaster.com",
+            "livenation.com",
+            "frontgatetickets.com",
+            "ticketweb.com",
+        ),
+        patterns=(r"/event/(?P<event_id>[a-zA-Z0-9-]{16,})",),
+        require_match=False,
+    )
+
     @property
     def name(self) -> str:
         """Agent name."""
@@ -7,6 +7,7 @@ import re
 from typing import Any
 
 from bs4 import BeautifulSoup, Comment
+from pydantic import ValidationError
 
 from app.core.error_messages import AgentMessages
 from app.core.errors import SecurityPageError
@@ -16,23 +17,35 @@ from app.core.schemas import (
     ImportStatus,
 )
 from app.extraction_agents.base import BaseExtractionAgent
+from app.extraction_agents.structured_data import (
+    extract_structured_data,
+    get_structured_data_stats,
+    missing_fields,
+)
+from app.services.llm.prompts import EventPrompts
 from app.services.llm.service import LLMService
+from app.services.page_fetcher import PageFetcher
 from app.services.zyte import ZyteService
 from app.shared.timezone import get_timezone_from_location
 
 logger = logging.getLogger(__name__)
 
+# Page text sent when only a few fields are missing; a fraction of the HTML
+PAGE_TEXT_MAX_LENGTH = 20000
+
 
 class Web(BaseExtractionAgent):
     """Agent for importing events from a generic webpage."""
 
     llm: LLMService
     zyte: ZyteService
+    fetcher: PageFetcher
 
     def __init__(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
         super().__init__(*args, **kwargs)
         self.llm = self.get_service("llm")
         self.zyte = self.get_service("zyte")
+        self.fetcher = PageFetcher(self.config, self.get_service("http"), self.zyte)
 
     @property
     def name(self: Web) -> str:
@@ -79,7 +92,15 @@ class Web(BaseExtractionAgent):
         await self.send_progress(
             request_id, ImportStatus.RUNNING, "Fetching web page HTML", 0.1
         )
-        html = await self.zyte.fetch_html(url)
+        html = await self.fetcher.fetch_html(url)
+        stats = get_structured_data_stats()
+        stats.pages += 1
+        if structured := extract_structured_data(html, url):
+            event_data = await self._complete_structured_data(
+                structured, html, url, request_id
+            )
+            if event_data:
+                return self._fill_timezone(event_data)
         await self.send_progress(
             request_id, ImportStatus.RUNNING, "Cleaning HTML content", 0.2
         )
@@ -94,20 +115,85 @@ class Web(BaseExtractionAgent):
                 needs_long_description=True,
                 needs_short_description=True,
             )
-            if (
-                event_data
-                and event_data.time
-                and not event_data.time.timezone
-                and event_data.location
-            ):
-                event_data.time.timezone = get_timezone_from_location(
-                    event_data.location
-                )
-            return event_data
+            return self._fill_timezone(event_data)
         except Exception:
             logger.exception("Failed to extract from HTML using LLM")
             return None
 
+    async def _complete_structured_data(
+        self: Web,
+        event_data: EventData,
+        html: str,
+        url: str,
+        request_id: str,
+    ) -> EventData | None:
+        """Fill in the required fields a page's structured data lacks.
+
+        Complete structured data is used as is. Otherwise the LLM is asked
+        for the missing fields, from the page text, and any other details it
+        returns fill fields the structured data left empty; None means the
+        page goes through full extraction instead.
+        """
+        stats = get_structured_data_stats()
+        missing = missing_fields(event_data)
+        if not missing:
+            stats.bypassed += 1
+            logger.info(f"Using structured data from {url}, skipping LLM extraction")
+            return event_data
+
+        await self.send_progress(
+            request_id,
+            ImportStatus.RUNNING,
+            f"Extracting {', '.join(missing)} missing from structured data",
+            0.3,
+        )
+        prompt = EventPrompts.build_missing_fields_prompt(
+            self._page_text(html), url, event_data, missing
+        )
+        try:
+            result = await self.llm.extract_event_data(prompt)
+        except Exception:
+            logger.exception("Failed to extract missing fields using LLM")
+            return None
+        if not result:
+            return None
+
+        # Required fields, and whatever else the structured data left empty
+        known = event_data.model_dump(exclude_none=True)
+        updates = {
+            field: value
+            for field, value in result.items()
+            if field in EventData.model_fields
+            and value
+            and (field in missing or not known.get(field))
+        }
+        try:
+            completed = EventData.model_validate({**known, **updates})
+        except ValidationError:
+            logger.warning(f"Discarding invalid fields extracted for {url}")
+            return None
+        stats.partial += 1
+        return completed
+
+    def _page_text(self: Web, html: str) -> str:
+        """The visible text of a page, for prompts that need no markup."""
+        soup = BeautifulSoup(html, "html.parser")
+        for element in soup.find_all(["script", "style", "noscript", "svg"]):
+            element.decompose()
+        text = re.sub(r"\s+", " ", soup.get_text(" ")).strip()
+        return text[:PAGE_TEXT_MAX_LENGTH]
+
+    def _fill_timezone(self: Web, event_data: EventData | None) -> EventData | None:
+        """Derive a missing timezone from the event's location."""
+        if (
+            event_data
+            and event_data.time
+            and not event_data.time.timezone
+            and event_data.location
+        ):
+            event_data.time.timezone = get_timezone_from_location(event_data.location)
+        return event_data
+
     async def _try_screenshot_extraction(
         self: Web,
         url: str,
@@ -129,16 +215,7 @@ class Web(BaseExtractionAgent):
                 needs_long_description=True,
                 needs_short_description=True,
             )
-            if (
-                event_data
-                and event_data.time
-                and not event_data.time.timezone
-                and event_data.location
-            ):
-                event_data.time.timezone = get_timezone_from_location(
-                    event_data.location
-                )
-            return event_data
+            return self._fill_timezone(event_data)
         except Exception:
             logger.exception("Failed to extract from screenshot using LLM")
             return None
@@ -0,0 +1,174 @@
+"""Extraction agent registry and the URL routing table compiled from it.
+
+Provider agents declare which URLs they handle with a ``route`` class
+attribute and are registered under the ``app.extraction_agents`` entry point
+group, so a new provider only needs an entry point to be routed to.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import re
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cache
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from app.extraction_agents.base import BaseExtractionAgent
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "app.extraction_agents"
+
+# Always registered; entry points add agents or replace these by name
+BUILTIN_AGENTS = {
+    "resident_advisor": "app.extraction_agents.providers.ra:ResidentAdvisor",
+    "ticketmaster": "app.extraction_agents.providers.ticketmaster:Ticketmaster",
+    "dice": "app.extraction_agents.providers.dice:Dice",
+}
+
+UNKNOWN_URL_TYPE = "unknown"
+
+
+@dataclass(frozen=True)
+class URLRoute:
+    """The URLs a provider agent handles.
+
+    ``domains`` match the host or any subdomain of it. ``patterns`` are
+    searched in the URL path in order; their named groups (``event_id``,
+    ``slug``) are returned with the classification.
+    """
+
+    url_type: str
+    # Concurrency and cache bucket, see ImporterConfig
+    source: str
+    domains: tuple[str, ...]
+    patterns: tuple[str, ...] = ()
+    # Whether a URL on one of the domains must match a pattern to be routed
+    require_match: bool = True
+
+
+class RoutingTable:
+    """Routes compiled into a domain suffix map with precompiled patterns."""
+
+    def __init__(self: RoutingTable, routes: Iterable[URLRoute]) -> None:
+        """Compile routes; earlier routes win when they claim the same URL."""
+        self.routes: dict[str, URLRoute] = {}
+        self._by_domain: dict[str, list[tuple[URLRoute, list[re.Pattern[str]]]]] = {}
+        for route in routes:
+            if route.url_type in self.routes:
+                raise ValueError(f"Duplicate route for URL type: {route.url_type}")
+            self.routes[route.url_type] = route
+            compiled = [re.compile(pattern) for pattern in route.patterns]
+            for domain in route.domains:
+                self._by_domain.setdefault(domain.lower(), []).append((route, compiled))
+
+    def classify(self: RoutingTable, url: str) -> dict[str, Any]:
+        """Classify a URL, returning its 'type' and any extracted metadata."""
+        if not url.lower().startswith(("http://", "https://")):
+            url = "https://" + url
+
+        parsed = urlsplit(url)
+        host = (parsed.hostname or "").removeprefix("www.")
+        for candidate in self._domain_suffixes(host):
+            for route, patterns in self._by_domain.get(candidate, ()):
+                if result := self._match(route, patterns, parsed.path):
+                    return result
+        return {"type": UNKNOWN_URL_TYPE}
+
+    def classify_many(self: RoutingTable, urls: Iterable[str]) -> list[dict[str, Any]]:
+        """Classify a list of URLs, preserving order."""
+        classify = self.classify
+        return [classify(url) for url in urls]
+
+    def source_for(self: RoutingTable, url_type: str) -> str | None:
+        """Get the source bucket for a URL type, if it has a route."""
+        route = self.routes.get(url_type)
+        return route.source if route else None
+
+    @staticmethod
+    def _domain_suffixes(host: str) -> list[str]:
+        """The host and each parent domain, most specific first."""
+        labels = host.split(".")
+        return [".".join(labels[i:]) for i in range(len(labels))]
+
+    @staticmethod
+    def _match(
+        route: URLRoute, patterns: list[re.Pattern[str]], path: str
+    ) -> dict[str, Any] | None:
+        for pattern in patterns:
+            if match := pattern.search(path):
+                groups = {k: v for k, v in match.groupdict().items() if v is not None}
+                return {"type": route.url_type, **groups}
+        if route.require_match:
+            return None
+        return {"type": route.url_type}
+
+
+class AgentRegistry:
+    """Provider agent classes keyed by the URL type they route."""
+
+    def __init__(
+        self: AgentRegistry, agents: Iterable[type[BaseExtractionAgent]]
+    ) -> None:
+        """Register agents and compile their routes."""
+        self.agents: dict[str, type[BaseExtractionAgent]] = {}
+        routes = []
+        for agent_class in agents:
+            route = agent_class.route
+            if route is None:
+                logger.warning(f"Agent {agent_class.__name__} has no route, skipping")
+                continue
+            self.agents[route.url_type] = agent_class
+            routes.append(route)
+        self.routing_table = RoutingTable(routes)
+
+    def agent_for(
+        self: AgentRegistry, url_type: str
+    ) -> type[BaseExtractionAgent] | None:
+        """Get the agent class for a URL type."""
+        return self.agents.get(url_type)
+
+
+@cache
+def get_agent_registry() -> AgentRegistry:
+    """Discover provider agents once and build the registry.
+
+    The built-in agents are always loaded; agents registered under the
+    entry point group add to them or, under the same name, replace them.
+    """
+    agents = _load_builtin_agents()
+    # Packaged apps don't ship entry point metadata
+    if not getattr(sys, "frozen", False):
+        agents.update(_discover_from_entry_points())
+    return AgentRegistry(agents.values())
+
+
+def _discover_from_entry_points() -> dict[str, type[BaseExtractionAgent]]:
+    """Discover agents from entry points; one broken plugin skips only itself."""
+    agents = {}
+
+    try:
+        for ep in entry_points(group=ENTRY_POINT_GROUP):
+            try:
+                agents[ep.name] = ep.load()
+            except Exception:
+                logger.exception(f"Failed to load extraction agent {ep.name}")
+    except Exception:
+        logger.exception("Error discovering extraction agents")
+
+    return agents
+
+
+def _load_builtin_agents() -> dict[str, type[BaseExtractionAgent]]:
+    """Load the agents shipped with the app."""
+    agents = {}
+    for name, target in BUILTIN_AGENTS.items():
+        module_name, _, attr = target.partition(":")
+        agents[name] = getattr(importlib.import_module(module_name), attr)
+    return agents
@@ -0,0 +1,312 @@
+"""Structured event data embedded in web pages.
+
+Venue and ticketing pages often describe their event as schema.org ``Event``
+data, as JSON-LD or microdata, and almost all of them carry OpenGraph tags.
+extract_structured_data() reads those into EventData before the page is
+cleaned for the LLM (cleaning drops the ``script`` tags JSON-LD lives in).
+Only pages with a schema.org Event take this path; OpenGraph tags just fill
+its gaps. When the required fields are all present the web agent skips the
+LLM; when some are missing they are asked for with a much smaller prompt.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cache
+from typing import Any
+
+from bs4 import BeautifulSoup, Tag
+from pydantic import ValidationError
+
+from app.core.schemas import EventData
+from app.shared.timezone import get_timezone_from_offset
+
+logger = logging.getLogger(__name__)
+
+# Fields an import needs before it can do without the LLM; an event also needs
+# a lineup or a description (see EventData.is_complete)
+REQUIRED_FIELDS = ("venue", "date", "time")
+
+# Event subtypes that don't end in "Event"
+_OTHER_EVENT_TYPES = {"Festival"}
+
+_MICRODATA_EVENT = re.compile(r"schema\.org/(\w*Event|Festival)$")
+
+
+def _types(node: dict[str, Any]) -> list[str]:
+    """The schema.org types of a node, without their URL prefix."""
+    types = node.get("@type", [])
+    if isinstance(types, str):
+        types = [types]
+    return [str(t).rsplit("/", 1)[-1] for t in types]
+
+
+def _is_event(node: dict[str, Any]) -> bool:
+    return any(t.endswith("Event") or t in _OTHER_EVENT_TYPES for t in _types(node))
+
+
+def _find_events(data: Any) -> Iterator[dict[str, Any]]:  # noqa: ANN401
+    """Event nodes in a JSON-LD document, including inside @graph."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _find_events(item)
+    elif isinstance(data, dict):
+        if _is_event(data):
+            yield data
+        elif "@graph" in data:
+            yield from _find_events(data["@graph"])
+
+
+def _json_ld_events(soup: BeautifulSoup) -> list[dict[str, Any]]:
+    events = []
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            events.extend(_find_events(json.loads(script.string or "")))
+        except ValueError:
+            logger.debug("Skipping malformed JSON-LD block")
+    return events
+
+
+def _microdata_value(element: Tag) -> Any:  # noqa: ANN401
+    """The value of one microdata property."""
+    if element.has_attr("itemscope"):
+        return _microdata_item(element)
+    for attribute in ("content", "datetime", "href", "src"):
+        if element.has_attr(attribute):
+            return element[attribute]
+    return element.get_text(" ", strip=True)
+
+
+def _microdata_item(scope: Tag) -> dict[str, Any]:
+    """A microdata item as the JSON-LD node it corresponds to."""
+    item: dict[str, Any] = {"@type": scope.get("itemtype", "")}
+    for element in scope.find_all(itemprop=True):
+        if element.find_parent(itemscope=True) is not scope:
+            continue
+        value = _microdata_value(element)
+        for name in element["itemprop"].split():
+            if name in item:
+                existing = item[name]
+                item[name] = [
+                    *(existing if isinstance(existing, list) else [existing]),
+                    value,
+                ]
+            else:
+                item[name] = value
+    return item
+
+
+def _microdata_events(soup: BeautifulSoup) -> list[dict[str, Any]]:
+    return [
+        _microdata_item(scope)
+        for scope in soup.find_all(itemscope=True, itemtype=_MICRODATA_EVENT)
+    ]
+
+
+def _first(value: Any) -> Any:  # noqa: ANN401
+    """The first of a list value, or the value itself."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _name(value: Any) -> str | None:  # noqa: ANN401
+    """The name of a Thing, which may be given as plain text."""
+    if isinstance(value, dict):
+        value = value.get("name")
+    return str(value).strip() if value else None
+
+
+def _names(value: Any) -> list[str]:  # noqa: ANN401
+    values = value if isinstance(value, list) else [value]
+    return [name for name in map(_name, values) if name]
+
+
+def _image(value: Any) -> str | None:  # noqa: ANN401
+    value = _first(value)
+    if isinstance(value, dict):
+        value = value.get("url") or value.get("contentUrl")
+    return str(value) if value else None
+
+
+def _location(place: Any) -> dict[str, Any] | None:  # noqa: ANN401
+    """An EventLocation dict from a Place."""
+    if not isinstance(place, dict):
+        return None
+    address = place.get("address")
+    if isinstance(address, str):
+        location = {"address": address}
+    elif isinstance(address, dict):
+        location = {
+            "address": address.get("streetAddress"),
+            "city": address.get("addressLocality"),
+            "state": address.get("addressRegion"),
+            "country": _name(address.get("addressCountry")),
+        }
+    else:
+        location = {}
+    geo = place.get("geo")
+    if isinstance(geo, dict) and geo.get("latitude") and geo.get("longitude"):
+        location["coordinates"] = {"lat": geo["latitude"], "lng": geo["longitude"]}
+    location = {key: value for key, value in location.items() if value}
+    return location or None
+
+
+def _offer_fields(offers: Any) -> dict[str, Any]:  # noqa: ANN401
+    offer = _first(offers)
+    if not isinstance(offer, dict):
+        return {}
+    fields = {"ticket_url": offer.get("url")}
+    price = offer.get("price", offer.get("lowPrice"))
+    if price not in (None, ""):
+        fields["cost"] = f"{price} {offer.get('priceCurrency', '')}".strip()
+    return fields
+
+
+def _timezone(start: str, location: dict[str, Any] | None) -> str | None:
+    """The timezone of an ISO 8601 start time that states its UTC offset."""
+    try:
+        return get_timezone_from_offset(datetime.fromisoformat(start), location)
+    except ValueError:
+        return None
+
+
+def _event_fields(node: dict[str, Any]) -> dict[str, Any]:
+    """EventData fields from a schema.org Event node."""
+    start = str(_first(node.get("startDate")) or "")
+    end = str(_first(node.get("endDate")) or "")
+    place = _first(node.get("location"))
+    location = _location(place)
+    fields = {
+        "title": _name(node),
+        "long_description": _first(node.get("description")),
+        "date": start.split("T")[0] or None,
+        "end_date": end.split("T")[0] or None,
+        "time": (
+            {
+                "start": start,
+                "end": end if "T" in end else None,
+                "timezone": _timezone(start, location),
+            }
+            if "T" in start
+            else None
+        ),
+        "venue": _name(place),
+        "location": location,
+        "lineup": _names(node.get("performer")),
+        "promoters": _names(node.get("organizer")),
+        "minimum_age": _first(node.get("typicalAgeRange")),
+        **_offer_fields(node.get("offers")),
+    }
+    if image := _image(node.get("image")):
+        fields["images"] = {"full": image, "thumbnail": image}
+    return fields
+
+
+def _opengraph_fields(soup: BeautifulSoup) -> dict[str, Any]:
+    """EventData fields from OpenGraph tags."""
+    tags = {
+        tag["property"]: tag.get("content")
+        for tag in soup.find_all("meta", property=re.compile(r"^og:"))
+    }
+    fields = {
+        "title": tags.get("og:title"),
+        "long_description": tags.get("og:description"),
+    }
+    if image := tags.get("og:image"):
+        fields["images"] = {"full": image, "thumbnail": image}
+    return fields
+
+
+def _page_event(events: list[dict[str, Any]], url: str) -> dict[str, Any] | None:
+    """The event a page is about; listing pages describe several."""
+    if len(events) == 1:
+        return events[0]
+    for event in events:
+        if str(event.get("url", "")).rstrip("/") == url.rstrip("/"):
+            return event
+    return None
+
+
+def extract_structured_data(html: str, url: str) -> EventData | None:
+    """Event data from a page's JSON-LD, microdata and OpenGraph tags.
+
+    Sources are merged in that order, each filling only what the previous
+    ones left empty. Returns None unless the page describes a schema.org
+    Event with a title; OpenGraph tags alone say too little about an event
+    and only fill gaps.
+    """
+    try:
+        soup = BeautifulSoup(html, "html.parser")
+    except Exception:
+        logger.debug("Could not parse page for structured data", exc_info=True)
+        return None
+
+    events = [
+        event
+        for event in (
+            _page_event(_json_ld_events(soup), url),
+            _page_event(_microdata_events(soup), url),
+        )
+        if event
+    ]
+    if not events:
+        return None
+
+    fields: dict[str, Any] = {}
+    for event in events:
+        for key, value in _event_fields(event).items():
+            if not fields.get(key):
+                fields[key] = value
+    for key, value in _opengraph_fields(soup).items():
+        if not fields.get(key):
+            fields[key] = value
+
+    fields = {key: value for key, value in fields.items() if value}
+    if not fields.get("title"):
+        return None
+    try:
+        return EventData(**fields, source_url=url)
+    except ValidationError:
+        logger.debug("Structured data did not validate", exc_info=True)
+        return None
+
+
+def missing_fields(event_data: EventData) -> list[str]:
+    """Required fields the structured data did not provide."""
+    missing = [field for field in REQUIRED_FIELDS if not getattr(event_data, field)]
+    if not (event_data.lineup or event_data.long_description):
+        missing.append("lineup")
+    return missing
+
+
+@dataclass
+class StructuredDataStats:
+    """How often structured data let web imports skip or shrink the LLM call."""
+
+    pages: int = 0
+    bypassed: int = 0
+    partial: int = 0
+
+    def snapshot(self: StructuredDataStats) -> dict[str, Any]:
+        """Counts and the share of pages imported without the LLM."""
+        return {
+            "pages": self.pages,
+            "bypassed": self.bypassed,
+            "partial": self.partial,
+            "full_llm": self.pages - self.bypassed - self.partial,
+            "bypass_rate": (
+                round(self.bypassed / self.pages, 3) if self.pages else None
+            ),
+        }
+
+
+@cache
+def get_structured_data_stats() -> StructuredDataStats:
+    """The process-wide structured data statistics."""
+    return StructuredDataStats()
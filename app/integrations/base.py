@@ -10,7 +10,7 @@ from typing import Any, final
 from sqlalchemy.orm import Session
 
 from app.core.errors import handle_errors_async
-from app.shared.database.connection import get_db_session
+from app.shared.database.connection import get_db_session, run_db, run_db_write
 from app.shared.database.models import Event, Submission
 
 logger = logging.getLogger(__name__)
@@ -227,35 +227,48 @@ class BaseSubmitter(ABC):
             error_payload["submission_id"] = submission_id
         return error_payload
 
-    async def _process_single_event(
-        self: BaseSubmitter, event_id: int, dry_run: bool
-    ) -> dict[str, Any]:
-        """Process a single event for submission."""
-        submission_id = None
-        source_url = None
+    def _prepare_submission(
+        self: BaseSubmitter, event_id: int
+    ) -> tuple[int, str, dict[str, Any]] | None:
+        """Load an event and its pending submission.
 
+        Returns (submission_id, source_url, scraped_data), or None if the event
+        does not exist.
+        """
         with get_db_session() as db:
             event = db.query(Event).get(event_id)
             if not event:
-                logger.warning(f"Event {event_id} not found, skipping.")
-                return {"type": "skip"}
-
-            source_url = event.source_url
+                return None
             submission = self._create_or_get_submission(event, db)
-            submission_id = submission.id
-            scraped_data = event.scraped_data
+            return submission.id, event.source_url, event.scraped_data
+
+    async def _process_single_event(
+        self: BaseSubmitter, event_id: int, dry_run: bool
+    ) -> dict[str, Any]:
+        """Process a single event for submission."""
+        prepared = await run_db_write(self._prepare_submission, event_id)
+        if not prepared:
+            logger.warning(f"Event {event_id} not found, skipping.")
+            return {"type": "skip"}
+        submission_id, source_url, scraped_data = prepared
 
         # Transform event data
         transformed_data = self.transformer.transform(scraped_data)
 
         if dry_run:
-            result = self._handle_dry_run(submission_id, event_id, source_url)
+            result = await run_db_write(
+                self._handle_dry_run, submission_id, event_id, source_url
+            )
             return {"type": "success", "data": result}
 
         # Submit to service
         response = await self.client.submit(transformed_data)
-        result = self._handle_submission_success(
-            submission_id, event_id, source_url, response
+        result = await run_db_write(
+            self._handle_submission_success,
+            submission_id,
+            event_id,
+            source_url,
+            response,
         )
         return {"type": "success", "data": result}
 
@@ -276,7 +289,7 @@ class BaseSubmitter(ABC):
 
         """
         selector = self._validate_selector(selector_name)
-        event_ids = self._fetch_events(selector, self.service_name)
+        event_ids = await run_db(self._fetch_events, selector, self.service_name)
 
         if not event_ids:
             logger.info(
@@ -305,7 +318,9 @@ class BaseSubmitter(ABC):
                 elif result["type"] == "skip":
                     continue
             except (ValueError, TypeError, KeyError) as e:
-                error_payload = self._handle_submission_error(None, event_id, None, e)
+                error_payload = await run_db_write(
+                    self._handle_submission_error, None, event_id, None, e
+                )
                 results["errors"].append(error_payload)
 
         return results
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 from sqlalchemy import func
 
 from app.integrations.ticketfairy.shared.submitter import TicketFairySubmitter
-from app.shared.database.connection import get_db_session, init_db
+from app.shared.database.connection import get_db_session, init_db, run_db
 from app.shared.database.models import Event, Submission
 
 
@@ -62,42 +62,47 @@ async def submit_by_url(request: URLSubmissionRequest) -> dict[str, Any]:
         ) from e
 
 
+def _submission_status() -> dict[str, Any]:
+    """Collect TicketFairy submission counts (blocking; run via run_db)"""
+    with get_db_session() as db:
+        # Get submission counts by status
+        status_counts = (
+            db.query(Submission.status, func.count(Submission.id))
+            .filter(Submission.service_name == "ticketfairy")
+            .group_by(Submission.status)
+            .all()
+        )
+
+        # Get total cached events
+        total_events = db.query(func.count(Event.id)).scalar()
+
+        # Get unsubmitted count
+        submitted_event_ids = (
+            db.query(Submission.event_id)
+            .filter(Submission.service_name == "ticketfairy")
+            .subquery()
+        )
+        unsubmitted_count = (
+            db.query(func.count(Event.id))
+            .filter(~Event.id.in_(submitted_event_ids))
+            .scalar()
+        )
+
+        status_breakdown = {status: count for status, count in status_counts}
+
+        return {
+            "service": "ticketfairy",
+            "total_events": total_events,
+            "unsubmitted": unsubmitted_count,
+            "status_breakdown": status_breakdown,
+        }
+
+
 @router.get("/status")
 async def get_status() -> dict[str, Any]:
     """Get TicketFairy submission status"""
     try:
-        with get_db_session() as db:
-            # Get submission counts by status
-            status_counts = (
-                db.query(Submission.status, func.count(Submission.id))
-                .filter(Submission.service_name == "ticketfairy")
-                .group_by(Submission.status)
-                .all()
-            )
-
-            # Get total cached events
-            total_events = db.query(func.count(Event.id)).scalar()
-
-            # Get unsubmitted count
-            submitted_event_ids = (
-                db.query(Submission.event_id)
-                .filter(Submission.service_name == "ticketfairy")
-                .subquery()
-            )
-            unsubmitted_count = (
-                db.query(func.count(Event.id))
-                .filter(~Event.id.in_(submitted_event_ids))
-                .scalar()
-            )
-
-            status_breakdown = {status: count for status, count in status_counts}
-
-            return {
-                "service": "ticketfairy",
-                "total_events": total_events,
-                "unsubmitted": unsubmitted_count,
-                "status_breakdown": status_breakdown,
-            }
+        return await run_db(_submission_status)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -23,6 +23,25 @@ class ImportEventRequest(BaseModel):
     ignore_cache: bool = Field(False, description="Skip cache and force fresh import")
 
 
+class BatchImportEventRequest(BaseModel):
+    """Request model for importing many events at once."""
+
+    urls: list[HttpUrl] = Field(
+        ...,
+        description="URLs of the event pages to import",
+        min_length=1,
+        max_length=1000,
+    )
+    concurrency: int | None = Field(
+        None,
+        description="Maximum concurrent imports (defaults to configured limit)",
+        ge=1,
+        le=64,
+    )
+    timeout: int = Field(60, description="Timeout in seconds", ge=1, le=300)
+    ignore_cache: bool = Field(False, description="Skip cache and force fresh import")
+
+
 class RebuildDescriptionRequest(BaseModel):
     """Request model for rebuilding event description."""
 
@@ -34,6 +53,10 @@ class RebuildDescriptionRequest(BaseModel):
         description="Additional context to help regenerate descriptions",
         max_length=1000,
     )
+    fresh: bool = Field(
+        False,
+        description="Generate anew instead of reusing a cached LLM response",
+    )
 
 
 class UpdateEventRequest(BaseModel):
@@ -159,6 +182,10 @@ class RebuildGenresRequest(BaseModel):
         description="Additional context to help identify genres (e.g., style, similar artists)",
         max_length=1000,
     )
+    fresh: bool = Field(
+        False,
+        description="Generate anew instead of reusing a cached LLM response",
+    )
 
 
 class RebuildImageRequest(BaseModel):
@@ -1,8 +1,10 @@
 """API response models."""
 
+from typing import Any
+
 from pydantic import BaseModel, Field
 
-from app.core.schemas import EventData, ImportProgress, ServiceFailure
+from app.core.schemas import EventData, ImportProgress, ServiceFailure, StageTiming
 
 
 class ImportEventResponse(BaseModel):
@@ -25,6 +27,38 @@ class ImportEventResponse(BaseModel):
     service_failure_summary: str | None = Field(
         None, description="Summary of service failures for display"
     )
+    timings: list[StageTiming] | None = Field(
+        None, description="How long each stage of the import took, in seconds"
+    )
+
+
+class BatchImportItem(ImportEventResponse):
+    """Result for a single URL in a batch import."""
+
+    url: str = Field(..., description="URL that was imported")
+
+
+class BatchImportSummaryResponse(BaseModel):
+    """Totals and throughput for a batch import."""
+
+    total: int = Field(..., description="Number of URLs submitted")
+    succeeded: int = Field(..., description="Number of successful imports")
+    failed: int = Field(..., description="Number of failed imports")
+    elapsed: float = Field(..., description="Wall-clock time in seconds")
+    throughput: float = Field(..., description="Completed imports per minute")
+
+
+class BatchImportEventResponse(BaseModel):
+    """Response model for batch event import."""
+
+    success: bool = Field(..., description="Whether every import succeeded")
+    results: list[BatchImportItem] = Field(
+        default_factory=list, description="Per-URL results in completion order"
+    )
+    summary: BatchImportSummaryResponse | None = Field(
+        None, description="Batch totals and throughput"
+    )
+    error: str | None = Field(None, description="Error message if the batch failed")
 
 
 class ProgressResponse(BaseModel):
@@ -43,6 +77,10 @@ class HealthResponse(BaseModel):
     integrations: list[str] = Field(
         default_factory=list, description="Enabled integrations"
     )
+    circuit_breakers: dict[str, dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Circuit breaker state and recent call statistics per service",
+    )
 
 
 class RebuildDescriptionResponse(BaseModel):
@@ -8,6 +8,7 @@ from fastapi import APIRouter, HTTPException
 from app.core.router import Router
 from app.core.schemas import EventData
 from app.interfaces.api.models.requests import (
+    BatchImportEventRequest,
     ImportEventRequest,
     RebuildDescriptionRequest,
     RebuildGenresRequest,
@@ -15,6 +16,7 @@ from app.interfaces.api.models.requests import (
     UpdateEventRequest,
 )
 from app.interfaces.api.models.responses import (
+    BatchImportEventResponse,
     ImportEventResponse,
     ProgressResponse,
     RebuildDescriptionResponse,
@@ -22,7 +24,7 @@ from app.interfaces.api.models.responses import (
     RebuildImageResponse,
     UpdateEventResponse,
 )
-from app.shared.database.connection import get_db_session
+from app.shared.database.connection import get_db_session, run_db
 from app.shared.database.models import Event
 from app.shared.service_errors import ServiceErrorFormatter
 
@@ -87,6 +89,43 @@ async def import_event(request: ImportEventRequest) -> ImportEventResponse:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.post("/import/batch", response_model=BatchImportEventResponse)
+async def import_events_batch(
+    request: BatchImportEventRequest,
+) -> BatchImportEventResponse:
+    """Import many events concurrently and report throughput."""
+    try:
+        request_data = {
+            "urls": [str(url) for url in request.urls],
+            "timeout": request.timeout,
+            "ignore_cache": request.ignore_cache,
+        }
+        if request.concurrency:
+            request_data["concurrency"] = request.concurrency
+
+        router_instance = get_router()
+        result = await router_instance.route_batch_request(request_data)
+
+        if "results" not in result:
+            raise HTTPException(
+                status_code=400, detail=result.get("error", "Batch import failed")
+            )
+
+        for item in result["results"]:
+            if item.get("service_failures"):
+                item.update(
+                    ServiceErrorFormatter.format_for_api(item["service_failures"])
+                )
+
+        return BatchImportEventResponse(**result)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Batch import error")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @router.get("/import/{request_id}/progress", response_model=ProgressResponse)
 async def get_import_progress(request_id: str) -> ProgressResponse:
     """Get progress for an import request."""
@@ -101,6 +140,48 @@ async def get_import_progress(request_id: str) -> ProgressResponse:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+def _query_events(limit: int, source: str | None, skip: int) -> dict[str, Any]:
+    """Query a page of events (blocking; run via run_db)."""
+    with get_db_session() as db:
+        query = db.query(Event)
+
+        # Filter by source domain if specified
+        if source:
+            query = query.filter(Event.source_url.like(f"%{source}%"))
+
+        # Get total count
+        total = query.count()
+
+        # Get paginated results
+        events = query.order_by(Event.scraped_at.desc()).offset(skip).limit(limit).all()
+
+        # Format results
+        results = []
+        for event in events:
+            data = event.scraped_data or {}
+            results.append(
+                {
+                    "id": event.id,
+                    "title": data.get("title", "Untitled Event"),
+                    "venue": data.get("venue"),
+                    "date": data.get("date"),
+                    "source_url": event.source_url,
+                    "scraped_at": event.scraped_at.isoformat()
+                    if event.scraped_at
+                    else None,
+                    "genres": data.get("genres", []),
+                    "lineup": data.get("lineup", []),
+                }
+            )
+
+        return {
+            "total": total,
+            "limit": limit,
+            "skip": skip,
+            "events": results,
+        }
+
+
 @router.get("")
 async def list_events(
     limit: int = 50,
@@ -110,88 +191,53 @@ async def list_events(
     """List events with optional filtering."""
 
     try:
-        with get_db_session() as db:
-            query = db.query(Event)
-
-            # Filter by source domain if specified
-            if source:
-                query = query.filter(Event.source_url.like(f"%{source}%"))
-
-            # Get total count
-            total = query.count()
-
-            # Get paginated results
-            events = (
-                query.order_by(Event.scraped_at.desc()).offset(skip).limit(limit).all()
-            )
-
-            # Format results
-            results = []
-            for event in events:
-                data = event.scraped_data or {}
-                results.append(
-                    {
-                        "id": event.id,
-                        "title": data.get("title", "Untitled Event"),
-                        "venue": data.get("venue"),
-                        "date": data.get("date"),
-                        "source_url": event.source_url,
-                        "scraped_at": event.scraped_at.isoformat()
-                        if event.scraped_at
-                        else None,
-                        "genres": data.get("genres", []),
-                        "lineup": data.get("lineup", []),
-                    }
-                )
-
-            return {
-                "total": total,
-                "limit": limit,
-                "skip": skip,
-                "events": results,
-            }
+        return await run_db(_query_events, limit, source, skip)
 
     except Exception as e:
         logger.exception("List events error")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+def _load_event_detail(event_id: int) -> dict[str, Any] | None:
+    """Load a single event's details (blocking; run via run_db)."""
+    with get_db_session() as db:
+        event = db.query(Event).filter(Event.id == event_id).first()
+
+        if not event:
+            return None
+
+        data = event.scraped_data or {}
+        return {
+            "id": event.id,
+            "title": data.get("title", "Untitled Event"),
+            "venue": data.get("venue"),
+            "date": data.get("date"),
+            "end_date": data.get("end_date"),
+            "time": data.get("time"),
+            "location": data.get("location"),
+            "lineup": data.get("lineup", []),
+            "genres": data.get("genres", []),
+            "short_description": data.get("short_description"),
+            "long_description": data.get("long_description"),
+            "images": data.get("images", {}),
+            "cost": data.get("cost"),
+            "ticket_url": data.get("ticket_url"),
+            "source_url": event.source_url,
+            "scraped_at": event.scraped_at.isoformat() if event.scraped_at else None,
+            "promoters": data.get("promoters", []),
+            "minimum_age": data.get("minimum_age"),
+        }
+
+
 @router.get("/{event_id}")
 async def get_event(event_id: int) -> dict[str, Any]:
     """Get a single event by ID."""
 
     try:
-        with get_db_session() as db:
-            event = db.query(Event).filter(Event.id == event_id).first()
-
-            if not event:
-                raise HTTPException(
-                    status_code=404, detail=f"Event {event_id} not found"
-                )
-
-            data = event.scraped_data or {}
-            return {
-                "id": event.id,
-                "title": data.get("title", "Untitled Event"),
-                "venue": data.get("venue"),
-                "date": data.get("date"),
-                "end_date": data.get("end_date"),
-                "time": data.get("time"),
-                "location": data.get("location"),
-                "lineup": data.get("lineup", []),
-                "genres": data.get("genres", []),
-                "short_description": data.get("short_description"),
-                "long_description": data.get("long_description"),
-                "images": data.get("images", {}),
-                "cost": data.get("cost"),
-                "ticket_url": data.get("ticket_url"),
-                "source_url": event.source_url,
-                "scraped_at": event.scraped_at.isoformat()
-                if event.scraped_at
-                else None,
-                "promoters": data.get("promoters", []),
-                "minimum_age": data.get("minimum_age"),
-            }
+        event = await run_db(_load_event_detail, event_id)
+        if not event:
+            raise HTTPException(status_code=404, detail=f"Event {event_id} not found")
+        return event
 
     except HTTPException:
         raise
@@ -200,6 +246,15 @@ async def get_event(event_id: int) -> dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+def _load_event_data(event_id: int) -> EventData | None:
+    """Load an event's stored data (blocking; run via run_db)."""
+    with get_db_session() as db:
+        event = db.query(Event).filter(Event.id == event_id).first()
+        if event and event.scraped_data:
+            return EventData(**event.scraped_data)
+        return None
+
+
 @router.post(
     "/{event_id}/rebuild/description", response_model=RebuildDescriptionResponse
 )
@@ -214,30 +269,25 @@ async def rebuild_event_description(
             event_id,
             description_type=request.description_type,
             supplementary_context=request.supplementary_context,
+            fresh=request.fresh,
         )
 
         if description_result:
             # Get the full event data to return
-            with get_db_session() as db:
-                event = db.query(Event).filter(Event.id == event_id).first()
-                if event and event.scraped_data:
-                    # Create EventData with updated descriptions
-                    event_data = EventData(**event.scraped_data)
-                    if description_result.short_description is not None:
-                        event_data.short_description = (
-                            description_result.short_description
-                        )
-                    if description_result.long_description is not None:
-                        event_data.long_description = (
-                            description_result.long_description
-                        )
-
-                    return RebuildDescriptionResponse(
-                        success=True,
-                        event_id=event_id,
-                        message=f"{request.description_type.capitalize()} description regenerated (preview only)",
-                        data=event_data,
-                    )
+            event_data = await run_db(_load_event_data, event_id)
+            if event_data:
+                # Apply the updated descriptions
+                if description_result.short_description is not None:
+                    event_data.short_description = description_result.short_description
+                if description_result.long_description is not None:
+                    event_data.long_description = description_result.long_description
+
+                return RebuildDescriptionResponse(
+                    success=True,
+                    event_id=event_id,
+                    message=f"{request.description_type.capitalize()} description regenerated (preview only)",
+                    data=event_data,
+                )
         raise HTTPException(
             status_code=404,
             detail=f"Event not found or failed to rebuild for ID: {event_id}",
@@ -301,6 +351,7 @@ async def rebuild_event_genres(
         genre_result, service_failures = await router_instance.importer.rebuild_genres(
             event_id,
             supplementary_context=request.supplementary_context,
+            fresh=request.fresh,
         )
 
         # Format service failures if any
@@ -314,21 +365,19 @@ async def rebuild_event_genres(
 
         if genre_result:
             # Get the full event data to return
-            with get_db_session() as db:
-                event = db.query(Event).filter(Event.id == event_id).first()
-                if event and event.scraped_data:
-                    # Create EventData with updated genres
-                    event_data = EventData(**event.scraped_data)
-                    event_data.genres = genre_result.genres
-
-                    return RebuildGenresResponse(
-                        success=True,
-                        event_id=event_id,
-                        message="Genres regenerated (preview only)",
-                        data=event_data,
-                        genres_found=genre_result.genres,
-                        **result,  # Include service failure info
-                    )
+            event_data = await run_db(_load_event_data, event_id)
+            if event_data:
+                # Apply the updated genres
+                event_data.genres = genre_result.genres
+
+                return RebuildGenresResponse(
+                    success=True,
+                    event_id=event_id,
+                    message="Genres regenerated (preview only)",
+                    data=event_data,
+                    genres_found=genre_result.genres,
+                    **result,  # Include service failure info
+                )
 
         # If no event data returned, include error info
         error_msg = f"Event not found or failed to rebuild genres for ID: {event_id}"
@@ -7,6 +7,7 @@ from fastapi import APIRouter
 from app import __version__
 from app.interfaces.api.models.responses import HealthResponse
 from app.services.integration_discovery import get_enabled_integrations
+from app.shared.circuit_breaker import get_circuit_breakers
 from config import config
 
 logger = logging.getLogger(__name__)
@@ -20,12 +21,17 @@ async def health_check() -> HealthResponse:
     try:
         features = config.get_enabled_features()
         integrations = get_enabled_integrations()
+        circuit_breakers = get_circuit_breakers().snapshot()
+        degraded = any(
+            breaker["state"] != "closed" for breaker in circuit_breakers.values()
+        )
 
         return HealthResponse(
-            status="healthy",
+            status="degraded" if degraded else "healthy",
             version=__version__,
             features=features,
             integrations=integrations,
+            circuit_breakers=circuit_breakers,
         )
     except (ValueError, TypeError, KeyError):
         logger.exception("Health check error")
@@ -1,7 +1,16 @@
+from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
+from app.extraction_agents.structured_data import get_structured_data_stats
+from app.services.llm.cache import get_llm_cache
+from app.services.llm.descriptions import get_description_stats
+from app.services.llm.usage import get_token_usage
+from app.shared.database.connection import run_db
+from app.shared.hedging import get_hedger
+from app.shared.http_cache import get_response_cache
+from app.shared.http_telemetry import get_connection_telemetry
 from app.shared.statistics import StatisticsService
 
 router = APIRouter(prefix="/api/v1/statistics", tags=["statistics"])
@@ -12,7 +21,7 @@ async def get_event_statistics() -> dict[str, Any]:
     """Get core event statistics without integration dependencies"""
     try:
         stats_service = StatisticsService()
-        return stats_service.get_event_statistics()
+        return await run_db(stats_service.get_event_statistics)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -25,7 +34,7 @@ async def get_submission_statistics() -> dict[str, Any]:
     """Get submission/integration statistics"""
     try:
         stats_service = StatisticsService()
-        return stats_service.get_submission_statistics()
+        return await run_db(stats_service.get_submission_statistics)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -38,7 +47,7 @@ async def get_combined_statistics() -> dict[str, Any]:
     """Get all statistics combined"""
     try:
         stats_service = StatisticsService()
-        return stats_service.get_combined_statistics()
+        return await run_db(stats_service.get_combined_statistics)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -57,7 +66,7 @@ async def get_event_trends(days: int | None = 7) -> dict[str, Any]:
 
     try:
         stats_service = StatisticsService()
-        return stats_service.get_event_trends(days or 7)
+        return await run_db(stats_service.get_event_trends, days or 7)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -65,12 +74,31 @@ async def get_event_trends(days: int | None = 7) -> dict[str, Any]:
         ) from e
 
 
+@router.get("/timings")
+async def get_stage_timings(days: int | None = 7) -> dict[str, Any]:
+    """Get per-stage import latency percentiles over the specified number of days"""
+    if days is not None and (days < 1 or days > 365):
+        raise HTTPException(
+            status_code=400,
+            detail="Days parameter must be between 1 and 365",
+        )
+
+    try:
+        stats_service = StatisticsService()
+        return await run_db(stats_service.get_stage_timings, days or 7)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve stage timings: {e!s}",
+        ) from e
+
+
 @router.get("/detailed")
 async def get_detailed_statistics() -> dict[str, Any]:
     """Get comprehensive statistics including trends"""
     try:
         stats_service = StatisticsService()
-        return stats_service.get_detailed_statistics()
+        return await run_db(stats_service.get_detailed_statistics)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -78,6 +106,40 @@ async def get_detailed_statistics() -> dict[str, Any]:
         ) from e
 
 
+@router.get("/connections")
+async def get_connection_statistics() -> dict[str, Any]:
+    """Get per-host connection timings, hedging savings and HTTP cache hits"""
+    cache = get_response_cache()
+    return {
+        "pools": get_connection_telemetry().snapshot(),
+        "hedging": get_hedger().snapshot(),
+        "response_cache": cache.stats() if cache else None,
+        "generated_at": datetime.now().isoformat(),
+    }
+
+
+@router.get("/llm-cache")
+async def get_llm_cache_statistics() -> dict[str, Any]:
+    """Get LLM response cache and prompt cache statistics per operation"""
+    cache = get_llm_cache()
+    return {
+        "enabled": cache is not None,
+        "operations": cache.stats() if cache else {},
+        "token_usage": get_token_usage().snapshot(),
+        "descriptions": get_description_stats().snapshot(),
+        "generated_at": datetime.now().isoformat(),
+    }
+
+
+@router.get("/structured-data")
+async def get_structured_data_statistics() -> dict[str, Any]:
+    """Get how many web imports used page structured data instead of the LLM"""
+    return {
+        **get_structured_data_stats().snapshot(),
+        "generated_at": datetime.now().isoformat(),
+    }
+
+
 @router.get("/health")
 async def statistics_health() -> dict[str, str]:
     """Health check for statistics service"""
@@ -1,6 +1,7 @@
 """CLI commands implementation."""
 
 import asyncio
+from pathlib import Path
 
 import click
 import clicycle
@@ -8,7 +9,7 @@ import clicycle
 from app import __version__
 from app.interfaces.api.server import run as api_run
 from app.interfaces.cli.events import event_details, list_events
-from app.interfaces.cli.import_event import run_import
+from app.interfaces.cli.import_event import run_batch_import, run_import
 from app.interfaces.cli.rebuild import (
     rebuild_description,
     rebuild_genres,
@@ -44,7 +45,20 @@ def rebuild():
 
 
 @events.command(name="import")
-@click.argument("url")
+@click.argument("url", required=False)
+@click.option(
+    "--file",
+    "-f",
+    "url_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Import every URL in a file (one per line)",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(1, 64),
+    help="Maximum concurrent imports when using --file",
+)
 @click.option(
     "--method",
     "-m",
@@ -55,9 +69,24 @@ def rebuild():
 @click.option("--ignore-cache", is_flag=True, help="Skip cache and force fresh import")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 def import_event_command(
-    url: str, method: str, timeout: int, ignore_cache: bool, verbose: bool
+    url: str | None,
+    url_file: Path | None,
+    concurrency: int | None,
+    method: str,
+    timeout: int,
+    ignore_cache: bool,
+    verbose: bool,
 ):
-    """Import an event from a URL."""
+    """Import an event from a URL, or many events from a file."""
+    if url and url_file:
+        raise click.UsageError("Pass either a URL or --file, not both")
+    if url_file:
+        if method:
+            raise click.UsageError("--method cannot be used with --file")
+        run_batch_import(url_file, concurrency, timeout, ignore_cache, verbose)
+        return
+    if not url:
+        raise click.UsageError("Missing URL (or use --file to import many)")
     run_import(url, method, timeout, ignore_cache, verbose)
 
 
@@ -91,9 +120,16 @@ def list_events_command(limit: int, source: str):
     "-c",
     help="Additional context to help regenerate the description",
 )
-def rebuild_description_command(event_id: int, description_type: str, context: str):
+@click.option(
+    "--fresh",
+    is_flag=True,
+    help="Generate anew instead of reusing a cached LLM response",
+)
+def rebuild_description_command(
+    event_id: int, description_type: str, context: str, fresh: bool
+):
     """Rebuild a description for an event (preview only)."""
-    rebuild_description(event_id, description_type, context)
+    rebuild_description(event_id, description_type, context, fresh=fresh)
 
 
 @rebuild.command(name="genres")
@@ -103,9 +139,14 @@ def rebuild_description_command(event_id: int, description_type: str, context: s
     "-c",
     help="Additional context to help identify genres (e.g., artist names if no lineup)",
 )
-def rebuild_genres_command(event_id: int, context: str):
+@click.option(
+    "--fresh",
+    is_flag=True,
+    help="Generate anew instead of reusing a cached LLM response",
+)
+def rebuild_genres_command(event_id: int, context: str, fresh: bool):
     """Rebuild genres for an event (preview only)."""
-    rebuild_genres(event_id, context)
+    rebuild_genres(event_id, context, fresh=fresh)
 
 
 @rebuild.command(name="image")
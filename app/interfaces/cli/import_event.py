@@ -2,11 +2,13 @@
 
 import asyncio
 import logging
+from pathlib import Path
 
 import click
 import clicycle
 
 from app.core.router import Router
+from app.core.schemas import BatchImportSummary, ImportResult, ImportStatus
 from app.shared.http import close_http_service
 from app.shared.service_errors import ServiceErrorFormatter
 
@@ -77,3 +79,72 @@ def run_import(url: str, method: str, timeout: int, ignore_cache: bool, verbose:
     except Exception as e:
         clicycle.error(f"Import failed: {e}")
         raise click.ClickException(str(e)) from e
+
+
+def _read_url_file(url_file: Path) -> list[str]:
+    """Read URLs from a file, skipping blank lines and # comments."""
+    with url_file.open() as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith("#")]
+
+
+def _display_batch_result(result: ImportResult, summary: BatchImportSummary) -> None:
+    """Display a single batch result as it arrives."""
+    position = f"[{summary.completed}/{summary.total}]"
+    if result.status == ImportStatus.SUCCESS and result.event_data:
+        clicycle.success(f"{position} {result.event_data.title} ({result.url})")
+    else:
+        clicycle.error(f"{position} {result.url}: {result.error or 'Import failed'}")
+
+
+async def _perform_batch_import(
+    urls: list[str], concurrency: int | None, timeout: int, ignore_cache: bool
+) -> BatchImportSummary:
+    """Import all URLs, reporting each result as it finishes.
+
+    ``timeout`` is the deadline of each import, not of the whole batch.
+    """
+    summary = BatchImportSummary()
+    router = Router()
+    try:
+        async for result in router.importer.import_many(
+            urls,
+            concurrency=concurrency,
+            summary=summary,
+            ignore_cache=ignore_cache,
+            timeout=timeout,
+        ):
+            _display_batch_result(result, summary)
+        return summary
+    finally:
+        await router.close()
+        await close_http_service()
+
+
+def run_batch_import(
+    url_file: Path,
+    concurrency: int | None,
+    timeout: int,
+    ignore_cache: bool,
+    verbose: bool,
+):
+    """Import every URL listed in a file."""
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    urls = _read_url_file(url_file)
+    if not urls:
+        raise click.ClickException(f"No URLs found in {url_file}")
+
+    clicycle.header(f"Importing {len(urls)} events")
+    summary = asyncio.run(
+        _perform_batch_import(urls, concurrency, timeout, ignore_cache)
+    )
+
+    clicycle.section("Summary")
+    clicycle.info(
+        f"Imported {summary.succeeded}/{summary.total} events "
+        f"in {summary.elapsed:.1f}s ({summary.throughput:.1f} imports/min)"
+    )
+    if summary.failed:
+        raise click.ClickException(f"{summary.failed} imports failed")
@@ -14,6 +14,7 @@ def rebuild_description(
     event_id: int,
     description_type: str,
     supplementary_context: str | None = None,
+    fresh: bool = False,
 ):
     """Rebuild description for an event."""
     clicycle.configure(app_name="event-importer")
@@ -24,6 +25,7 @@ def rebuild_description(
             event_id,
             description_type=description_type,
             supplementary_context=supplementary_context,
+            fresh=fresh,
         )
 
     try:
@@ -88,6 +90,7 @@ def _display_genre_rebuild_results(result, service_failures):
 def rebuild_genres(
     event_id: int,
     supplementary_context: str | None = None,
+    fresh: bool = False,
 ):
     """Rebuild genres for an event."""
     clicycle.configure(app_name="event-importer")
@@ -97,6 +100,7 @@ def rebuild_genres(
         return await importer.rebuild_genres(
             event_id,
             supplementary_context=supplementary_context,
+            fresh=fresh,
         )
 
     try:
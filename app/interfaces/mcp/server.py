@@ -18,7 +18,7 @@ from app.services.integration_discovery import (
     get_available_integrations,
     get_enabled_integrations,
 )
-from app.shared.database.connection import get_db_session, init_db
+from app.shared.database.connection import get_db_session, init_db, run_db
 from app.shared.database.models import Event
 from app.shared.http import close_http_service
 from app.shared.service_errors import ServiceErrorFormatter
@@ -645,6 +645,11 @@ class CoreMCPTools:
     @staticmethod
     async def handle_list_events(arguments: dict) -> dict:
         """Handle list_events tool call"""
+        return await run_db(CoreMCPTools._list_events, arguments)
+
+    @staticmethod
+    def _list_events(arguments: dict) -> dict:
+        """Run the list_events query (blocking; run via run_db)"""
         with get_db_session() as db:
             query = CoreMCPTools._build_list_events_query(db, arguments)
             events = query.all()
@@ -671,6 +676,11 @@ class CoreMCPTools:
     @staticmethod
     async def handle_show_event(arguments: dict) -> dict:
         """Handle show_event tool call"""
+        return await run_db(CoreMCPTools._show_event, arguments)
+
+    @staticmethod
+    def _show_event(arguments: dict) -> dict:
+        """Run the show_event query (blocking; run via run_db)"""
         event_id = arguments["event_id"]
 
         with get_db_session() as db:
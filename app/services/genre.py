@@ -8,6 +8,7 @@ from typing import Any
 from app.core.error_messages import ServiceMessages
 from app.core.errors import APIError, retry_on_error
 from app.core.schemas import EventData
+from app.core.timing import timed
 from app.services.llm.prompts import GenrePrompts
 from app.services.llm.service import LLMService
 from app.shared.data.genres import MusicGenres
@@ -197,6 +198,7 @@ class GenreService:
             logger.exception(f"{ServiceMessages.GENRE_SEARCH_FAILED} for {artist_name}")
             raise  # Re-raise to be handled by caller
 
+    @timed("genre.google_search")
     async def _google_search(self: "GenreService", query: str) -> list[dict[str, Any]]:
         """Execute Google search for artist information."""
         params = {
@@ -4,14 +4,15 @@ import html
 import logging
 import re
 from collections.abc import Awaitable, Callable
-from io import BytesIO
-from typing import Any
+from typing import Any, NamedTuple
 from urllib.parse import urlparse
 
 from PIL import Image, UnidentifiedImageError
 
 from app.core.errors import APIError, handle_errors_async
 from app.core.schemas import EventData, ImageCandidate, ImageResult, ImageSearchResult
+from app.core.timing import timed
+from app.shared.buffers import BufferReader
 from app.shared.http import HTTPService
 from config import Config
 
@@ -21,6 +22,15 @@ logger = logging.getLogger(__name__)
 ProgressCallback = Callable[[str, float], Awaitable[None]]
 
 
+class DownloadedImage(NamedTuple):
+    """A validated image and what was learned from its header."""
+
+    data: memoryview
+    mime_type: str
+    width: int
+    height: int
+
+
 class ImageService:
     """Service for image validation, rating, and search."""
 
@@ -59,6 +69,14 @@ class ImageService:
         """Initialize image service."""
         self.config = config
         self.http = http_service
+        # Image candidates come from arbitrary hosts; download them on a
+        # dedicated long-lived session instead of the shared API one
+        self.downloads = HTTPService(
+            config,
+            max_connections=config.http.image_max_connections,
+            max_connections_per_host=config.http.image_max_connections_per_host,
+            pool="images",
+        )
         self.google_enabled = bool(
             config.api.google_api_key and config.api.google_cse_id,
         )
@@ -84,10 +102,14 @@ class ImageService:
         url: str,
         max_size: int | None = None,
         http_service: HTTPService | None = None,
-    ) -> tuple[bytes, str] | None:
-        """Download and validate an image."""
+    ) -> DownloadedImage | None:
+        """Download and validate an image.
+
+        The image data is the download buffer itself; only the header is
+        read to check the dimensions.
+        """
         max_size = max_size or self.max_image_size
-        http = http_service or self.http
+        http = http_service or self.downloads
 
         # Download image data, disabling SSL verification for robustness
         image_data = await http.download(
@@ -99,23 +121,22 @@ class ImageService:
 
         # Validate with Pillow
         try:
-            with Image.open(BytesIO(image_data)) as img:
-                # Check dimensions
-                if (
-                    img.width < self.min_image_width
-                    or img.height < self.min_image_height
-                ):
-                    return None
-
-            # Get content-type from headers if possible, or guess from data
-            mime_type = "image/jpeg"  # Default, will be refined
-            return image_data, mime_type
-
+            with Image.open(BufferReader(image_data)) as img:
+                width, height = img.size
         except UnidentifiedImageError:
             logger.warning(f"Could not identify image from URL: {url}")
             return None
 
+        # Check dimensions
+        if width < self.min_image_width or height < self.min_image_height:
+            return None
+
+        # Get content-type from headers if possible, or guess from data
+        mime_type = "image/jpeg"  # Default, will be refined
+        return DownloadedImage(image_data, mime_type, width, height)
+
     @handle_errors_async(reraise=True)
+    @timed("image.rate")
     async def rate_image(self: "ImageService", url: str) -> ImageCandidate:
         """Rate an image based on various factors."""
         candidate = ImageCandidate(url=url)
@@ -130,45 +151,46 @@ class ImageService:
         score = 0
         reasons = []
 
-        # Use a dedicated HTTPService instance to avoid session closure issues
-        async with HTTPService(self.config) as http:
-            try:
-                # 1. Download and validate image
-                result = await self.validate_and_download(url, http_service=http)
-                if not result:
-                    candidate.reason = "Invalid or inaccessible image"
-                    candidate.score = 0
-                    return candidate
-
-                image_data, mime_type = result
-                with Image.open(BytesIO(image_data)) as img:
-                    candidate.dimensions = f"{img.width}x{img.height}"
-
-                # 2. Check for priority domains
-                if any(domain in parsed_url.netloc for domain in self.PRIORITY_DOMAINS):
-                    reasons.append("Priority domain")
-                    score += 20
-
-                # 3. Analyze image data (basic)
-                if len(image_data) > 100 * 1024:  # Over 100KB
-                    score += 30
-                    reasons.append("Good size")
-
-                # 4. Check content-type
-                if "jpeg" in mime_type:
-                    score += 10
-                    reasons.append("JPEG format")
-
-                # Final score calculation
-                candidate.score = max(0, 100 + score)
-                candidate.reason = ", ".join(reasons) if reasons else "OK"
-
-            except (ValueError, TypeError, KeyError) as e:
-                logger.warning(f"Rating failed for {url}: {e}")
+        try:
+            # 1. Download and validate image
+            result = await self.validate_and_download(url)
+            if not result:
+                candidate.reason = "Invalid or inaccessible image"
                 candidate.score = 0
-                candidate.reason = f"Rating error: {e}"
+                return candidate
 
-            return candidate
+            image_data, mime_type, width, height = result
+            candidate.dimensions = f"{width}x{height}"
+
+            # 2. Check for priority domains
+            if any(domain in parsed_url.netloc for domain in self.PRIORITY_DOMAINS):
+                reasons.append("Priority domain")
+                score += 20
+
+            # 3. Analyze image data (basic)
+            if len(image_data) > 100 * 1024:  # Over 100KB
+                score += 30
+                reasons.append("Good size")
+
+            # 4. Check content-type
+            if "jpeg" in mime_type:
+                score += 10
+                reasons.append("JPEG format")
+
+            # Final score calculation
+            candidate.score = max(0, 100 + score)
+            candidate.reason = ", ".join(reasons) if reasons else "OK"
+
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Rating failed for {url}: {e}")
+            candidate.score = 0
+            candidate.reason = f"Rating error: {e}"
+
+        return candidate
+
+    async def close(self: "ImageService") -> None:
+        """Close the image download session."""
+        await self.downloads.close()
 
     @handle_errors_async(reraise=True)
     async def enhance_event_image(
@@ -474,6 +496,7 @@ class ImageService:
         return queries
 
     @handle_errors_async(reraise=True)
+    @timed("image.google_search")
     async def _search_google_images(
         self: "ImageService",
         query: str,
@@ -5,9 +5,15 @@ from __future__ import annotations
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Buffer, Callable
 from typing import Any
 
+import httpx
+
+from app.core.deadline import current_deadline, time_left
 from app.core.schemas import EventData, EventTime
+from app.services.llm.cache import LLMResponseCache, get_llm_cache
+from app.shared.cassette import CassetteTransport, get_cassette
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -19,6 +25,48 @@ class BaseLLMService(ABC):
     def __init__(self: BaseLLMService, config: Config) -> None:
         """Initialize the LLM service."""
         self.config = config
+        self.response_cache: LLMResponseCache | None = get_llm_cache()
+
+    @staticmethod
+    def _http_client(
+        client_class: type[httpx.AsyncClient],
+    ) -> httpx.AsyncClient | None:
+        """SDK HTTP client through the cassette while recording or replaying."""
+        cassette = get_cassette()
+        if cassette is None:
+            return None
+        return client_class(transport=CassetteTransport(cassette))
+
+    async def _cached[T](
+        self: BaseLLMService,
+        operation: str,
+        call: Callable[[], Awaitable[T]],
+        **request: Any,  # noqa: ANN401
+    ) -> T:
+        """Answer from the response cache, or make the call and store its result.
+
+        ``request`` is everything besides the provider that shapes the answer
+        (model, temperature, tool schema, prompt); it is hashed into the key.
+        """
+        cache = self.response_cache
+        if cache is None:
+            return await call()
+        provider = type(self).__name__
+        key = cache.key(provider=provider, operation=operation, **request)
+        name = f"{provider}.{operation}"
+        cached = await cache.get(name, key)
+        if cached is not None:
+            return cached
+        result = await call()
+        if result is not None:
+            await cache.store(key, result)
+        return result
+
+    def _request_options(self) -> dict[str, Any]:
+        """Client options for the next API call, bounded by the import deadline."""
+        if current_deadline() is None:
+            return {}
+        return {"timeout": time_left()}
 
     def _clean_response_data(self, data: dict[str, Any]) -> dict[str, Any]:
         """Clean and validate response data before creating EventData."""
@@ -111,7 +159,7 @@ class BaseLLMService(ABC):
     @abstractmethod
     async def extract_from_image(
         self: BaseLLMService,
-        image_data: bytes,
+        image_data: Buffer,
         mime_type: str,
         url: str,
         needs_long_description: bool = True,
@@ -0,0 +1,190 @@
+"""Persistent, content-addressed cache of LLM responses.
+
+Re-imports, rebuild previews and retries after a downstream failure send the
+providers prompts they have answered before. With ``LLM_CACHE_ENABLED`` the
+parsed result of every successful call is kept in a small SQLite file, keyed
+by a hash of everything that determines the answer: provider, model,
+temperature, tool schema and prompt (images are part of the prompt). Entries
+expire after ``cache_ttl`` and the file is bounded in size, evicting least
+recently used entries first.
+
+Code that needs a new generation for an unchanged prompt (a rebuild the user
+asked for) runs inside ``fresh_llm_responses()``: lookups are skipped there,
+and the fresh result replaces the stored one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+_fresh: ContextVar[bool] = ContextVar("fresh_llm_responses", default=False)
+
+
+@contextmanager
+def fresh_llm_responses() -> Iterator[None]:
+    """Skip cached LLM responses for everything run in this context."""
+    token = _fresh.set(True)
+    try:
+        yield
+    finally:
+        _fresh.reset(token)
+
+
+class LLMResponseCache:
+    """Size-bounded, LRU-evicted store of LLM results on disk."""
+
+    def __init__(
+        self: LLMResponseCache, path: Path, ttl: float, max_bytes: int
+    ) -> None:
+        """Initialize the cache; the file is created on first use."""
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # Hits and misses per operation, e.g. "Claude.extract_event_data"
+        self.hits: defaultdict[str, int] = defaultdict(int)
+        self.misses: defaultdict[str, int] = defaultdict(int)
+        self._ready = False
+
+    @staticmethod
+    def key(**request: Any) -> str:  # noqa: ANN401
+        """Cache key for everything that shapes a provider's answer."""
+        material = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def stats(self: LLMResponseCache) -> dict[str, dict[str, Any]]:
+        """Hits, misses and hit rate per operation since startup."""
+        operations = sorted(set(self.hits) | set(self.misses))
+        return {
+            operation: {
+                "hits": self.hits[operation],
+                "misses": self.misses[operation],
+                "hit_rate": round(
+                    self.hits[operation]
+                    / (self.hits[operation] + self.misses[operation]),
+                    3,
+                ),
+            }
+            for operation in operations
+        }
+
+    async def get(self: LLMResponseCache, operation: str, key: str) -> Any:  # noqa: ANN401
+        """A stored result, or None on a miss or inside fresh_llm_responses()."""
+        if _fresh.get():
+            self.misses[operation] += 1
+            return None
+        try:
+            value = await asyncio.to_thread(self._get, key)
+        except sqlite3.Error:
+            logger.warning("LLM cache lookup failed", exc_info=True)
+            value = None
+        if value is None:
+            self.misses[operation] += 1
+            return None
+        self.hits[operation] += 1
+        logger.debug(f"LLM cache hit for {operation}")
+        return value
+
+    async def store(self: LLMResponseCache, key: str, value: Any) -> None:  # noqa: ANN401
+        """Store a result; a failing cache never fails the call."""
+        try:
+            await asyncio.to_thread(self._put, key, json.dumps(value))
+        except (sqlite3.Error, TypeError, ValueError):
+            logger.warning("LLM cache write failed", exc_info=True)
+
+    def _connect(self: LLMResponseCache) -> sqlite3.Connection:
+        """Open the cache file, creating the table on first use."""
+        if not self._ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5)
+        if not self._ready:
+            with connection:
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS responses (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        size INTEGER NOT NULL,
+                        stored_at REAL NOT NULL,
+                        last_access REAL NOT NULL
+                    )
+                    """
+                )
+            self._ready = True
+        return connection
+
+    def _get(self: LLMResponseCache, key: str) -> Any:  # noqa: ANN401
+        connection = self._connect()
+        now = time.time()
+        try:
+            with connection:
+                row = connection.execute(
+                    "SELECT value FROM responses WHERE key = ? AND stored_at > ?",
+                    (key, now - self.ttl),
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute(
+                    "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+                )
+        finally:
+            connection.close()
+        return json.loads(row[0])
+
+    def _put(self: LLMResponseCache, key: str, value: str) -> None:
+        size = len(value.encode())
+        if size > self.max_bytes:
+            return
+        connection = self._connect()
+        now = time.time()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, value, size, now, now),
+                )
+                connection.execute(
+                    "DELETE FROM responses WHERE stored_at <= ?", (now - self.ttl,)
+                )
+                # Drop the least recently used entries beyond the size budget
+                connection.execute(
+                    """
+                    DELETE FROM responses WHERE key IN (
+                        SELECT key FROM (
+                            SELECT key, SUM(size) OVER (
+                                ORDER BY last_access DESC, rowid DESC
+                            ) AS running
+                            FROM responses
+                        ) WHERE running > ?
+                    )
+                    """,
+                    (self.max_bytes,),
+                )
+        finally:
+            connection.close()
+
+
+@cache
+def get_llm_cache() -> LLMResponseCache | None:
+    """The process-wide LLM response cache, or None when it is disabled."""
+    settings = config.llm
+    if not settings.cache_enabled:
+        return None
+    return LLMResponseCache(
+        settings.cache_path, settings.cache_ttl, settings.cache_max_bytes
+    )
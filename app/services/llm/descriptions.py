@@ -0,0 +1,155 @@
+"""Local post-processing of event descriptions.
+
+Web and image extraction ask the LLM for both descriptions in the same call,
+constrained to the lengths in ``ProcessingConfig``. When an answer still
+misses the limits, fit_descriptions() brings it within them without another
+round-trip: an over-long short description is cut at a sentence or word
+boundary, a missing one is taken from the long description, and a long
+description that is too short is completed from the event's own facts.
+Long descriptions are never shortened; source descriptions are kept whole.
+
+Only what remains out of bounds is sent back to the LLM. DescriptionStats
+counts how often that happens and how long those calls take.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from app.core.schemas import EventData
+from config.processing import ProcessingConfig
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _first_sentence(text: str) -> str:
+    """The first sentence of a text, without its closing full stop."""
+    return _SENTENCE_END.split(text.strip(), maxsplit=1)[0].rstrip(".")
+
+
+def _truncate(text: str, max_length: int) -> str:
+    """Shorten text to whole sentences, or else whole words, within max_length."""
+    text = text.strip()
+    if len(text) <= max_length:
+        return text
+    sentences = _SENTENCE_END.split(text)
+    kept = ""
+    for sentence in sentences:
+        candidate = f"{kept} {sentence}".strip()
+        if len(candidate) > max_length:
+            break
+        kept = candidate
+    if not kept:
+        kept = text[: max_length + 1].rsplit(" ", 1)[0][:max_length]
+    return kept.rstrip(" ,;:-")
+
+
+def _event_facts(event_data: EventData) -> list[str]:
+    """Sentences stating the event's lineup, venue and date."""
+    facts = []
+    if event_data.lineup:
+        names = event_data.lineup[:6]
+        listed = (
+            names[0] if len(names) == 1 else f"{', '.join(names[:-1])} and {names[-1]}"
+        )
+        facts.append(f"Featuring {listed}.")
+    place = ", ".join(
+        filter(
+            None,
+            [
+                event_data.venue,
+                event_data.location.city if event_data.location else None,
+            ],
+        )
+    )
+    if place and event_data.date:
+        facts.append(f"{event_data.title} takes place at {place} on {event_data.date}.")
+    elif place:
+        facts.append(f"{event_data.title} takes place at {place}.")
+    return facts
+
+
+def _expand(event_data: EventData, min_length: int, max_length: int) -> str | None:
+    """A long description reaching min_length from the facts at hand, if any."""
+    parts = []
+    for part in [
+        event_data.long_description,
+        event_data.short_description,
+        *_event_facts(event_data),
+    ]:
+        if not part:
+            continue
+        part = part.strip()
+        if part[-1] not in ".!?":
+            part = f"{part}."
+        if not any(part.rstrip(".").lower() in kept.lower() for kept in parts):
+            parts.append(part)
+    text = _truncate(" ".join(parts), max_length)
+    return text if len(text) >= min_length else None
+
+
+def fit_descriptions(event_data: EventData, limits: ProcessingConfig) -> EventData:
+    """Bring the descriptions within the configured lengths where possible.
+
+    Returns a copy; descriptions that cannot be fixed locally are left as
+    they are for the LLM to regenerate.
+    """
+    long = event_data.long_description
+    short = event_data.short_description
+
+    if short and len(short) > limits.short_description_max_length:
+        short = _truncate(_first_sentence(short), limits.short_description_max_length)
+    if not short and long:
+        candidate = _first_sentence(long)
+        if len(candidate) <= limits.short_description_max_length:
+            short = candidate
+    if not long or len(long) < limits.long_description_min_length:
+        long = (
+            _expand(
+                event_data.model_copy(
+                    update={"long_description": long, "short_description": short}
+                ),
+                limits.long_description_min_length,
+                limits.long_description_max_length,
+            )
+            or long
+        )
+
+    return event_data.model_copy(
+        update={"long_description": long, "short_description": short or None}
+    )
+
+
+@dataclass
+class DescriptionStats:
+    """How descriptions were brought within limits, and what it cost."""
+
+    checked: int = 0
+    fixed_locally: int = 0
+    llm_calls: int = 0
+    llm_failures: int = 0
+    llm_latency: float = 0.0
+
+    def snapshot(self: DescriptionStats) -> dict[str, Any]:
+        """Counts, the share needing the LLM and its mean latency."""
+        return {
+            "checked": self.checked,
+            "fixed_locally": self.fixed_locally,
+            "llm_calls": self.llm_calls,
+            "llm_failures": self.llm_failures,
+            "llm_share": (
+                round(self.llm_calls / self.checked, 3) if self.checked else None
+            ),
+            "mean_llm_latency": (
+                round(self.llm_latency / self.llm_calls, 3) if self.llm_calls else None
+            ),
+        }
+
+
+@cache
+def get_description_stats() -> DescriptionStats:
+    """The process-wide description statistics."""
+    return DescriptionStats()
@@ -5,6 +5,11 @@ from __future__ import annotations
 from typing import Any
 
 from app.core.schemas import EventData
+from config import config
+
+# Description lengths the extraction asks for, the same limits the result is
+# checked against, so a compliant answer needs no follow-up call
+_limits = config.processing
 
 
 class EventPrompts:
@@ -40,9 +45,9 @@ FIELD CLEANING:
   - Be thorough - extract every piece of information available. Pay attention to the city and venue name, as they are often mentioned in the content."""
 
     # Rules for generating long descriptions when missing
-    LONG_DESCRIPTION_GENERATION = """
+    LONG_DESCRIPTION_GENERATION = f"""
 **LONG DESCRIPTION**
-   - Generate a comprehensive description using the extracted information between 150 and 500 characters
+   - Generate a comprehensive description using the extracted information between {_limits.long_description_min_length} and {_limits.long_description_max_length} characters
    - Include facts about the artists and related factual annecdotes.
    - Make it natural and informative, 2-4 sentences.
    - Good examples:
@@ -55,9 +60,9 @@ FIELD CLEANING:
 """
 
     # Rules for generating short descriptions when missing
-    SHORT_DESCRIPTION_GENERATION = """
+    SHORT_DESCRIPTION_GENERATION = f"""
 **SHORT DESCRIPTION**
-   - Generate a factual summary under 100 characters
+   - Generate a factual summary under {_limits.short_description_max_length} characters
    - Stick to the facts
    - Good examples:
      - "Electronic music with the legendary DJ Shadow"
@@ -102,6 +107,9 @@ Genre Guidelines:
     ) -> str:
         """Build prompt for event extraction from any content type.
 
+        The request followed by the extraction instructions, for providers
+        that take the whole prompt as one message.
+
         Args:
             content: The content to extract from
             url: Source URL
@@ -110,6 +118,29 @@ Genre Guidelines:
             needs_long_description: Whether to include long description generation rules
             needs_short_description: Whether to include short description generation rules
 
+        """
+        request = cls.build_extraction_request(content, url, content_type, context)
+        instructions = cls.build_extraction_instructions(
+            needs_long_description, needs_short_description
+        )
+        return "\\n".join([request, f"\\n{instructions}"])
+
+    @classmethod
+    def build_extraction_request(
+        cls: type[EventPrompts],
+        content: str,
+        url: str,
+        content_type: str = "html",
+        context: str | None = None,
+    ) -> str:
+        """Build the event-specific part of an extraction prompt.
+
+        Args:
+            content: The content to extract from
+            url: Source URL
+            content_type: Type of content (html, screenshot, image, text)
+            context: Additional context if needed
+
         """
         # Content wrappers for different types
         content_wrapper = {
@@ -134,9 +165,22 @@ Genre Guidelines:
                 content_wrapper[1],
                 content if content_type not in ["screenshot", "image"] else "",
                 content_wrapper[2],
-                f"\\n{cls.BASE_EXTRACTION_RULES}",
             ],
         )
+        return "\\n".join(prompt_parts)
+
+    @classmethod
+    def build_extraction_instructions(
+        cls: type[EventPrompts],
+        needs_long_description: bool = True,
+        needs_short_description: bool = True,
+    ) -> str:
+        """Build the extraction rules, the same for every event of a kind.
+
+        Providers with prompt caching send these ahead of the request, so
+        they are only processed in full once.
+        """
+        prompt_parts = [cls.BASE_EXTRACTION_RULES]
 
         # Add description generation rules only if needed
         if needs_long_description:
@@ -147,6 +191,37 @@ Genre Guidelines:
 
         return "\\n".join(prompt_parts)
 
+    @classmethod
+    def build_missing_fields_prompt(
+        cls: type[EventPrompts],
+        content: str,
+        url: str,
+        known: EventData,
+        fields: list[str],
+    ) -> str:
+        """Build a short prompt for the fields a page's structured data lacks.
+
+        Args:
+            content: The page's visible text
+            url: Source URL
+            known: Event data already read from the page's structured data
+            fields: Names of the fields to extract
+
+        """
+        context = cls._build_event_context(known.model_dump())
+        prompt_parts = [
+            f"This event page's structured data is missing: {', '.join(fields)}.",
+            "Extract those fields from the page text, and genres plus any other details not among the known ones below; leave any you cannot find empty.",
+            f"\\nSource URL: {url}",
+            f"\\nKnown event details:\\n{context}",
+            "\\nPage text:",
+            "```",
+            content,
+            "```",
+            "\\nTIME EXTRACTION: use the show or doors time, never venue opening hours.",
+        ]
+        return "\\n".join(prompt_parts)
+
     @staticmethod
     def _build_event_context(event_data: dict[str, Any]) -> str:
         """Builds the event context string from event data."""
@@ -205,6 +280,17 @@ Genre Guidelines:
             needs_short: Whether to include short description generation rules
             supplementary_context: Additional context to help generate descriptions
         """
+        request = cls.build_description_request(event_data, supplementary_context)
+        instructions = cls.build_description_instructions(needs_long, needs_short)
+        return "\\n".join([request, instructions])
+
+    @classmethod
+    def build_description_request(
+        cls: type[EventPrompts],
+        event_data: EventData,
+        supplementary_context: str | None = None,
+    ) -> str:
+        """Build the event-specific part of a description prompt."""
         context = cls._build_event_context(event_data.model_dump())
 
         prompt_parts = [
@@ -215,7 +301,16 @@ Genre Guidelines:
         if supplementary_context:
             prompt_parts.append(f"\\nAdditional Context: {supplementary_context}")
 
-        prompt_parts.append("\\nRequirements:")
+        return "\\n".join(prompt_parts)
+
+    @classmethod
+    def build_description_instructions(
+        cls: type[EventPrompts],
+        needs_long: bool = True,
+        needs_short: bool = True,
+    ) -> str:
+        """Build the description rules, the same for every event."""
+        prompt_parts = ["\\nRequirements:"]
 
         # Add description generation rules based on what's needed
         if needs_long:
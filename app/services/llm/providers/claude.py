@@ -3,15 +3,18 @@
 import base64
 import json
 import logging
+import time
+from collections.abc import Buffer
 from typing import Any
 
-from anthropic import APIStatusError, AsyncAnthropic
-from anthropic.types import TextBlock
+from anthropic import APIStatusError, AsyncAnthropic, DefaultAsyncHttpxClient
+from anthropic.types import Message, TextBlock
 
 from app.core.errors import APIError, AuthenticationError, handle_errors_async
 from app.core.schemas import EventData
 from app.services.llm.base import BaseLLMService
 from app.services.llm.prompts import EventPrompts
+from app.services.llm.usage import TokenUsage, get_token_usage
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,14 @@ logger = logging.getLogger(__name__)
 # Service name constant
 CLAUDE_SERVICE_NAME = "Claude"
 
+# Marks the end of a prompt prefix for Anthropic's prompt cache
+CACHE_BREAKPOINT = {"type": "ephemeral"}
+
+# Sonnet caches no prefix shorter than this; shorter ones are not marked.
+# Prefix length is estimated from its characters, about four per token.
+MIN_CACHEABLE_TOKENS = 1024
+CHARS_PER_TOKEN = 4
+
 
 class Claude(BaseLLMService):
     """Provider for Claude AI API interactions."""
@@ -28,10 +39,14 @@ class Claude(BaseLLMService):
         self.client = None
         self.model = "claude-sonnet-4-20250514"
         self.max_tokens = 4096
+        self.usage: TokenUsage = get_token_usage()
 
         api_key = config.api.anthropic_api_key
         if api_key:
-            self.client = AsyncAnthropic(api_key=api_key)
+            self.client = AsyncAnthropic(
+                api_key=api_key,
+                http_client=self._http_client(DefaultAsyncHttpxClient),
+            )
 
         # Tool definitions...
         self.EXTRACTION_TOOL = {
@@ -87,15 +102,14 @@ class Claude(BaseLLMService):
         if len(html) > max_length:
             html = html[:max_length] + "\n<!-- truncated -->"
 
-        prompt = EventPrompts.build_extraction_prompt(
-            content=html,
-            url=url,
-            content_type="html",
-            needs_long_description=needs_long_description,
-            needs_short_description=needs_short_description,
+        prompt = EventPrompts.build_extraction_request(
+            content=html, url=url, content_type="html"
+        )
+        instructions = EventPrompts.build_extraction_instructions(
+            needs_long_description, needs_short_description
         )
 
-        result = await self._call_with_tool(prompt)
+        result = await self._call_with_tool(prompt, system=instructions)
         if result:
             result["source_url"] = url
             cleaned_result = self._clean_response_data(result)
@@ -105,7 +119,7 @@ class Claude(BaseLLMService):
     @handle_errors_async(reraise=True)
     async def extract_from_image(
         self: "Claude",
-        image_data: bytes,
+        image_data: Buffer,
         mime_type: str,
         url: str,
         needs_long_description: bool = True,
@@ -113,17 +127,18 @@ class Claude(BaseLLMService):
     ) -> EventData | None:
         """Extract event data from an image."""
         image_b64 = base64.b64encode(image_data).decode("utf-8")
-        prompt = EventPrompts.build_extraction_prompt(
-            content="",
-            url=url,
-            content_type="image",
-            needs_long_description=needs_long_description,
-            needs_short_description=needs_short_description,
+        prompt = EventPrompts.build_extraction_request(
+            content="", url=url, content_type="image"
+        )
+        instructions = EventPrompts.build_extraction_instructions(
+            needs_long_description, needs_short_description
         )
         schema_json = json.dumps(self.EXTRACTION_TOOL["input_schema"])
-        vision_prompt = f"{prompt}\n\nRespond ONLY with a valid JSON object conforming to this schema:\n{schema_json}"
+        system = f"{instructions}\n\nRespond ONLY with a valid JSON object conforming to this schema:\n{schema_json}"
 
-        result = await self._call_with_vision(vision_prompt, image_b64, mime_type)
+        result = await self._call_with_vision(
+            prompt, image_b64, mime_type, system=system
+        )
         if result:
             result["source_url"] = url
             result["images"] = {"full": url, "thumbnail": url}
@@ -143,15 +158,15 @@ class Claude(BaseLLMService):
         if not needs_long and not needs_short:
             return event_data
 
-        prompt = EventPrompts.build_description_generation_prompt(
-            event_data,
-            needs_long=needs_long,
-            needs_short=needs_short,
-            supplementary_context=supplementary_context,
+        prompt = EventPrompts.build_description_request(
+            event_data, supplementary_context=supplementary_context
+        )
+        instructions = EventPrompts.build_description_instructions(
+            needs_long=needs_long, needs_short=needs_short
         )
 
         try:
-            result = await self._call_with_tool(prompt)
+            result = await self._call_with_tool(prompt, system=instructions)
             updated_event = event_data.model_copy(deep=True)
             if result:
                 if needs_long and result.get("long_description"):
@@ -169,13 +184,24 @@ class Claude(BaseLLMService):
         if not self.client:
             raise AuthenticationError(CLAUDE_SERVICE_NAME)
 
-        response = await self.client.messages.create(
+        async def call() -> str:
+            response = await self._create(
+                "analyze_text",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=1024,
+                temperature=0.2,
+                **self._request_options(),
+            )
+            return response.content[0].text.strip()
+
+        return await self._cached(
+            "analyze_text",
+            call,
             model=self.model,
-            messages=[{"role": "user", "content": prompt}],
             max_tokens=1024,
             temperature=0.2,
+            prompt=prompt,
         )
-        return response.content[0].text.strip()
 
     @handle_errors_async(reraise=True)
     async def extract_event_data(
@@ -209,27 +235,95 @@ class Claude(BaseLLMService):
             logger.exception("Failed to enhance genres")
             return event_data
 
+    async def _create(
+        self: "Claude",
+        operation: str,
+        *,
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        **params: Any,  # noqa: ANN401
+    ) -> Message:
+        """Send a Messages API request, recording its token usage.
+
+        The tools and system prompt are marked as a cacheable prefix: tools
+        come first in Anthropic's prompt order, so a breakpoint after the
+        system prompt covers both, and one on the last tool covers calls
+        without a system prompt. Prefixes too short to be cached (the
+        description and genre calls) are sent unmarked.
+        """
+        prefix_length = len(json.dumps(tools)) if tools else 0
+        prefix_length += len(system or "")
+        cacheable = prefix_length >= MIN_CACHEABLE_TOKENS * CHARS_PER_TOKEN
+        if tools:
+            params["tools"] = tools
+            if cacheable:
+                params["tools"] = [
+                    *tools[:-1],
+                    {**tools[-1], "cache_control": CACHE_BREAKPOINT},
+                ]
+        if system:
+            block = {"type": "text", "text": system}
+            if cacheable:
+                block["cache_control"] = CACHE_BREAKPOINT
+            params["system"] = [block]
+        start = time.perf_counter()
+        message = await self.client.messages.create(model=self.model, **params)
+        self.usage.record(
+            f"{CLAUDE_SERVICE_NAME}.{operation}",
+            message.usage,
+            time.perf_counter() - start,
+        )
+        return message
+
     async def _call_with_tool(
         self: "Claude",
         prompt: str,
         tool: dict | None = None,
         tool_name: str | None = None,
+        system: str | None = None,
     ) -> dict[str, Any] | None:
-        """Make API call with tool use."""
+        """Make API call with tool use.
+
+        ``system`` holds instructions that are the same across events; they
+        are sent with the tool schema as a cached prompt prefix, and only
+        ``prompt`` is processed anew on every call.
+        """
         if not self.client:
             raise AuthenticationError(CLAUDE_SERVICE_NAME)
 
         if not tool:
             tool = self.EXTRACTION_TOOL
             tool_name = "extract_event_data"
+        return await self._cached(
+            tool_name,
+            lambda: self._create_tool_call(prompt, tool, tool_name, system),
+            model=self.model,
+            max_tokens=self.max_tokens,
+            temperature=0.1,
+            tool=tool,
+            system=system,
+            prompt=prompt,
+        )
+
+    async def _create_tool_call(
+        self: "Claude",
+        prompt: str,
+        tool: dict,
+        tool_name: str,
+        system: str | None,
+    ) -> dict[str, Any] | None:
+        """Send a tool-use request and return the tool input."""
+        request_options = self._request_options()
         try:
-            message = await self.client.messages.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+            message = await self._create(
+                tool_name,
+                system=system,
                 tools=[tool],
+                messages=[{"role": "user", "content": prompt}],
                 tool_choice={"type": "tool", "name": tool_name},
                 max_tokens=self.max_tokens,
                 temperature=0.1,
+                **request_options,
             )
             tool_use = next((c for c in message.content if c.type == "tool_use"), None)
             if tool_use and hasattr(tool_use, "input"):
@@ -255,14 +349,39 @@ class Claude(BaseLLMService):
         prompt: str,
         image_b64: str,
         mime_type: str,
+        system: str | None = None,
     ) -> dict[str, Any] | None:
-        """Call Claude's vision model with a prompt and image."""
+        """Call Claude's vision model with a prompt and image.
+
+        ``system`` is sent as a cached prompt prefix, as in _call_with_tool.
+        """
         if not self.client:
             raise AuthenticationError(CLAUDE_SERVICE_NAME)
 
+        return await self._cached(
+            "vision",
+            lambda: self._create_vision_call(prompt, image_b64, mime_type, system),
+            model=self.model,
+            max_tokens=self.max_tokens,
+            temperature=0.1,
+            system=system,
+            prompt=prompt,
+            image=image_b64,
+        )
+
+    async def _create_vision_call(
+        self: "Claude",
+        prompt: str,
+        image_b64: str,
+        mime_type: str,
+        system: str | None,
+    ) -> dict[str, Any] | None:
+        """Send a vision request and parse the JSON it answers with."""
+        request_options = self._request_options()
         try:
-            message = await self.client.messages.create(
-                model=self.model,
+            message = await self._create(
+                "vision",
+                system=system,
                 messages=[
                     {
                         "role": "user",
@@ -281,6 +400,7 @@ class Claude(BaseLLMService):
                 ],
                 max_tokens=self.max_tokens,
                 temperature=0.1,
+                **request_options,
             )
             if message.content and isinstance(message.content[0], TextBlock):
                 content = message.content[0].text.strip()
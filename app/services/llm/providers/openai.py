@@ -6,9 +6,10 @@ import base64
 import json
 import logging
 import re
+from collections.abc import Buffer
 from typing import Any
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from app.core.errors import APIError, ConfigurationError, handle_errors_async
 from app.core.schemas import EventData
@@ -128,7 +129,10 @@ class OpenAI(BaseLLMService):
         super().__init__(config)
         if not config.api.openai_api_key:
             raise ConfigurationError(OPENAI_API_KEY_NOT_FOUND)
-        self.client = AsyncOpenAI(api_key=config.api.openai_api_key)
+        self.client = AsyncOpenAI(
+            api_key=config.api.openai_api_key,
+            http_client=self._http_client(DefaultAsyncHttpxClient),
+        )
         self.model = "gpt-4-turbo-preview"
         self.max_tokens = 4096
 
@@ -171,7 +175,7 @@ class OpenAI(BaseLLMService):
     @handle_errors_async(reraise=True)
     async def extract_from_image(
         self: OpenAI,
-        image_data: bytes,
+        image_data: Buffer,
         mime_type: str,
         url: str,
         needs_long_description: bool = True,
@@ -244,13 +248,24 @@ class OpenAI(BaseLLMService):
         if not self.client:
             raise ConfigurationError(OPENAI_CLIENT_NOT_INITIALIZED)
 
-        response = await self.client.chat.completions.create(
+        async def call() -> str:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=1024,
+                temperature=0.2,
+                **self._request_options(),
+            )
+            return response.choices[0].message.content.strip()
+
+        return await self._cached(
+            "analyze_text",
+            call,
             model=self.model,
-            messages=[{"role": "user", "content": prompt}],
             max_tokens=1024,
             temperature=0.2,
+            prompt=prompt,
         )
-        return response.choices[0].message.content.strip()
 
     @handle_errors_async(reraise=True)
     async def extract_event_data(
@@ -299,6 +314,23 @@ class OpenAI(BaseLLMService):
         if not tool:
             tool = self.EXTRACTION_TOOL
             tool_name = "extract_event_data"
+        return await self._cached(
+            tool_name,
+            lambda: self._create_tool_call(prompt, tool, tool_name),
+            model=self.model,
+            max_tokens=self.max_tokens,
+            tool=tool,
+            prompt=prompt,
+        )
+
+    async def _create_tool_call(
+        self: OpenAI,
+        prompt: str,
+        tool: dict[str, Any],
+        tool_name: str,
+    ) -> dict[str, Any] | None:
+        """Send a function-calling request and return the arguments."""
+        request_options = self._request_options()
         try:
             response = await self.client.chat.completions.create(
                 model=self.model,
@@ -306,6 +338,7 @@ class OpenAI(BaseLLMService):
                 tools=[tool],
                 tool_choice={"type": "function", "function": {"name": tool_name}},
                 max_tokens=self.max_tokens,
+                **request_options,
             )
             content = response.choices[0].message.tool_calls[0].function.arguments
             try:
@@ -328,7 +361,24 @@ class OpenAI(BaseLLMService):
         if not self.client:
             raise ConfigurationError(OPENAI_CLIENT_NOT_INITIALIZED)
 
+        return await self._cached(
+            "vision",
+            lambda: self._create_vision_call(prompt, image_b64, mime_type),
+            model="gpt-4-turbo",
+            max_tokens=self.max_tokens,
+            prompt=prompt,
+            image=image_b64,
+        )
+
+    async def _create_vision_call(
+        self: OpenAI,
+        prompt: str,
+        image_b64: str,
+        mime_type: str,
+    ) -> dict[str, Any] | None:
+        """Send a vision request and parse the JSON it answers with."""
         logger.debug(f"Calling OpenAI vision with model {self.model}")
+        request_options = self._request_options()
         try:
             response = await self.client.chat.completions.create(
                 model="gpt-4-turbo",
@@ -347,6 +397,7 @@ class OpenAI(BaseLLMService):
                     },
                 ],
                 max_tokens=self.max_tokens,
+                **request_options,
             )
             response_text = response.choices[0].message.content
             if not response_text:
@@ -4,14 +4,27 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Buffer, Callable
 from typing import Any, TypeVar
 
-from app.core.errors import ConfigurationError, retry_on_error
+import anthropic
+import openai
+
+from app.core.deadline import DeadlineExceededError, deadline_passed
+from app.core.errors import (
+    APIError,
+    CircuitOpenError,
+    ConfigurationError,
+    retry_on_error,
+)
+from app.core.retry_budget import spend_retry
 from app.core.schemas import EventData
+from app.core.timing import span, timed
 from app.services.llm.base import BaseLLMService
 from app.services.llm.providers.claude import Claude
 from app.services.llm.providers.openai import OpenAI
+from app.shared.circuit_breaker import get_circuit_breakers
+from app.shared.http import HTTPService
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -22,6 +35,28 @@ LLM_NO_PROVIDERS_CONFIGURED = "No LLM providers configured. Please set either AN
 T = TypeVar("T")
 
 
+def _is_outage(error: Exception) -> bool:
+    """Whether a provider error counts against its circuit breaker.
+
+    The same rule as HTTPService._is_outage: timeouts (unless the import's
+    deadline ran out), connection errors and 5xx or unknown-status errors
+    count; rejected requests, missing keys and answers that don't parse or
+    validate do not. The providers wrap what they raise in APIError, so the
+    error is judged by its cause.
+    """
+    while isinstance(error, APIError) and isinstance(error.__cause__, Exception):
+        error = error.__cause__
+    if isinstance(error, DeadlineExceededError):
+        return False
+    if isinstance(error, anthropic.APITimeoutError | openai.APITimeoutError):
+        return not deadline_passed()
+    if isinstance(error, anthropic.APIConnectionError | openai.APIConnectionError):
+        return True
+    if isinstance(error, anthropic.APIStatusError | openai.APIStatusError):
+        return error.status_code >= 500
+    return HTTPService._is_outage(error)
+
+
 class LLMOperation[T]:
     """Represents an LLM operation with its providers and fallback logic."""
 
@@ -46,6 +81,7 @@ class LLMService:
     def __init__(self: LLMService, config: Config) -> None:
         """Initialize LLM service with configured providers."""
         self.config = config
+        self.circuit_breakers = get_circuit_breakers()
         self.primary_provider: BaseLLMService = Claude(config)
         self.fallback_provider: BaseLLMService | None = (
             OpenAI(config) if config.api.openai_api_key else None
@@ -73,33 +109,64 @@ class LLMService:
             logger.warning("OpenAI API not configured - missing OPENAI_API_KEY")
 
     async def _execute_with_fallback(self: LLMService, operation: LLMOperation[T]) -> T:
-        """Execute an LLM operation with automatic fallback."""
-        try:
-            logger.info(f"Attempting {operation.name} with primary provider (Claude)")
-            return await operation.primary_provider(*operation.args, **operation.kwargs)
-        except Exception as e:
-            logger.warning(
-                f"Primary provider (Claude) failed for {operation.name}, falling back to OpenAI: {e}",
-            )
-            if self.fallback_provider and operation.fallback_provider:
+        """Execute an LLM operation with automatic fallback.
+
+        While Claude's circuit breaker is open the operation goes straight to
+        the fallback provider. Falling back after a failed Claude call draws
+        from the import's retry budget; once it is spent the primary error is
+        raised.
+        """
+        with span(f"llm.{operation.name}"):
+            try:
+                logger.info(
+                    f"Attempting {operation.name} with primary provider (Claude)"
+                )
+                return await self._call_provider(
+                    "Claude", operation.primary_provider, operation
+                )
+            except DeadlineExceededError:
+                raise
+            except Exception as e:
+                if not (self.fallback_provider and operation.fallback_provider):
+                    logger.exception(
+                        "Fallback provider (OpenAI) not available or configured, cannot retry.",
+                    )
+                    raise
+                # With Claude's circuit open no request was made, so going
+                # straight to OpenAI is not a retry
+                if not isinstance(e, CircuitOpenError) and not spend_retry(
+                    f"{operation.name} with OpenAI"
+                ):
+                    raise
+                logger.warning(
+                    f"Primary provider (Claude) failed for {operation.name}, falling back to OpenAI: {e}",
+                )
                 try:
                     logger.info(
                         f"Attempting {operation.name} with fallback provider (OpenAI)",
                     )
-                    return await operation.fallback_provider(
-                        *operation.args,
-                        **operation.kwargs,
+                    return await self._call_provider(
+                        "OpenAI", operation.fallback_provider, operation
                     )
                 except Exception as fallback_error:
                     logger.exception(
                         f"Fallback provider (OpenAI) also failed for {operation.name}",
                     )
                     raise fallback_error from e
-            else:
-                logger.exception(
-                    "Fallback provider (OpenAI) not available or configured, cannot retry.",
-                )
-                raise e
+
+    async def _call_provider(
+        self: LLMService,
+        name: str,
+        provider: Callable[..., Awaitable[T]],
+        operation: LLMOperation[T],
+    ) -> T:
+        """Call one provider through its circuit breaker, timed as a stage."""
+        breaker = self.circuit_breakers.get(name)
+        with span(f"llm.{operation.name}.{name.lower()}"):
+            if breaker is None:
+                return await provider(*operation.args, **operation.kwargs)
+            async with breaker.guard(_is_outage):
+                return await provider(*operation.args, **operation.kwargs)
 
     def _enhance_description(self: LLMService, event_data: EventData) -> EventData:
         """Appends lineup to long description if available."""
@@ -244,7 +311,7 @@ class LLMService:
     @retry_on_error(max_attempts=2)
     async def extract_from_image(
         self: LLMService,
-        image_data: bytes,
+        image_data: Buffer,
         mime_type: str,
         url: str,
         needs_long_description: bool = True,
@@ -270,6 +337,7 @@ class LLMService:
         return None
 
     @retry_on_error(max_attempts=2)
+    @timed("llm.extract_genres_with_context")
     async def extract_genres_with_context(
         self: LLMService,
         prompt: str,
@@ -0,0 +1,97 @@
+"""Token usage and prompt cache effectiveness per LLM operation.
+
+Claude calls send their static instructions and tool schemas as a prompt
+prefix marked for Anthropic's prompt cache. Whether the prefix was read from
+the cache or written to it shows up in each response's usage; TokenUsage
+adds those counts up per operation, together with the call latency split by
+whether the cache was read, so the effect on response time can be checked.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+
+def _tokens(usage: Any, name: str) -> int:  # noqa: ANN401
+    """A token count from an SDK usage object; absent counts are 0."""
+    value = getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+@dataclass
+class OperationUsage:
+    """Token counts and latencies of one operation's calls."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cache_read_calls: int = 0
+    cache_read_latency: float = 0.0
+    uncached_latency: float = 0.0
+
+    def snapshot(self: OperationUsage) -> dict[str, Any]:
+        """Totals, and mean latency of calls with and without a cache read."""
+        uncached_calls = self.calls - self.cache_read_calls
+        return {
+            "calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "cache_read_calls": self.cache_read_calls,
+            "mean_latency_cache_read": (
+                round(self.cache_read_latency / self.cache_read_calls, 3)
+                if self.cache_read_calls
+                else None
+            ),
+            "mean_latency_uncached": (
+                round(self.uncached_latency / uncached_calls, 3)
+                if uncached_calls
+                else None
+            ),
+        }
+
+
+class TokenUsage:
+    """Token usage per operation, e.g. "Claude.extract_event_data"."""
+
+    def __init__(self: TokenUsage) -> None:
+        """Start with nothing recorded."""
+        self._operations: dict[str, OperationUsage] = {}
+
+    def record(
+        self: TokenUsage,
+        operation: str,
+        usage: Any,  # noqa: ANN401
+        latency: float,
+    ) -> None:
+        """Add the usage reported with one response."""
+        stats = self._operations.setdefault(operation, OperationUsage())
+        cache_read = _tokens(usage, "cache_read_input_tokens")
+        stats.calls += 1
+        stats.input_tokens += _tokens(usage, "input_tokens")
+        stats.output_tokens += _tokens(usage, "output_tokens")
+        stats.cache_read_tokens += cache_read
+        stats.cache_write_tokens += _tokens(usage, "cache_creation_input_tokens")
+        if cache_read:
+            stats.cache_read_calls += 1
+            stats.cache_read_latency += latency
+        else:
+            stats.uncached_latency += latency
+
+    def snapshot(self: TokenUsage) -> dict[str, dict[str, Any]]:
+        """Usage of every operation that has been called."""
+        return {
+            operation: stats.snapshot()
+            for operation, stats in sorted(self._operations.items())
+        }
+
+
+@cache
+def get_token_usage() -> TokenUsage:
+    """The process-wide token usage, shared by all providers."""
+    return TokenUsage()
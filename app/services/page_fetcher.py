@@ -0,0 +1,148 @@
+"""Tiered page fetching for the web agent.
+
+Rendering a page in Zyte's browser is the slowest and most expensive way to
+get its HTML, and most venue pages are static. Pages are fetched with the
+cheapest tier that returns usable HTML:
+
+1. a direct GET through HTTPService,
+2. Zyte's ``httpResponseBody`` (no rendering, but Zyte's unblocking),
+3. Zyte ``browserHtml`` with JavaScript.
+
+The first two return whatever the server sends, so their HTML has to pass a
+sufficiency check (enough visible text, or embedded event data, and no bot
+challenge). The tier that worked is remembered per domain for a while, so
+later imports start there instead of retrying cheaper tiers that failed.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import OrderedDict
+from enum import IntEnum
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+
+from app.core.deadline import DeadlineExceededError
+from app.services.security_detector import SecurityPageDetector
+
+if TYPE_CHECKING:
+    from app.services.zyte import ZyteService
+    from app.shared.http import HTTPService
+    from config import Config
+
+logger = logging.getLogger(__name__)
+
+_EVENT_JSON_LD = re.compile(r'"@type"\s*:\s*(\[[^\]]*)?"(\w*Event|Festival)"')
+
+
+class FetchTier(IntEnum):
+    """Ways of fetching a page, cheapest first."""
+
+    HTTP = 1
+    ZYTE_HTTP = 2
+    ZYTE_BROWSER = 3
+
+
+def is_sufficient(html: str, url: str, min_text_length: int) -> bool:
+    """Whether unrendered HTML is good enough to extract an event from.
+
+    Pages carrying JSON-LD event data always are. Otherwise the page must
+    show at least ``min_text_length`` characters of text outside scripts,
+    which rules out the empty shells of client-rendered apps, and must not
+    be a bot challenge.
+    """
+    if SecurityPageDetector.detect_security_page(html, url)[0]:
+        return False
+    soup = BeautifulSoup(html, "html.parser")
+    for script in soup.find_all("script", type="application/ld+json"):
+        if _EVENT_JSON_LD.search(script.string or ""):
+            return True
+    for element in soup.find_all(["script", "style", "noscript", "template", "svg"]):
+        element.decompose()
+    return len(" ".join(soup.get_text(" ").split())) >= min_text_length
+
+
+class PageFetcher:
+    """Fetches page HTML with the cheapest tier known to work for its domain."""
+
+    def __init__(
+        self: PageFetcher,
+        config: Config,
+        http_service: HTTPService,
+        zyte_service: ZyteService,
+    ) -> None:
+        """Initialize the fetcher with an empty per-domain tier cache."""
+        settings = config.importer
+        self.http = http_service
+        self.zyte = zyte_service
+        self.min_text_length = settings.fetch_min_text_length
+        self.ttl = settings.fetch_tier_cache_ttl
+        self.max_entries = settings.fetch_tier_cache_size
+        self._tiers: OrderedDict[str, tuple[FetchTier, float]] = OrderedDict()
+
+    @staticmethod
+    def domain(url: str) -> str:
+        """The domain tiers are remembered for."""
+        return (urlsplit(url).hostname or "").removeprefix("www.")
+
+    async def fetch_html(self: PageFetcher, url: str) -> str:
+        """Fetch a page's HTML, escalating tiers until one is sufficient.
+
+        Raises:
+            SecurityPageError: If even the rendered page is a bot challenge
+            APIError: If the browser tier fails
+
+        """
+        domain = self.domain(url)
+        start = self._get_cached(domain) or FetchTier.HTTP
+        for tier in (FetchTier.HTTP, FetchTier.ZYTE_HTTP):
+            if tier >= start and (html := await self._fetch_unrendered(tier, url)):
+                self._store(domain, tier)
+                return html
+        html = await self.zyte.fetch_html(url)
+        self._store(domain, FetchTier.ZYTE_BROWSER)
+        return html
+
+    async def _fetch_unrendered(
+        self: PageFetcher, tier: FetchTier, url: str
+    ) -> str | None:
+        """HTML from a tier without rendering, or None if it is not sufficient."""
+        try:
+            if tier is FetchTier.HTTP:
+                html = await self.http.get_text(url, service="Web")
+            else:
+                html = await self.zyte.fetch_http_body(url)
+        except DeadlineExceededError:
+            raise
+        except Exception as e:
+            logger.info(f"{tier.name} fetch failed for {url}: {e}")
+            return None
+        if not is_sufficient(html, url, self.min_text_length):
+            logger.info(f"{tier.name} fetch of {url} is not sufficient")
+            return None
+        logger.info(f"Fetched {url} without rendering ({tier.name})")
+        return html
+
+    def _get_cached(self: PageFetcher, domain: str) -> FetchTier | None:
+        entry = self._tiers.get(domain)
+        if entry is None:
+            return None
+        tier, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._tiers[domain]
+            return None
+        self._tiers.move_to_end(domain)
+        return tier
+
+    def _store(self: PageFetcher, domain: str, tier: FetchTier) -> None:
+        """Remember the tier that worked for a domain."""
+        if self.ttl <= 0:
+            return
+        self._tiers[domain] = (tier, time.monotonic() + self.ttl)
+        self._tiers.move_to_end(domain)
+        while len(self._tiers) > self.max_entries:
+            self._tiers.popitem(last=False)
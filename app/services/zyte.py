@@ -7,6 +7,7 @@ import logging
 from typing import Any
 
 from app.core.errors import APIError, SecurityPageError
+from app.core.timing import timed
 from app.services.security_detector import SecurityPageDetector
 from app.shared.http import HTTPService
 from config import Config
@@ -23,6 +24,7 @@ class ZyteService:
         self.http = http_service
         self.api_url = "https://api.zyte.com/v1/extract"
 
+    @timed("zyte.fetch_html")
     async def fetch_html(self: ZyteService, url: str) -> str:
         """Fetch HTML from a URL using Zyte API.
         This version has retries removed to simplify error handling.
@@ -52,6 +54,29 @@ class ZyteService:
                 logger.exception(f"Zyte HTML fetch failed for {url}")
             raise
 
+    @timed("zyte.fetch_http_body")
+    async def fetch_http_body(self: ZyteService, url: str) -> str:
+        """Fetch a page's HTML as served, without rendering it in a browser.
+
+        Much cheaper and faster than fetch_html, but client-rendered pages
+        come back without their content. No security page check is done, so
+        the caller can still fall back to fetch_html.
+        """
+        payload = {
+            "url": url,
+            "httpResponseBody": True,
+        }
+
+        try:
+            body, _ = await self._make_request(payload)
+        except Exception as e:
+            if not isinstance(e, APIError):
+                logger.exception(f"Zyte HTTP fetch failed for {url}")
+            raise
+        else:
+            return body
+
+    @timed("zyte.fetch_screenshot")
     async def fetch_screenshot(self: ZyteService, url: str) -> tuple[bytes, str]:
         """Fetch a screenshot of a web page using Zyte API.
         This version has retries removed to simplify error handling.
@@ -100,6 +125,13 @@ class ZyteService:
                 screenshot_b64 = response["screenshot"]
                 screenshot_data = base64.b64decode(screenshot_b64)
                 return screenshot_data, response_url
+            if payload.get("httpResponseBody"):
+                if "httpResponseBody" not in response:
+                    service_name = "Zyte"
+                    error_msg = "No response body in response"
+                    raise APIError(service_name, error_msg)
+                body = base64.b64decode(response["httpResponseBody"])
+                return body.decode("utf-8", errors="replace"), response_url
             if "browserHtml" not in response:
                 service_name = "Zyte"
                 error_msg = "No HTML in response"
@@ -0,0 +1,52 @@
+"""Zero-copy helpers for downloaded binary content."""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Buffer
+
+
+class BufferReader(io.RawIOBase):
+    """Seekable, read-only file object over an existing buffer.
+
+    Unlike BytesIO, which copies anything that isn't ``bytes``, reads are
+    served straight from the buffer, so a parser that only needs the header
+    (e.g. ``PIL.Image.open``) copies only the bytes it actually reads.
+    """
+
+    def __init__(self: BufferReader, data: Buffer) -> None:
+        """Wrap a bytes-like object without copying it."""
+        self._view = memoryview(data).cast("B")
+        self._position = 0
+
+    def readable(self: BufferReader) -> bool:
+        """Always readable."""
+        return True
+
+    def seekable(self: BufferReader) -> bool:
+        """Always seekable."""
+        return True
+
+    def readinto(self: BufferReader, target: Buffer) -> int:
+        """Copy the next bytes into target, returning how many were copied."""
+        target_view = memoryview(target).cast("B")
+        chunk = self._view[self._position : self._position + len(target_view)]
+        target_view[: len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def seek(self: BufferReader, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move the read position like a regular file."""
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            error_msg = f"Negative seek position {offset}"
+            raise ValueError(error_msg)
+        self._position = offset
+        return offset
+
+    def tell(self: BufferReader) -> int:
+        """Current read position."""
+        return self._position
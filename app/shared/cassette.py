@@ -0,0 +1,419 @@
+"""Record and replay of upstream HTTP exchanges.
+
+With ``CASSETTE_MODE=record`` every request HTTPService sends, and every
+request the Claude and OpenAI SDKs send, goes to the network as usual and the
+exchange is added to a cassette file (written when the process exits). With
+``CASSETTE_MODE=replay`` nothing leaves the process: requests are answered
+from the cassette, optionally after their recorded latency. The whole import
+pipeline then runs offline and repeatably, e.g. in
+``scripts/benchmark_replay.py``.
+
+Requests are matched on method, URL and a hash of the body; identical
+requests replay their recordings in order. A request whose body matches no
+recording (LLM prompts that mention today's date) gets the next recording of
+the same method and URL. Credentials in query strings are redacted before
+anything is stored or matched, and request headers are never stored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import base64
+import hashlib
+import json
+import logging
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any, Literal
+from urllib.parse import urlencode
+
+import httpx
+from aiohttp import ClientResponse
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from app.core.errors import CassetteError
+from config import config
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+# Query parameters that carry credentials (e.g. Google CSE's key=)
+REDACTED_PARAMS = frozenset({"key", "api_key", "apikey", "token", "access_token"})
+
+# Bodies are stored decoded, so headers describing the wire encoding go
+DROPPED_HEADERS = frozenset(
+    {
+        "content-encoding",
+        "content-length",
+        "transfer-encoding",
+        "connection",
+        "set-cookie",
+    }
+)
+
+
+def redact(url: str) -> str:
+    """The URL with credential query parameters blanked out."""
+    parsed = URL(url)
+    if not REDACTED_PARAMS.intersection(parsed.query):
+        return url
+    return str(
+        parsed.with_query(
+            [
+                (name, "REDACTED" if name in REDACTED_PARAMS else value)
+                for name, value in parsed.query.items()
+            ]
+        )
+    )
+
+
+def _digest(body: bytes | None) -> str | None:
+    return hashlib.sha256(body).hexdigest() if body else None
+
+
+@dataclass
+class Interaction:
+    """One recorded request and its response."""
+
+    method: str
+    url: str
+    body_sha256: str | None
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    latency: float
+
+    def to_json(self: Interaction) -> dict[str, Any]:
+        """Serialize, keeping text bodies readable in the file."""
+        try:
+            body, encoding = self.body.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(self.body).decode("ascii"), "base64"
+        return {
+            "request": {
+                "method": self.method,
+                "url": self.url,
+                "body_sha256": self.body_sha256,
+            },
+            "response": {
+                "status": self.status,
+                "headers": self.headers,
+                "body": body,
+                "encoding": encoding,
+                "latency": round(self.latency, 4),
+            },
+        }
+
+    @classmethod
+    def from_json(cls: type[Interaction], data: dict[str, Any]) -> Interaction:
+        """Deserialize an interaction written by ``to_json``."""
+        request, response = data["request"], data["response"]
+        body = response["body"]
+        return cls(
+            method=request["method"],
+            url=request["url"],
+            body_sha256=request["body_sha256"],
+            status=response["status"],
+            headers=[(name, value) for name, value in response["headers"]],
+            body=(
+                base64.b64decode(body)
+                if response["encoding"] == "base64"
+                else body.encode("utf-8")
+            ),
+            latency=response["latency"],
+        )
+
+
+class Cassette:
+    """The recorded exchanges of one cassette file."""
+
+    def __init__(
+        self: Cassette,
+        path: Path,
+        mode: Literal["record", "replay"],
+        latency_scale: float = 0.0,
+    ) -> None:
+        """Open a cassette; replay mode loads the file right away."""
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self.metadata: dict[str, Any] = {}
+        self.interactions: list[Interaction] = []
+        # Indexes of the interactions recorded for each (method, url)
+        self._by_request: dict[tuple[str, str], list[int]] = defaultdict(list)
+        self._played: set[int] = set()
+        if mode == "replay":
+            self.load()
+
+    @property
+    def replaying(self: Cassette) -> bool:
+        """Whether requests are answered from the cassette."""
+        return self.mode == "replay"
+
+    def load(self: Cassette) -> None:
+        """Read the cassette file."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            error_msg = f"Cannot read cassette {self.path}: {e}"
+            raise CassetteError(error_msg) from e
+        version = data.get("version")
+        if version != CASSETTE_VERSION:
+            error_msg = (
+                f"Cassette {self.path} has format version {version}, expected "
+                f"{CASSETTE_VERSION}; record it again"
+            )
+            raise CassetteError(error_msg)
+        self.metadata = data.get("metadata", {})
+        for interaction in data["interactions"]:
+            self._add(Interaction.from_json(interaction))
+        logger.info(f"Replaying {len(self.interactions)} exchanges from {self.path}")
+
+    def save(self: Cassette) -> None:
+        """Write the cassette file (atomically)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CASSETTE_VERSION,
+            "metadata": self.metadata,
+            "interactions": [
+                interaction.to_json() for interaction in self.interactions
+            ],
+        }
+        temporary = self.path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        temporary.replace(self.path)
+        logger.info(f"Recorded {len(self.interactions)} exchanges to {self.path}")
+
+    def rewind(self: Cassette) -> None:
+        """Make every recording available again, e.g. between benchmark runs."""
+        self._played.clear()
+
+    def find(self: Cassette, method: str, url: str, body: bytes | None) -> Interaction:
+        """The recording that answers a request."""
+        url = redact(url)
+        indexes = self._by_request.get((method, url))
+        if not indexes:
+            error_msg = f"No recorded response for {method} {url}"
+            raise CassetteError(error_msg)
+        digest = _digest(body)
+        unplayed = [index for index in indexes if index not in self._played]
+        # Once everything recorded for it was played, a request repeats the last
+        candidates = unplayed or indexes[-1:]
+        index = next(
+            (i for i in candidates if self.interactions[i].body_sha256 == digest),
+            candidates[0],
+        )
+        self._played.add(index)
+        return self.interactions[index]
+
+    def record(
+        self: Cassette,
+        method: str,
+        url: str,
+        body: bytes | None,
+        status: int,
+        headers: Iterable[tuple[str, str]],
+        content: bytes,
+        latency: float,
+    ) -> Interaction:
+        """Add an exchange that just happened."""
+        interaction = Interaction(
+            method=method,
+            url=redact(url),
+            body_sha256=_digest(body),
+            status=status,
+            headers=[
+                (name, value)
+                for name, value in headers
+                if name.lower() not in DROPPED_HEADERS
+            ],
+            body=content,
+            latency=latency,
+        )
+        self._add(interaction)
+        return interaction
+
+    async def wait(self: Cassette, interaction: Interaction) -> None:
+        """Simulate the recorded latency, scaled."""
+        if self.latency_scale > 0:
+            await asyncio.sleep(interaction.latency * self.latency_scale)
+
+    @asynccontextmanager
+    async def exchange(
+        self: Cassette,
+        send: Callable[..., AbstractAsyncContextManager[ClientResponse]],
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[CassetteResponse]:
+        """An aiohttp request (``send`` is ``session.request``) via the cassette."""
+        full_url = str(URL(url).update_query(kwargs.get("params") or {}))
+        body = _aiohttp_body(kwargs)
+        if self.replaying:
+            interaction = self.find(method, full_url, body)
+            await self.wait(interaction)
+        else:
+            start = time.perf_counter()
+            async with send(method, url, **kwargs) as response:
+                content = await response.read()
+            interaction = self.record(
+                method,
+                full_url,
+                body,
+                response.status,
+                response.headers.items(),
+                content,
+                time.perf_counter() - start,
+            )
+        yield CassetteResponse(interaction)
+
+    def _add(self: Cassette, interaction: Interaction) -> None:
+        self._by_request[(interaction.method, interaction.url)].append(
+            len(self.interactions)
+        )
+        self.interactions.append(interaction)
+
+
+def _aiohttp_body(kwargs: Mapping[str, Any]) -> bytes | None:
+    """The request body aiohttp would send for these arguments."""
+    if kwargs.get("json") is not None:
+        return json.dumps(kwargs["json"], sort_keys=True).encode()
+    data = kwargs.get("data")
+    if isinstance(data, Mapping):
+        return urlencode(sorted(data.items())).encode()
+    if isinstance(data, str):
+        return data.encode()
+    return data
+
+
+class _RecordedContent:
+    """The slice of aiohttp's StreamReader that HTTPService reads with."""
+
+    def __init__(self: _RecordedContent, body: bytes) -> None:
+        self._body = body
+
+    async def read(self: _RecordedContent) -> bytes:
+        return self._body
+
+    async def iter_any(self: _RecordedContent) -> AsyncIterator[bytes]:
+        if self._body:
+            yield self._body
+
+    async def iter_chunked(self: _RecordedContent, n: int) -> AsyncIterator[bytes]:
+        for start in range(0, len(self._body), n):
+            yield self._body[start : start + n]
+
+
+class CassetteResponse:
+    """A recorded response, standing in for aiohttp's ClientResponse."""
+
+    # Nothing holds a connection
+    closed = True
+
+    def __init__(self: CassetteResponse, interaction: Interaction) -> None:
+        """Wrap a recorded interaction."""
+        self.method = interaction.method
+        self.url = URL(interaction.url)
+        self.status = interaction.status
+        self.headers = CIMultiDictProxy(CIMultiDict(interaction.headers))
+        self.content = _RecordedContent(interaction.body)
+        self._body = interaction.body
+
+    @property
+    def ok(self: CassetteResponse) -> bool:
+        """Whether the status is below 400."""
+        return self.status < 400
+
+    @property
+    def charset(self: CassetteResponse) -> str | None:
+        """The charset declared in Content-Type, if any."""
+        for parameter in self.headers.get("Content-Type", "").split(";")[1:]:
+            name, _, value = parameter.strip().partition("=")
+            if name.lower() == "charset":
+                return value.strip('"') or None
+        return None
+
+    async def read(self: CassetteResponse) -> bytes:
+        """The recorded body."""
+        return self._body
+
+    async def text(
+        self: CassetteResponse, encoding: str | None = None, errors: str = "strict"
+    ) -> str:
+        """The recorded body, decoded."""
+        return self._body.decode(encoding or self.charset or "utf-8", errors)
+
+    async def json(self: CassetteResponse, **_kwargs: Any) -> Any:  # noqa: ANN401
+        """The recorded body, parsed as JSON."""
+        return json.loads(self._body)
+
+    def release(self: CassetteResponse) -> None:
+        """Nothing to release."""
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """httpx transport through a cassette, for the LLM SDK clients."""
+
+    def __init__(
+        self: CassetteTransport,
+        cassette: Cassette,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Wrap the transport that reaches the network when recording."""
+        self.cassette = cassette
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(
+        self: CassetteTransport, request: httpx.Request
+    ) -> httpx.Response:
+        """Answer from the cassette, or send the request and record it."""
+        body = await request.aread()
+        if self.cassette.replaying:
+            interaction = self.cassette.find(request.method, str(request.url), body)
+            await self.cassette.wait(interaction)
+        else:
+            start = time.perf_counter()
+            response = await self.transport.handle_async_request(request)
+            try:
+                content = await response.aread()
+            finally:
+                await response.aclose()
+            interaction = self.cassette.record(
+                request.method,
+                str(request.url),
+                body,
+                response.status_code,
+                response.headers.multi_items(),
+                content,
+                time.perf_counter() - start,
+            )
+        return httpx.Response(
+            interaction.status,
+            headers=interaction.headers,
+            content=interaction.body,
+            request=request,
+        )
+
+    async def aclose(self: CassetteTransport) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
+
+
+@cache
+def get_cassette() -> Cassette | None:
+    """The process-wide cassette, or None unless recording or replaying."""
+    settings = config.cassette
+    if settings.mode == "off":
+        return None
+    cassette = Cassette(settings.path, settings.mode, settings.latency_scale)
+    if not cassette.replaying:
+        atexit.register(cassette.save)
+    return cassette
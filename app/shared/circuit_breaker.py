@@ -0,0 +1,197 @@
+"""Circuit breakers for external services.
+
+Each breaker tracks the outcome and latency of recent calls to one service.
+When too many of them fail, or too many are slow, the circuit opens and calls fail immediately with
+CircuitOpenError instead of waiting out timeouts and retries. After
+``open_seconds`` a single probe call is let through (half-open): success closes
+the circuit again, a failed or slow probe re-opens it.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from enum import StrEnum
+from functools import cache
+from typing import Any
+
+from app.core.errors import CircuitOpenError
+from config import config
+from config.circuit_breaker import CircuitBreakerConfig
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    """Whether calls to a service go through."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Rolling failure-rate and slow-call-rate breaker for one service."""
+
+    def __init__(
+        self: CircuitBreaker, name: str, settings: CircuitBreakerConfig
+    ) -> None:
+        """Start closed with an empty window."""
+        self.name = name
+        self.settings = settings
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+        self._probing = False
+        # (finished at, duration, failed) for calls inside the window
+        self._calls: deque[tuple[float, float, bool]] = deque()
+
+    def retry_in(self: CircuitBreaker) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        return max(self.opened_at + self.settings.open_seconds - time.monotonic(), 0.0)
+
+    @property
+    def is_open(self: CircuitBreaker) -> bool:
+        """Whether a call made now would be refused."""
+        if self.state == CircuitState.OPEN:
+            return self.retry_in() > 0
+        return self.state == CircuitState.HALF_OPEN and self._probing
+
+    def check(self: CircuitBreaker) -> None:
+        """Fail fast if a call made now would be refused."""
+        if self.is_open:
+            raise CircuitOpenError(self.name, self.retry_in())
+
+    @asynccontextmanager
+    async def guard(
+        self: CircuitBreaker,
+        is_failure: Callable[[Exception], bool] | None = None,
+    ) -> AsyncIterator[None]:
+        """Run one call through the breaker, recording how it went.
+
+        ``is_failure`` decides which exceptions say something about the
+        service's health (by default all of them).
+        """
+        self._admit()
+        start = time.monotonic()
+        failed: bool | None = None
+        try:
+            yield
+            failed = False
+        except Exception as e:
+            failed = is_failure(e) if is_failure else True
+            raise
+        finally:
+            if failed is None:
+                # Cancelled: says nothing about the service
+                self._probing = False
+            else:
+                self._record(time.monotonic() - start, failed)
+
+    def snapshot(self: CircuitBreaker) -> dict[str, Any]:
+        """State and recent statistics, for health reporting."""
+        self._prune(time.monotonic())
+        durations = [duration for _, duration, _ in self._calls]
+        failures = sum(failed for _, _, failed in self._calls)
+        slow = sum(map(self._is_slow, durations))
+        return {
+            "state": self.state.value,
+            "calls": len(durations),
+            "failure_rate": round(failures / len(durations), 3) if durations else 0.0,
+            "slow_call_rate": round(slow / len(durations), 3) if durations else 0.0,
+            "mean_latency": (
+                round(sum(durations) / len(durations), 3) if durations else None
+            ),
+            "max_latency": round(max(durations), 3) if durations else None,
+            "retry_in": (
+                round(self.retry_in(), 1) if self.state == CircuitState.OPEN else None
+            ),
+        }
+
+    def _admit(self: CircuitBreaker) -> None:
+        """Let a call through or raise CircuitOpenError."""
+        self.check()
+        if self.state == CircuitState.OPEN:
+            logger.info(f"{self.name} circuit half-open; probing")
+            self.state = CircuitState.HALF_OPEN
+        if self.state == CircuitState.HALF_OPEN:
+            self._probing = True
+
+    def _is_slow(self: CircuitBreaker, duration: float) -> bool:
+        return duration >= self.settings.slow_call_seconds
+
+    def _record(self: CircuitBreaker, duration: float, failed: bool) -> None:
+        now = time.monotonic()
+        if self.state == CircuitState.HALF_OPEN:
+            self._probing = False
+            if failed or self._is_slow(duration):
+                self._open(now)
+            else:
+                logger.info(f"{self.name} circuit closed")
+                self.state = CircuitState.CLOSED
+                self._calls.clear()
+            return
+
+        self._calls.append((now, duration, failed))
+        self._prune(now)
+        calls = len(self._calls)
+        failures = sum(failed for _, _, failed in self._calls)
+        slow = sum(self._is_slow(duration) for _, duration, _ in self._calls)
+        if (
+            self.state == CircuitState.CLOSED
+            and calls >= self.settings.min_calls
+            and (
+                failures / calls >= self.settings.failure_rate
+                or slow / calls >= self.settings.slow_call_rate
+            )
+        ):
+            self._open(now)
+
+    def _open(self: CircuitBreaker, now: float) -> None:
+        logger.warning(
+            f"{self.name} circuit open; failing fast for "
+            f"{self.settings.open_seconds:g}s"
+        )
+        self.state = CircuitState.OPEN
+        self.opened_at = now
+
+    def _prune(self: CircuitBreaker, now: float) -> None:
+        cutoff = now - self.settings.window_seconds
+        while self._calls and self._calls[0][0] < cutoff:
+            self._calls.popleft()
+
+
+class CircuitBreakerRegistry:
+    """The breakers of every configured service, created on first use."""
+
+    def __init__(self: CircuitBreakerRegistry, settings: CircuitBreakerConfig) -> None:
+        """Initialize the registry."""
+        self.settings = settings
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self: CircuitBreakerRegistry, service: str) -> CircuitBreaker | None:
+        """The breaker for a service, or None if it has none configured."""
+        if service not in self.settings.services:
+            return None
+        if service not in self._breakers:
+            self._breakers[service] = CircuitBreaker(service, self.settings)
+        return self._breakers[service]
+
+    def is_open(self: CircuitBreakerRegistry, service: str) -> bool:
+        """Whether calls to a service are currently refused."""
+        breaker = self._breakers.get(service)
+        return breaker is not None and breaker.is_open
+
+    def snapshot(self: CircuitBreakerRegistry) -> dict[str, dict[str, Any]]:
+        """State of every breaker that has seen a call."""
+        return {
+            name: breaker.snapshot() for name, breaker in sorted(self._breakers.items())
+        }
+
+
+@cache
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """The process-wide breaker registry, shared by HTTP and LLM calls."""
+    return CircuitBreakerRegistry(config.circuit_breaker)
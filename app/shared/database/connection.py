@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+import asyncio
+import functools
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.shared.database.models import Base
+from config import config
+from config.database import DatabaseConfig
 from config.paths import get_user_data_dir
 
 # Database configuration
@@ -16,20 +22,62 @@ DB_URL = f"sqlite:///{DB_PATH}"
 # Ensure the directory for the database exists
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-# Create engine with SQLite optimizations
-engine = create_engine(
-    DB_URL,
-    echo=False,  # Set to True for SQL debugging
-    pool_pre_ping=True,
-    connect_args={
-        "check_same_thread": False,  # Allow SQLite to be used across threads
-        "timeout": 20,  # 20 second timeout for database locks
-    },
-)
+
+def apply_sqlite_profile(dbapi_connection: Any, profile: DatabaseConfig) -> None:
+    """Apply the performance pragmas to a raw SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={profile.journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={profile.synchronous}")
+        cursor.execute(f"PRAGMA busy_timeout={int(profile.busy_timeout_ms)}")
+        cursor.execute(f"PRAGMA mmap_size={int(profile.mmap_size)}")
+        # Negative cache_size is in KiB rather than pages
+        cursor.execute(f"PRAGMA cache_size=-{int(profile.cache_size_kib)}")
+        cursor.execute(f"PRAGMA temp_store={profile.temp_store}")
+        cursor.execute(f"PRAGMA foreign_keys={'ON' if profile.foreign_keys else 'OFF'}")
+    finally:
+        cursor.close()
+
+
+def create_db_engine(url: str, profile: DatabaseConfig | None = None) -> Engine:
+    """Create a SQLite engine, optionally tuned with a performance profile.
+
+    The pool holds one connection per reader thread plus one for the writer.
+    """
+    profile = profile or DatabaseConfig()
+    db_engine = create_engine(
+        url,
+        echo=False,  # Set to True for SQL debugging
+        pool_pre_ping=True,
+        pool_size=profile.read_pool_size + 1,
+        max_overflow=4,  # Headroom for sync callers outside the executors
+        connect_args={
+            "check_same_thread": False,  # Allow SQLite to be used across threads
+            "timeout": profile.busy_timeout_ms / 1000,  # Wait for database locks
+        },
+    )
+
+    @event.listens_for(db_engine, "connect")
+    def _on_connect(dbapi_connection: Any, _connection_record: Any) -> None:
+        apply_sqlite_profile(dbapi_connection, profile)
+
+    return db_engine
+
+
+engine = create_db_engine(DB_URL, config.database)
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Dedicated threads for blocking database work, so a slow write or a lock
+# wait never stalls the event loop. SQLite allows a single writer, so writes
+# are serialized on their own thread instead of contending for the lock,
+# while WAL lets the reader threads run alongside it.
+_db_executor = ThreadPoolExecutor(
+    max_workers=config.database.read_pool_size, thread_name_prefix="db"
+)
+_db_write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+
 
 def init_db(engine_to_bind=None) -> None:
     """Initialize the database, creating tables if they don't exist"""
@@ -52,3 +100,27 @@ def get_db_session() -> Generator[Session, None, None]:
         raise
     finally:
         db.close()
+
+
+async def run_db[T](func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking database read off the event loop and await its result.
+
+    Use this from async code for anything that opens a session, e.g.
+    ``await run_db(get_event, event_id=event_id)``. Use ``run_db_write`` for
+    calls that write.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _db_executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+async def run_db_write[T](func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking database write on the single writer thread.
+
+    e.g. ``await run_db_write(save_event, url, data)``.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _db_write_executor, functools.partial(func, *args, **kwargs)
+    )
@@ -7,6 +7,7 @@ from sqlalchemy import (
     JSON,
     Column,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
@@ -98,3 +99,19 @@ class Submission(Base):
 
     def __repr__(self: Submission) -> str:
         return f"<Submission(id={self.id}, service='{self.service_name}', status='{self.status}')>"
+
+
+class StageTimingRecord(Base):
+    """How long one stage of an import took, for latency percentiles"""
+
+    __tablename__ = "stage_timings"
+
+    id: Mapped[int] = Column(Integer, primary_key=True)
+    stage: Mapped[str] = Column(String(100), nullable=False)
+    duration: Mapped[float] = Column(Float, nullable=False)  # seconds
+    recorded_at: Mapped[datetime] = Column(DateTime, default=func.now(), nullable=False)
+
+    __table_args__ = (Index("idx_stage_recorded_at", "stage", "recorded_at"),)
+
+    def __repr__(self: StageTimingRecord) -> str:
+        return f"<StageTimingRecord(stage='{self.stage}', duration={self.duration})>"
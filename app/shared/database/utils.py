@@ -3,14 +3,17 @@ import json
 
 # Log the validation error
 import logging
+from datetime import UTC, datetime, timedelta
 from typing import Any
+from urllib.parse import urlparse
 
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from app.core.schemas import EventData
+from app.core.schemas import EventData, StageTiming
 from app.shared.database.connection import get_db_session
-from app.shared.database.models import Event, Submission
+from app.shared.database.models import Event, StageTimingRecord, Submission
+from app.shared.url_analyzer import URLAnalyzer
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +54,10 @@ def save_event(
                 existing.scraped_data = event_data
                 existing.data_hash = data_hash
                 # updated_at will be set automatically
+            else:
+                # Nothing changed, but the row is confirmed current as of now;
+                # touch updated_at so cache freshness reflects this scrape
+                existing.updated_at = _utcnow()
             return existing
         # Create new event entry
         event = Event(
@@ -96,6 +103,56 @@ def get_event(
         return _get(db_session)
 
 
+def get_fresh_event(
+    url: str, max_age: timedelta, db: Session | None = None
+) -> dict[str, Any] | None:
+    """Get event data by URL only if it was scraped within max_age
+
+    URLs are compared normalized (see URLAnalyzer.normalize), so a stored
+    event is found whichever spelling of its URL it was saved under.
+    """
+    cutoff = _utcnow() - max_age
+    normalized = URLAnalyzer.normalize(url)
+    host = urlparse(normalized).hostname or ""
+
+    def _get(db_session: Session) -> dict[str, Any] | None:
+        candidates = db_session.query(Event).filter(
+            Event.source_url.like(f"%{host}%"), Event.updated_at >= cutoff
+        )
+        for event in candidates:
+            if URLAnalyzer.normalize(event.source_url) == normalized:
+                data = event.scraped_data.copy()
+                data["_db_id"] = event.id
+                return data
+        return None
+
+    if db:
+        return _get(db)
+    with get_db_session() as db_session:
+        return _get(db_session)
+
+
+def save_stage_timings(timings: list[StageTiming], db: Session | None = None) -> None:
+    """Store the stage timings of an import for percentile statistics"""
+
+    def _save(db_session: Session) -> None:
+        db_session.add_all(
+            StageTimingRecord(stage=timing.stage, duration=timing.duration)
+            for timing in timings
+        )
+
+    if db:
+        _save(db)
+        return
+    with get_db_session() as db_session:
+        _save(db_session)
+
+
+def _utcnow() -> datetime:
+    """Naive UTC now, matching what SQLite's CURRENT_TIMESTAMP stores"""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 def get_submission_status(event_id: int, service_name: str) -> Submission | None:
     """Get the latest submission status for an event and service"""
     with get_db_session() as db:
@@ -0,0 +1,217 @@
+"""Hedged requests for services with a long latency tail.
+
+A few upstream lookups (Google CSE, Dice search) usually answer quickly but
+now and then take many times longer, and one such response holds up the
+whole import. For the services listed in ``hedge_services`` HTTPService runs
+its JSON requests through the Hedger: once the request has been outstanding
+for longer than the service's recent p90 latency, the same request is sent
+again and whichever answers first is used.
+
+Hedges cost quota, so a hedge is only sent when the service's rate limit has
+a token to spare and while fewer than ``hedge_max_share`` of its recent
+requests were hedged. When the hedge wins, the original request is left to
+finish in the background so the time it would have taken is known; the
+difference is reported as latency saved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Collection
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# Recent requests per service used for the latency percentile and hedge share
+WINDOW = 200
+
+
+@dataclass
+class HedgeStats:
+    """Recent latencies and hedging outcomes of one service."""
+
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=WINDOW))
+    recent_hedges: deque[bool] = field(default_factory=lambda: deque(maxlen=WINDOW))
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    saved: float = 0.0
+
+    def percentile(self: HedgeStats, p: float) -> float:
+        """The p-th percentile of recent latencies (nearest rank)."""
+        ordered = sorted(self.latencies)
+        return ordered[max(math.ceil(p / 100 * len(ordered)), 1) - 1]
+
+    def hedge_share(self: HedgeStats) -> float:
+        """Share of recent requests that were hedged."""
+        if not self.recent_hedges:
+            return 0.0
+        return sum(self.recent_hedges) / len(self.recent_hedges)
+
+    def note(self: HedgeStats, *, hedged: bool) -> None:
+        """Count a request and whether it was hedged."""
+        self.requests += 1
+        self.hedges += hedged
+        self.recent_hedges.append(hedged)
+
+
+class Hedger:
+    """Sends a second attempt for requests slower than a service's p90."""
+
+    def __init__(
+        self: Hedger,
+        services: Collection[str],
+        percentile: float,
+        max_share: float,
+        min_samples: int,
+    ) -> None:
+        """Start with no latencies seen; nothing is hedged before min_samples."""
+        self.services = services
+        self.percentile = percentile
+        self.max_share = max_share
+        self.min_samples = min_samples
+        self._stats: dict[str, HedgeStats] = {}
+        # Original attempts outrun by their hedge, still finishing
+        self._background: set[asyncio.Task[Any]] = set()
+
+    def enabled_for(self: Hedger, service: str) -> bool:
+        """Whether requests to the service are hedged."""
+        return service in self.services
+
+    def stats(self: Hedger, service: str) -> HedgeStats:
+        """The latency and hedging statistics of a service."""
+        if service not in self._stats:
+            self._stats[service] = HedgeStats()
+        return self._stats[service]
+
+    def delay(self: Hedger, service: str) -> float | None:
+        """How long to wait before hedging, or None not to hedge now."""
+        stats = self.stats(service)
+        if len(stats.latencies) < self.min_samples:
+            return None
+        if stats.hedge_share() >= self.max_share:
+            return None
+        return stats.percentile(self.percentile)
+
+    async def run[T](
+        self: Hedger,
+        service: str,
+        send: Callable[[], Awaitable[T]],
+        may_hedge: Callable[[], bool] = lambda: True,
+    ) -> T:
+        """Run ``send``, racing a second call if the first is slow.
+
+        ``may_hedge`` is asked just before hedging, e.g. whether the rate
+        limit has a token to spare. The first successful result is returned;
+        if both attempts fail, the original attempt's error is raised.
+        """
+        stats = self.stats(service)
+        delay = self.delay(service)
+        primary = asyncio.ensure_future(self._timed(stats, send))
+        try:
+            if delay is not None:
+                await asyncio.wait({primary}, timeout=delay)
+            if delay is None or primary.done() or not may_hedge():
+                stats.note(hedged=False)
+                return await primary
+            stats.note(hedged=True)
+            logger.debug(f"{service} slower than {delay:.2f}s; hedging")
+            return await self._race(service, primary, asyncio.ensure_future(send()))
+        except BaseException:
+            primary.cancel()
+            raise
+
+    async def settle(self: Hedger) -> None:
+        """Wait for outrun original attempts, so their savings are counted."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+    def snapshot(self: Hedger) -> dict[str, dict[str, Any]]:
+        """Hedging statistics of every hedged service that has been used."""
+        return {
+            service: {
+                "requests": stats.requests,
+                "hedges": stats.hedges,
+                "hedge_wins": stats.hedge_wins,
+                "hedge_delay": (
+                    round(stats.percentile(self.percentile), 4)
+                    if len(stats.latencies) >= self.min_samples
+                    else None
+                ),
+                "latency_saved": round(stats.saved, 3),
+            }
+            for service, stats in sorted(self._stats.items())
+        }
+
+    @staticmethod
+    async def _timed[T](stats: HedgeStats, send: Callable[[], Awaitable[T]]) -> T:
+        """Run an original attempt, recording its latency if it succeeds."""
+        start = time.perf_counter()
+        result = await send()
+        stats.latencies.append(time.perf_counter() - start)
+        return result
+
+    async def _race[T](
+        self: Hedger, service: str, primary: asyncio.Task[T], hedge: asyncio.Task[T]
+    ) -> T:
+        """The first successful result of the original attempt and its hedge."""
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                winner = next((task for task in done if not task.exception()), None)
+                if winner is not None:
+                    break
+            else:
+                raise primary.exception()
+        except BaseException:
+            hedge.cancel()
+            raise
+
+        if winner is primary:
+            hedge.cancel()
+        else:
+            self._hedge_won(service, primary)
+        return winner.result()
+
+    def _hedge_won(self: Hedger, service: str, primary: asyncio.Task[Any]) -> None:
+        """Count a hedge win; measure the saving once the original finishes."""
+        stats = self.stats(service)
+        stats.hedge_wins += 1
+        if primary.done():
+            # The original already failed; the hedge rescued the request
+            return
+        won_at = time.perf_counter()
+
+        def finished(task: asyncio.Task[Any]) -> None:
+            self._background.discard(task)
+            if task.cancelled() or task.exception():
+                return
+            saved = time.perf_counter() - won_at
+            stats.saved += saved
+            logger.info(f"{service} hedge answered {saved:.2f}s sooner")
+
+        self._background.add(primary)
+        primary.add_done_callback(finished)
+
+
+@cache
+def get_hedger() -> Hedger:
+    """The process-wide hedger, shared by all HTTPServices."""
+    http = config.http
+    return Hedger(
+        http.hedge_services,
+        http.hedge_percentile,
+        http.hedge_max_share,
+        http.hedge_min_samples,
+    )
@@ -4,16 +4,19 @@ from __future__ import annotations
 
 import asyncio
 import builtins
+import json
 import logging
 import ssl
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from functools import cache
 from typing import Any, Unpack
 
 import aiohttp
 import certifi
 from aiohttp import BasicAuth, ClientResponse, ClientSession, ClientTimeout
 
+from app.core.deadline import DeadlineExceededError, deadline_passed, time_left
 from app.core.errors import (
     APIError,
     AuthenticationError,
@@ -21,19 +24,67 @@ from app.core.errors import (
     RequestTimeoutError,
     handle_errors_async,
 )
+from app.shared.cassette import get_cassette
+from app.shared.circuit_breaker import get_circuit_breakers
+from app.shared.hedging import Hedger, get_hedger
+from app.shared.http_cache import (
+    CachedResponse,
+    ResponseCache,
+    get_response_cache,
+    parse_cache_control,
+)
+from app.shared.http_leaks import ResponseLeakDetector
+from app.shared.http_telemetry import PoolTelemetry, get_connection_telemetry
+from app.shared.rate_limit import get_rate_limiter, parse_retry_after
 from config import Config, config
 
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _ssl_context() -> ssl.SSLContext:
+    """SSL context trusting certifi's CA bundle, built once per process."""
+    return ssl.create_default_context(cafile=certifi.where())
+
+
 class HTTPService:
     """Centralized HTTP client with session management."""
 
-    def __init__(self: HTTPService, config: Config) -> None:
-        """Initialize HTTP service with configuration."""
+    def __init__(
+        self: HTTPService,
+        config: Config,
+        *,
+        max_connections: int | None = None,
+        max_connections_per_host: int | None = None,
+        pool: str = "default",
+    ) -> None:
+        """Initialize HTTP service with configuration.
+
+        The connection pool limits default to the http config; services with
+        their own session (e.g. image downloads) pass their own, and a pool
+        name to report its connection telemetry under.
+        """
         self.config = config
+        self.max_connections = max_connections or config.http.max_connections
+        self.max_connections_per_host = (
+            max_connections_per_host or config.http.max_keepalive_connections
+        )
         self._session: ClientSession | None = None
         self._lock = asyncio.Lock()
+        self.circuit_breakers = get_circuit_breakers()
+        self.rate_limiter = get_rate_limiter()
+        self.response_cache = get_response_cache()
+        self.cassette = get_cassette()
+        # A hedge would consume recordings meant for later requests
+        self.hedger: Hedger | None = None if self.cassette else get_hedger()
+        self.leak_detector: ResponseLeakDetector | None = None
+        if config.runtime.debug:
+            self.leak_detector = ResponseLeakDetector(config.http.response_leak_seconds)
+        self.telemetry: PoolTelemetry | None = None
+        if config.http.connection_telemetry_enabled:
+            self.telemetry = get_connection_telemetry().pool(
+                pool, self.max_connections, self.max_connections_per_host
+            )
 
     async def _ensure_session(self: HTTPService) -> ClientSession:
         """Ensure a session exists, creating one if needed."""
@@ -41,22 +92,35 @@ class HTTPService:
             async with self._lock:
                 if self._session is None or self._session.closed:
                     timeout = ClientTimeout(total=self.config.http.timeout)
-                    ssl_context = ssl.create_default_context(cafile=certifi.where())
                     connector = aiohttp.TCPConnector(
-                        limit=self.config.http.max_connections,
-                        limit_per_host=self.config.http.max_keepalive_connections,
-                        ssl=ssl_context,
+                        limit=self.max_connections,
+                        limit_per_host=self.max_connections_per_host,
+                        ssl=_ssl_context(),
+                        use_dns_cache=self.config.http.dns_cache_ttl != 0,
+                        ttl_dns_cache=self.config.http.dns_cache_ttl,
+                        keepalive_timeout=self.config.http.keepalive_timeout,
                     )
                     self._session = ClientSession(
                         timeout=timeout,
                         connector=connector,
                         headers={"User-Agent": self.config.http.user_agent},
+                        trace_configs=self._trace_configs(),
                     )
                     logger.debug("Created new HTTP session")
         return self._session
 
+    def _trace_configs(self: HTTPService) -> list[aiohttp.TraceConfig]:
+        """Trace hooks for a new session: telemetry and leak detection."""
+        return [
+            hooks.trace_config()
+            for hooks in (self.telemetry, self.leak_detector)
+            if hooks is not None
+        ]
+
     async def close(self: HTTPService) -> None:
         """Close the HTTP session."""
+        if self.leak_detector:
+            self.leak_detector.report("session closed")
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
@@ -86,13 +150,59 @@ class HTTPService:
         if status == 401 and service in ["Ticketmaster", "Zyte", "TicketFairy"]:
             raise AuthenticationError(service)
         if status == 429:
-            retry_after = response.headers.get("Retry-After")
-            retry_seconds = int(retry_after) if retry_after else None
+            retry_seconds = parse_retry_after(response.headers.get("Retry-After"))
+            self.rate_limiter.pause(service, retry_seconds)
             raise RateLimitError(service, retry_seconds)
         if status >= 400:
             message = error_text or f"HTTP {status}"
             raise APIError(service, message, status)
 
+    def _cache_for(self: HTTPService, service: str) -> ResponseCache | None:
+        """The response cache, if the service has opted in to it."""
+        if self.response_cache and self.response_cache.enabled_for(service):
+            return self.response_cache
+        return None
+
+    @staticmethod
+    def _servable(entry: CachedResponse | None, headers: dict[str, str] | None) -> bool:
+        """Whether a stored response answers the request without the network."""
+        cache_control = parse_cache_control((headers or {}).get("Cache-Control"))
+        return entry is not None and entry.fresh and "no-cache" not in cache_control
+
+    def _timeout(self: HTTPService, timeout: float | None) -> ClientTimeout:
+        """Request timeout, shortened to what is left of the import deadline."""
+        return ClientTimeout(total=time_left(timeout or self.config.http.timeout))
+
+    @staticmethod
+    def _is_outage(error: Exception) -> bool:
+        """Whether an error says the service is unhealthy, not the request bad.
+
+        A timeout only counts if the service's own timeout ran out, not one
+        shortened to what was left of the import deadline.
+        """
+        if isinstance(error, RequestTimeoutError):
+            return not deadline_passed()
+        if isinstance(error, APIError):
+            return error.status_code is None or error.status_code >= 500
+        return False
+
+    @asynccontextmanager
+    async def _upstream(
+        self: HTTPService,
+        service: str,
+        url: str,
+    ) -> AsyncGenerator[None, None]:
+        """Scope of one request: circuit breaker, rate limit, error handling."""
+        breaker = self.circuit_breakers.get(service)
+        guard: AbstractAsyncContextManager[None] = nullcontext()
+        if breaker:
+            # Fail fast before waiting for a rate limit slot
+            breaker.check()
+            guard = breaker.guard(self._is_outage)
+        await self.rate_limiter.acquire(service)
+        async with guard, self._error_handler(service, url):
+            yield
+
     @asynccontextmanager
     async def _error_handler(
         self: HTTPService,
@@ -102,6 +212,8 @@ class HTTPService:
         """Context manager for consistent error handling."""
         try:
             yield
+        except DeadlineExceededError:
+            raise
         except builtins.TimeoutError as e:
             logger.debug(f"{service} timeout for URL: {url}")
             error_msg = f"{service} request timed out"
@@ -113,29 +225,36 @@ class HTTPService:
             logger.debug(f"{service} unexpected error for URL {url}: {e}")
             raise
 
-    @handle_errors_async(reraise=True)
-    async def head(
+    @asynccontextmanager
+    async def stream(
         self: HTTPService,
+        method: str,
         url: str,
         *,
         service: str = "HTTP",
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
         timeout: float | None = None,
+        raise_for_status: bool = True,
         **kwargs: Unpack[dict[str, Any]],
-    ) -> ClientResponse:
-        """Perform HEAD request with error handling.
+    ) -> AsyncGenerator[ClientResponse, None]:
+        """Send a request and yield the response, releasing it on exit.
+
+        The body is left for the caller to read (or not) inside the block;
+        leaving the block always returns the connection to the pool.
 
         Args:
+            method: HTTP method
             url: URL to request
             service: Service name for error messages
             headers: Additional headers
             params: Query parameters
             timeout: Override default timeout
+            raise_for_status: Whether to raise an exception for 4xx/5xx codes
             **kwargs: Additional arguments for aiohttp
 
-        Returns:
-            The response object
+        Yields:
+            The response object, valid until the block exits
 
         Raises:
             APIError: On API errors
@@ -143,32 +262,41 @@ class HTTPService:
 
         """
         session = await self._ensure_session()
+        request_timeout = self._timeout(timeout)
 
-        request_headers = {}
-        if headers:
-            request_headers.update(headers)
-
-        request_timeout = ClientTimeout(total=timeout or self.config.http.timeout)
-
-        async with self._error_handler(service, url):
-            logger.debug(f"{service} HEAD: {url}")
+        async with self._upstream(service, url):
+            logger.debug(f"{service} {method}: {url}")
 
-            response = await session.head(
+            async with self._send(
+                session,
+                method,
                 url,
-                headers=request_headers,
+                headers=headers,
                 params=params,
                 timeout=request_timeout,
-                allow_redirects=True,
+                trace_request_ctx={"service": service},
                 **kwargs,
-            )
+            ) as response:
+                if raise_for_status and response.status >= 400:
+                    error_text = await response.text()
+                    self._handle_response_error(response, service, error_text)
 
-            if response.status >= 400:
-                self._handle_response_error(response, service)
+                yield response
 
-            return response
+    def _send(
+        self: HTTPService,
+        session: ClientSession,
+        method: str,
+        url: str,
+        **kwargs: Unpack[dict[str, Any]],
+    ) -> AbstractAsyncContextManager[ClientResponse]:
+        """Send a request over the network, or through the cassette if active."""
+        if self.cassette:
+            return self.cassette.exchange(session.request, method, url, **kwargs)
+        return session.request(method, url, **kwargs)
 
     @handle_errors_async(reraise=True)
-    async def get(
+    async def head(
         self: HTTPService,
         url: str,
         *,
@@ -178,7 +306,7 @@ class HTTPService:
         timeout: float | None = None,
         **kwargs: Unpack[dict[str, Any]],
     ) -> ClientResponse:
-        """Perform GET request with error handling.
+        """Perform HEAD request with error handling.
 
         Args:
             url: URL to request
@@ -189,37 +317,65 @@ class HTTPService:
             **kwargs: Additional arguments for aiohttp
 
         Returns:
-            The response object
+            The response object, already released
 
         Raises:
             APIError: On API errors
             TimeoutError: On timeout
 
         """
-        session = await self._ensure_session()
-
-        request_headers = {}
-        if headers:
-            request_headers.update(headers)
+        async with self.stream(
+            "HEAD",
+            url,
+            service=service,
+            headers=headers,
+            params=params,
+            timeout=timeout,
+            allow_redirects=True,
+            **kwargs,
+        ) as response:
+            return response
 
-        request_timeout = ClientTimeout(total=timeout or self.config.http.timeout)
+    @handle_errors_async(reraise=True)
+    async def get(
+        self: HTTPService,
+        url: str,
+        *,
+        service: str = "HTTP",
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        **kwargs: Unpack[dict[str, Any]],
+    ) -> ClientResponse:
+        """Perform GET request with error handling.
 
-        async with self._error_handler(service, url):
-            logger.debug(f"{service} GET: {url}")
+        Args:
+            url: URL to request
+            service: Service name for error messages
+            headers: Additional headers
+            params: Query parameters
+            timeout: Override default timeout
+            **kwargs: Additional arguments for aiohttp
 
-            response = await session.get(
-                url,
-                headers=request_headers,
-                params=params,
-                timeout=request_timeout,
-                **kwargs,
-            )
+        Returns:
+            The response object, with its body read and connection released
 
-            if response.status >= 400:
-                error_text = await response.text()
-                self._handle_response_error(response, service, error_text)
+        Raises:
+            APIError: On API errors
+            TimeoutError: On timeout
 
-            return response
+        """
+        async with self.stream(
+            "GET",
+            url,
+            service=service,
+            headers=headers,
+            params=params,
+            timeout=timeout,
+            **kwargs,
+        ) as response:
+            await response.read()
+        return response
 
     @handle_errors_async(reraise=True)
     async def post(
@@ -247,46 +403,97 @@ class HTTPService:
             **kwargs: Additional arguments for aiohttp
 
         Returns:
-            The response object
+            The response object, with its body read and connection released
 
         Raises:
             APIError: On API errors
             TimeoutError: On timeout
 
         """
-        session = await self._ensure_session()
-
-        request_headers = {}
-        if headers:
-            request_headers.update(headers)
-
-        request_timeout = ClientTimeout(total=timeout or self.config.http.timeout)
-
         # Allow auth to be passed via kwargs and handle it
         auth = kwargs.get("auth")
         if auth and isinstance(auth, tuple):
             kwargs["auth"] = BasicAuth(*auth)
 
-        async with self._error_handler(service, url):
-            logger.debug(f"POST to {url} with timeout {request_timeout}s")
+        async with self.stream(
+            "POST",
+            url,
+            service=service,
+            headers=headers,
+            json=json,
+            data=data,
+            timeout=timeout,
+            raise_for_status=raise_for_status,
+            **kwargs,
+        ) as response:
+            await response.read()
+        return response
+
+    @handle_errors_async(reraise=True)
+    async def get_json(
+        self: HTTPService,
+        url: str,
+        *,
+        service: str = "HTTP",
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        **kwargs: Unpack[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """GET request that returns JSON.
+
+        Requests to services listed in ``hedge_services`` are hedged
+        (see app/shared/hedging.py).
+
+        Args:
+            url: URL to request
+            service: Service name for error messages
+            headers: Additional headers
+            params: Query parameters
+            timeout: Override default timeout
+            **kwargs: Additional arguments for get()
 
-            response = await session.post(
+        Returns:
+            Parsed JSON response
+
+        """
+        if cache := self._cache_for(service):
+            body = await self._get_cached(
+                cache,
                 url,
-                headers=request_headers,
-                json=json,
-                data=data,
-                timeout=request_timeout,
+                service=service,
+                headers=headers,
+                params=params,
+                timeout=timeout,
                 **kwargs,
             )
+            return json.loads(body)
 
-            if raise_for_status and response.status >= 400:
-                error_text = await response.text()
-                self._handle_response_error(response, service, error_text)
-
-            return response
+        async def send() -> dict[str, Any]:
+            response = await self.get(
+                url,
+                service=service,
+                headers=headers,
+                params=params,
+                timeout=timeout,
+                **kwargs,
+            )
+            return await response.json()
+
+        return await self._hedged(service, send)
+
+    async def _hedged[T](
+        self: HTTPService, service: str, send: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run a request, hedged if the service is configured for it."""
+        if self.hedger is None or not self.hedger.enabled_for(service):
+            return await send()
+        return await self.hedger.run(
+            service, send, lambda: self.rate_limiter.available(service)
+        )
 
     @handle_errors_async(reraise=True)
-    async def get_json(
+    async def get_text(
         self: HTTPService,
         url: str,
         *,
@@ -295,8 +502,8 @@ class HTTPService:
         params: dict[str, Any] | None = None,
         timeout: float | None = None,
         **kwargs: Unpack[dict[str, Any]],
-    ) -> dict[str, Any]:
-        """GET request that returns JSON.
+    ) -> str:
+        """GET request that returns the decoded body.
 
         Args:
             url: URL to request
@@ -307,7 +514,7 @@ class HTTPService:
             **kwargs: Additional arguments for get()
 
         Returns:
-            Parsed JSON response
+            Response body as text
 
         """
         response = await self.get(
@@ -318,7 +525,35 @@ class HTTPService:
             timeout=timeout,
             **kwargs,
         )
-        return await response.json()
+        return await response.text()
+
+    async def _get_cached(
+        self: HTTPService,
+        cache: ResponseCache,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        **kwargs: Unpack[dict[str, Any]],
+    ) -> bytes:
+        """GET a response body through the persistent response cache."""
+        key = cache.key("GET", url, params, headers)
+        entry = await cache.get(key)
+        if self._servable(entry, headers):
+            cache.hits += 1
+            return entry.body
+
+        request_headers = {**(headers or {}), **(entry.validators() if entry else {})}
+        response = await self.get(url, headers=request_headers, params=params, **kwargs)
+        if response.status == 304 and entry:
+            await cache.refresh(key, entry, response.headers)
+            return entry.body
+        body = await response.read()
+
+        cache.misses += 1
+        if response.status == 200:
+            await cache.store(key, response.headers, body)
+        return body
 
     @handle_errors_async(reraise=True)
     async def post_json(
@@ -334,6 +569,9 @@ class HTTPService:
     ) -> dict[str, Any]:
         """POST request that returns JSON.
 
+        Requests to services listed in ``hedge_services`` are hedged
+        (see app/shared/hedging.py).
+
         Args:
             url: URL to request
             service: Service name for error messages
@@ -347,16 +585,20 @@ class HTTPService:
             Parsed JSON response
 
         """
-        response = await self.post(
-            url,
-            service=service,
-            headers=headers,
-            json=json,
-            data=data,
-            timeout=timeout,
-            **kwargs,
-        )
-        return await response.json()
+
+        async def send() -> dict[str, Any]:
+            response = await self.post(
+                url,
+                service=service,
+                headers=headers,
+                json=json,
+                data=data,
+                timeout=timeout,
+                **kwargs,
+            )
+            return await response.json()
+
+        return await self._hedged(service, send)
 
     @handle_errors_async(reraise=True)
     async def download(
@@ -369,9 +611,13 @@ class HTTPService:
         timeout: float | None = None,
         verify_ssl: bool = True,
         **kwargs: Unpack[dict[str, Any]],
-    ) -> bytes:
+    ) -> memoryview:
         """Download binary content from a URL.
 
+        The body is read into a single buffer and returned as a read-only
+        view of it; pass the view on (Pillow, base64, hashing) instead of
+        converting it to bytes, which would copy it.
+
         Args:
             url: URL to download from
             service: Service name for error messages
@@ -382,7 +628,7 @@ class HTTPService:
             **kwargs: Additional arguments for aiohttp
 
         Returns:
-            The downloaded data
+            A memoryview of the downloaded data
 
         Raises:
             APIError: On API errors
@@ -393,35 +639,65 @@ class HTTPService:
         if not headers:
             headers = {"User-Agent": self.config.http.user_agent}
 
-        async with self._error_handler(service, url):
-            session = await self._ensure_session()
-            async with session.get(
-                url,
-                headers=headers,
-                timeout=timeout or self.config.http.timeout,
-                ssl=verify_ssl,
-                **kwargs,
-            ) as response:
-                self._handle_response_error(response, service)
-
-                content_length = response.headers.get("Content-Length")
-                if content_length and max_size:
-                    size = int(content_length)
-                    if size > max_size:
-                        error_msg = (
-                            f"Response too large: {size} bytes (max: {max_size} bytes)"
-                        )
-                        raise ValueError(error_msg)
-
-                # Download with size limit
-                data = bytearray()
-                async for chunk in response.content.iter_chunked(8192):
-                    data.extend(chunk)
-                    if max_size and len(data) > max_size:
-                        error_msg = f"Response too large: {len(data)} bytes (max: {max_size} bytes)"
-                        raise ValueError(error_msg)
-
-        return bytes(data)
+        cache = self._cache_for(service)
+        key = cache.key("GET", url, headers=headers) if cache else ""
+        entry = await cache.get(key) if cache else None
+        if self._servable(entry, headers):
+            cache.hits += 1
+            return memoryview(entry.body)
+        if entry:
+            headers = {**headers, **entry.validators()}
+
+        async with self.stream(
+            "GET",
+            url,
+            service=service,
+            headers=headers,
+            timeout=timeout,
+            raise_for_status=False,
+            ssl=verify_ssl,
+            **kwargs,
+        ) as response:
+            self._handle_response_error(response, service)
+            if response.status == 304 and entry:
+                await cache.refresh(key, entry, response.headers)
+                return memoryview(entry.body)
+            data = await self._read_limited(response, max_size)
+
+        if cache:
+            cache.misses += 1
+            if response.status == 200:
+                await cache.store(key, response.headers, data)
+        return data
+
+    @staticmethod
+    async def _read_limited(
+        response: ClientResponse, max_size: int | None
+    ) -> memoryview:
+        """Read a response body into one buffer, refusing anything over max_size.
+
+        A Content-Length within max_size sizes the buffer up front and chunks
+        are written into it in place; otherwise it grows as chunks arrive.
+        The body is returned as a view of that buffer, never copied again.
+        """
+        content_length = response.headers.get("Content-Length")
+        size = int(content_length) if content_length else 0
+        if size and max_size and size > max_size:
+            error_msg = f"Response too large: {size} bytes (max: {max_size} bytes)"
+            raise ValueError(error_msg)
+
+        # Only a length checked against max_size is trusted for allocation
+        buffer = bytearray(size if max_size else 0)
+        filled = 0
+        async for chunk in response.content.iter_any():
+            end = filled + len(chunk)
+            if max_size and end > max_size:
+                error_msg = f"Response too large: {end} bytes (max: {max_size} bytes)"
+                raise ValueError(error_msg)
+            # In place while the buffer has room, extends it past the end
+            buffer[filled:end] = chunk
+            filled = end
+        return memoryview(buffer)[:filled].toreadonly()
 
 
 # Global HTTP service instance
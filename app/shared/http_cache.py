@@ -0,0 +1,274 @@
+"""Persistent HTTP response cache with conditional revalidation.
+
+Successful GET responses from opted-in services are kept in a small SQLite
+file. Fresh entries (per the response's Cache-Control max-age or Expires) are
+served without touching the network; stale ones with an ETag or
+Last-Modified are revalidated, so an unchanged resource costs a 304 instead of
+a full transfer. The file is bounded in size and evicts least recently used
+entries first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Buffer, Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# Request headers that change the response and so are part of the cache key
+KEY_HEADERS = ("accept", "accept-language", "authorization")
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """Parse a Cache-Control header into lowercased directives."""
+    directives: dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _max_age(headers: Mapping[str, str]) -> float | None:
+    """How long a response may be served without revalidation, if stated."""
+    directives = parse_cache_control(headers.get("Cache-Control"))
+    if "no-cache" in directives:
+        return 0.0
+    if directives.get("max-age"):
+        try:
+            return max(float(directives["max-age"]), 0.0)
+        except ValueError:
+            return 0.0
+    if expires := headers.get("Expires"):
+        try:
+            return max(parsedate_to_datetime(expires).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return 0.0
+    return None
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body and what is needed to reuse or revalidate it."""
+
+    body: Buffer
+    stored_at: float
+    max_age: float | None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def fresh(self: CachedResponse) -> bool:
+        """Whether the response can be served without asking the origin."""
+        return bool(self.max_age) and time.time() - self.stored_at < self.max_age
+
+    def validators(self: CachedResponse) -> dict[str, str]:
+        """Conditional request headers for revalidating this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Size-bounded, LRU-evicted store of HTTP responses on disk."""
+
+    def __init__(
+        self: ResponseCache,
+        path: Path,
+        max_bytes: int,
+        services: set[str] | frozenset[str],
+    ) -> None:
+        """Initialize the cache; the file is created on first use."""
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.services = frozenset(services)
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._ready = False
+
+    def enabled_for(self: ResponseCache, service: str) -> bool:
+        """Whether responses for a service are cached."""
+        return service in self.services
+
+    @staticmethod
+    def key(
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> str:
+        """Cache key for a request: method, URL, params and keyed headers."""
+        lowered = {name.lower(): value for name, value in (headers or {}).items()}
+        material = [
+            method.upper(),
+            url,
+            sorted((str(k), str(v)) for k, v in (params or {}).items()),
+            [lowered.get(name) for name in KEY_HEADERS],
+        ]
+        return hashlib.sha256(json.dumps(material).encode()).hexdigest()
+
+    def stats(self: ResponseCache) -> dict[str, int]:
+        """Hit, miss and revalidation counts since startup."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+        }
+
+    async def get(self: ResponseCache, key: str) -> CachedResponse | None:
+        """Look up a stored response, marking it recently used."""
+        try:
+            return await asyncio.to_thread(self._get, key)
+        except sqlite3.Error:
+            logger.warning("HTTP cache lookup failed", exc_info=True)
+            return None
+
+    async def store(
+        self: ResponseCache, key: str, headers: Mapping[str, str], body: Buffer
+    ) -> None:
+        """Store a 200 response if its headers allow it to be reused."""
+        if "no-store" in parse_cache_control(headers.get("Cache-Control")):
+            return
+        entry = CachedResponse(
+            body=body,
+            stored_at=time.time(),
+            max_age=_max_age(headers),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        # Nothing to gain from a response we could neither reuse nor revalidate
+        if not entry.max_age and not entry.validators():
+            return
+        if len(body) > self.max_bytes:
+            return
+        await self._write(self._put, key, entry)
+
+    async def refresh(
+        self: ResponseCache,
+        key: str,
+        entry: CachedResponse,
+        headers: Mapping[str, str],
+    ) -> None:
+        """Restart an entry's freshness after the origin answered 304."""
+        self.revalidations += 1
+        entry.stored_at = time.time()
+        entry.max_age = _max_age(headers)
+        entry.etag = headers.get("ETag", entry.etag)
+        entry.last_modified = headers.get("Last-Modified", entry.last_modified)
+        await self._write(self._put, key, entry)
+
+    async def _write(self: ResponseCache, func: Any, *args: Any) -> None:  # noqa: ANN401
+        """Run a write in a thread; a failing cache never fails the request."""
+        try:
+            await asyncio.to_thread(func, *args)
+        except sqlite3.Error:
+            logger.warning("HTTP cache write failed", exc_info=True)
+
+    def _connect(self: ResponseCache) -> sqlite3.Connection:
+        """Open the cache file, creating the table on first use."""
+        if not self._ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5)
+        if not self._ready:
+            with connection:
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS responses (
+                        key TEXT PRIMARY KEY,
+                        body BLOB NOT NULL,
+                        size INTEGER NOT NULL,
+                        stored_at REAL NOT NULL,
+                        max_age REAL,
+                        etag TEXT,
+                        last_modified TEXT,
+                        last_access REAL NOT NULL
+                    )
+                    """
+                )
+            self._ready = True
+        return connection
+
+    def _get(self: ResponseCache, key: str) -> CachedResponse | None:
+        connection = self._connect()
+        try:
+            with connection:
+                row = connection.execute(
+                    "SELECT body, stored_at, max_age, etag, last_modified "
+                    "FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute(
+                    "UPDATE responses SET last_access = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        finally:
+            connection.close()
+        return CachedResponse(*row)
+
+    def _put(self: ResponseCache, key: str, entry: CachedResponse) -> None:
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        entry.body,
+                        len(entry.body),
+                        entry.stored_at,
+                        entry.max_age,
+                        entry.etag,
+                        entry.last_modified,
+                        time.time(),
+                    ),
+                )
+                # Drop the least recently used entries beyond the size budget
+                connection.execute(
+                    """
+                    DELETE FROM responses WHERE key IN (
+                        SELECT key FROM (
+                            SELECT key, SUM(size) OVER (
+                                ORDER BY last_access DESC, rowid DESC
+                            ) AS running
+                            FROM responses
+                        ) WHERE running > ?
+                    )
+                    """,
+                    (self.max_bytes,),
+                )
+        finally:
+            connection.close()
+
+
+@cache
+def get_response_cache() -> ResponseCache | None:
+    """The process-wide HTTP response cache, or None when it is disabled.
+
+    Shared by every HTTPService, so its counters cover the whole process.
+    """
+    settings = config.http
+    if not settings.response_cache_enabled:
+        return None
+    return ResponseCache(
+        settings.response_cache_path,
+        settings.response_cache_max_bytes,
+        settings.response_cache_services,
+    )
@@ -0,0 +1,122 @@
+"""Debug-mode detection of leaked HTTP responses.
+
+A response keeps its pooled connection checked out until the body has been
+read or the response is released. Responses that are handed out and then
+forgotten hold their connection until garbage collection, and a handful of
+them is enough to exhaust ``limit_per_host`` so every later request to that
+host queues. In debug mode HTTPService attaches a ResponseLeakDetector to its
+session: it tracks every response, warns about those still unreleased after
+``leak_seconds``, and warns whenever a request has to wait for a connection.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import weakref
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from aiohttp import ClientResponse, ClientSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TrackedResponse:
+    """Where a response came from and when."""
+
+    service: str
+    method: str
+    url: str
+    created_at: float = field(default_factory=time.monotonic)
+
+    def age(self: TrackedResponse) -> float:
+        """Seconds since the response headers arrived."""
+        return time.monotonic() - self.created_at
+
+
+class ResponseLeakDetector:
+    """Track responses of one session and report the unreleased ones."""
+
+    def __init__(self: ResponseLeakDetector, leak_seconds: float) -> None:
+        """Initialize the detector."""
+        self.leak_seconds = leak_seconds
+        self.saturations = 0
+        # Weak keys: tracking must not keep a leaked response alive
+        self._responses: weakref.WeakKeyDictionary[ClientResponse, TrackedResponse] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def trace_config(self: ResponseLeakDetector) -> aiohttp.TraceConfig:
+        """Trace hooks to pass to the ClientSession."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_connection_queued_start.append(self._on_connection_queued)
+        return trace_config
+
+    def track(
+        self: ResponseLeakDetector, response: ClientResponse, service: str
+    ) -> None:
+        """Start tracking a response until its connection is released."""
+        self._responses[response] = TrackedResponse(
+            service, response.method, str(response.url)
+        )
+
+    def unreleased(
+        self: ResponseLeakDetector, older_than: float = 0.0
+    ) -> list[TrackedResponse]:
+        """Responses still holding a connection, oldest first."""
+        return sorted(
+            (
+                tracked
+                for response, tracked in list(self._responses.items())
+                if not response.closed and tracked.age() >= older_than
+            ),
+            key=lambda tracked: tracked.created_at,
+        )
+
+    def report(self: ResponseLeakDetector, reason: str) -> list[TrackedResponse]:
+        """Log every response held longer than leak_seconds."""
+        leaks = self.unreleased(self.leak_seconds)
+        for leak in leaks:
+            logger.warning(
+                f"Unreleased {leak.service} response ({reason}): "
+                f"{leak.method} {leak.url} held for {leak.age():.1f}s"
+            )
+        return leaks
+
+    async def _on_request_start(
+        self: ResponseLeakDetector,
+        _session: ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        context.request = f"{params.method} {params.url}"
+
+    async def _on_request_end(
+        self: ResponseLeakDetector,
+        _session: ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        request_context: dict[str, Any] = context.trace_request_ctx or {}
+        self.track(params.response, request_context.get("service", "HTTP"))
+
+    async def _on_connection_queued(
+        self: ResponseLeakDetector,
+        session: ClientSession,
+        context: SimpleNamespace,
+        _params: aiohttp.TraceConnectionQueuedStartParams,
+    ) -> None:
+        self.saturations += 1
+        connector = session.connector
+        logger.warning(
+            f"Connection pool saturated (limit {connector.limit}, "
+            f"{connector.limit_per_host} per host); {context.request} is waiting "
+            f"with {len(self.unreleased())} responses unreleased"
+        )
+        self.report("pool saturated")
@@ -0,0 +1,273 @@
+"""Per-host connection pool telemetry for HTTPService sessions.
+
+Every HTTPService session reports to the process-wide ConnectionTelemetry
+through aiohttp trace hooks. For each pool (the shared API session, the image
+download session) and upstream host it keeps recent samples of:
+
+- ``dns``: resolving the host name (cache misses only)
+- ``connect``: opening a new connection, TCP and TLS handshake together,
+  since aiohttp has no hook between the two
+- ``ttfb``: from the request headers going out to the response headers
+  arriving
+- ``pool_wait``: waiting for a free connection once the pool is at its limit
+
+along with counts of requests, new and reused connections, DNS cache hits
+and misses and failed requests. The snapshot is served at
+``/api/v1/statistics/connections`` and is what pool limits, DNS cache TTL
+and keepalive timeout should be sized from.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from functools import cache
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from aiohttp import ClientSession
+
+from config import config
+
+PHASES = ("dns", "connect", "ttfb", "pool_wait")
+
+# Image candidates come from arbitrary hosts; only the most recently seen
+# hosts of a pool are kept
+MAX_HOSTS = 100
+
+
+def _summarize(samples: deque[float]) -> dict[str, Any] | None:
+    """Count, mean, p50, p95 and max of timing samples, in seconds."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+
+    def percentile(p: int) -> float:
+        return round(ordered[max(math.ceil(p / 100 * len(ordered)), 1) - 1], 4)
+
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 4),
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "max": round(ordered[-1], 4),
+    }
+
+
+@dataclass
+class HostStats:
+    """Counters and recent phase timings for one upstream host."""
+
+    samples: int
+    requests: int = 0
+    errors: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+    timings: dict[str, deque[float]] = field(default_factory=dict)
+
+    def add(self: HostStats, phase: str, seconds: float) -> None:
+        """Keep a timing sample, dropping the oldest beyond the window."""
+        if phase not in self.timings:
+            self.timings[phase] = deque(maxlen=self.samples)
+        self.timings[phase].append(seconds)
+
+    def snapshot(self: HostStats) -> dict[str, Any]:
+        """Counters and a summary of every phase."""
+        connections = self.new_connections + self.reused_connections
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "reuse_rate": (
+                round(self.reused_connections / connections, 3) if connections else None
+            ),
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+            **{phase: _summarize(self.timings.get(phase, deque())) for phase in PHASES},
+        }
+
+
+class PoolTelemetry:
+    """Trace hooks and per-host statistics for one connection pool.
+
+    Connection setup happens before the request's final URL is known to the
+    hooks (redirects), so DNS, connect and pool-wait results are held on the
+    request's trace context and credited to a host when its headers are sent.
+    """
+
+    def __init__(
+        self: PoolTelemetry, name: str, limit: int, limit_per_host: int, samples: int
+    ) -> None:
+        """Start with no hosts seen."""
+        self.name = name
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.samples = samples
+        self.hosts: OrderedDict[str, HostStats] = OrderedDict()
+
+    def host(self: PoolTelemetry, host: str) -> HostStats:
+        """The statistics of a host, evicting the least recently seen."""
+        stats = self.hosts.get(host)
+        if stats is None:
+            stats = self.hosts[host] = HostStats(self.samples)
+            if len(self.hosts) > MAX_HOSTS:
+                self.hosts.popitem(last=False)
+        else:
+            self.hosts.move_to_end(host)
+        return stats
+
+    def trace_config(self: PoolTelemetry) -> aiohttp.TraceConfig:
+        """Trace hooks to pass to the ClientSession."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_queued_start.append(self._on_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_queued_end)
+        trace_config.on_connection_create_start.append(self._on_create_start)
+        trace_config.on_connection_create_end.append(self._on_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_reuse)
+        trace_config.on_dns_resolvehost_start.append(self._on_dns_start)
+        trace_config.on_dns_resolvehost_end.append(self._on_dns_end)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        trace_config.on_request_headers_sent.append(self._on_headers_sent)
+        trace_config.on_request_redirect.append(self._on_response)
+        trace_config.on_request_end.append(self._on_response)
+        trace_config.on_request_exception.append(self._on_exception)
+        return trace_config
+
+    def snapshot(self: PoolTelemetry) -> dict[str, Any]:
+        """Pool limits and the statistics of every host, busiest first."""
+        hosts = sorted(self.hosts.items(), key=lambda item: -item[1].requests)
+        return {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "hosts": {host: stats.snapshot() for host, stats in hosts},
+        }
+
+    async def _on_request_start(
+        self: PoolTelemetry,
+        _session: ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        context.host = params.url.host or ""
+        context.pending = {}
+        context.counts = {}
+
+    async def _on_queued_start(
+        self: PoolTelemetry, _session: ClientSession, context: SimpleNamespace, _: Any
+    ) -> None:
+        context.queued_at = time.perf_counter()
+
+    async def _on_queued_end(
+        self: PoolTelemetry, _session: ClientSession, context: SimpleNamespace, _: Any
+    ) -> None:
+        context.pending["pool_wait"] = time.perf_counter() - context.queued_at
+
+    async def _on_create_start(
+        self: PoolTelemetry, _session: ClientSession, context: SimpleNamespace, _: Any
+    ) -> None:
+        context.created_at = time.perf_counter()
+
+    async def _on_create_end(
+        self: PoolTelemetry, _session: ClientSession, context: SimpleNamespace, _: Any
+    ) -> None:
+        # Resolving the host happens inside connection creation
+        elapsed = time.perf_counter() - context.created_at
+        context.pending["connect"] = max(elapsed - context.pending.get("dns", 0.0), 0)
+        _count(context, "new_connections")
+
+    async def _on_reuse(
+        self: PoolTelemetry, _session: ClientSession, context: SimpleNamespace, _: Any
+    ) -> None:
+        _count(context, "reused_connections")
+
+    async def _on_dns_start(
+        self: PoolTelemetry, _session: ClientSession, context: SimpleNamespace, _: Any
+    ) -> None:
+        context.resolving_at = time.perf_counter()
+
+    async def _on_dns_end(
+        self: PoolTelemetry, _session: ClientSession, context: SimpleNamespace, _: Any
+    ) -> None:
+        context.pending["dns"] = time.perf_counter() - context.resolving_at
+
+    async def _on_dns_cache_hit(
+        self: PoolTelemetry, _session: ClientSession, context: SimpleNamespace, _: Any
+    ) -> None:
+        _count(context, "dns_cache_hits")
+
+    async def _on_dns_cache_miss(
+        self: PoolTelemetry, _session: ClientSession, context: SimpleNamespace, _: Any
+    ) -> None:
+        _count(context, "dns_cache_misses")
+
+    async def _on_headers_sent(
+        self: PoolTelemetry,
+        _session: ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestHeadersSentParams,
+    ) -> None:
+        context.host = params.url.host or context.host
+        context.sent_at = time.perf_counter()
+        stats = self.host(context.host)
+        stats.requests += 1
+        for counter, count in context.counts.items():
+            setattr(stats, counter, getattr(stats, counter) + count)
+        for phase, seconds in context.pending.items():
+            stats.add(phase, seconds)
+        context.pending = {}
+        context.counts = {}
+
+    async def _on_response(
+        self: PoolTelemetry, _session: ClientSession, context: SimpleNamespace, _: Any
+    ) -> None:
+        sent_at = getattr(context, "sent_at", None)
+        if sent_at is not None:
+            self.host(context.host).add("ttfb", time.perf_counter() - sent_at)
+            context.sent_at = None
+
+    async def _on_exception(
+        self: PoolTelemetry, _session: ClientSession, context: SimpleNamespace, _: Any
+    ) -> None:
+        self.host(context.host).errors += 1
+
+
+def _count(context: SimpleNamespace, counter: str) -> None:
+    context.counts[counter] = context.counts.get(counter, 0) + 1
+
+
+class ConnectionTelemetry:
+    """The telemetry of every connection pool in the process."""
+
+    def __init__(self: ConnectionTelemetry, samples: int) -> None:
+        """Keep up to ``samples`` recent timings per host and phase."""
+        self.samples = samples
+        self._pools: dict[str, PoolTelemetry] = {}
+
+    def pool(
+        self: ConnectionTelemetry, name: str, limit: int, limit_per_host: int
+    ) -> PoolTelemetry:
+        """The telemetry of a named pool; sessions sharing a name share it."""
+        pool = self._pools.get(name)
+        if pool is None:
+            pool = self._pools[name] = PoolTelemetry(
+                name, limit, limit_per_host, self.samples
+            )
+        return pool
+
+    def snapshot(self: ConnectionTelemetry) -> dict[str, dict[str, Any]]:
+        """Statistics of every pool that has been used."""
+        return {name: pool.snapshot() for name, pool in sorted(self._pools.items())}
+
+
+@cache
+def get_connection_telemetry() -> ConnectionTelemetry:
+    """The process-wide connection telemetry, shared by all HTTPServices."""
+    return ConnectionTelemetry(config.http.connection_telemetry_samples)
@@ -0,0 +1,132 @@
+"""Per-upstream request rate limiting.
+
+HTTPService takes a token from the bucket of the ``service=`` it is called
+with before every request, so concurrent imports share one budget per
+provider. A 429 pauses the whole service for its Retry-After period instead
+of letting every in-flight import bounce off the limit on its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from functools import cache
+
+from config import config
+from config.http import RateLimit
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: str | None) -> int | None:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(math.ceil(retry_at - time.time()), 0)
+
+
+class TokenBucket:
+    """Allows ``rate`` requests per second with bursts of up to ``burst``.
+
+    A bucket without a rate never throttles but can still be paused.
+    """
+
+    def __init__(self: TokenBucket, rate: float | None, burst: int = 1) -> None:
+        """Start with a full bucket."""
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        # Waiters queue on the lock, so tokens are handed out in FIFO order
+        self._lock = asyncio.Lock()
+
+    async def acquire(self: TokenBucket) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while (wait := self._reserve()) > 0:
+                await asyncio.sleep(wait)
+
+    def available(self: TokenBucket) -> bool:
+        """Whether a request could be sent right now without waiting."""
+        if self._lock.locked() or time.monotonic() < self.paused_until:
+            return False
+        if self.rate is None:
+            return True
+        elapsed = max(time.monotonic() - self.updated, 0.0)
+        return min(self.burst, self.tokens + elapsed * self.rate) >= 1
+
+    def pause(self: TokenBucket, seconds: float) -> None:
+        """Hold all requests for ``seconds``, then resume from an empty bucket."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+        self.updated = self.paused_until
+
+    def _reserve(self: TokenBucket) -> float:
+        """Take a token, or return how long to wait before trying again."""
+        now = time.monotonic()
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.rate is None:
+            return 0.0
+        elapsed = max(now - self.updated, 0.0)
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Token buckets keyed by HTTPService ``service=`` name."""
+
+    def __init__(
+        self: RateLimiter,
+        limits: Mapping[str, RateLimit],
+        default_pause: float,
+    ) -> None:
+        """Initialize the limiter; buckets are created on first use."""
+        self.limits = limits
+        self.default_pause = default_pause
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self: RateLimiter, service: str) -> TokenBucket:
+        """Get the bucket for a service; unlisted services are not throttled."""
+        if service not in self._buckets:
+            limit = self.limits.get(service)
+            self._buckets[service] = (
+                TokenBucket(limit.rate, limit.burst) if limit else TokenBucket(None)
+            )
+        return self._buckets[service]
+
+    async def acquire(self: RateLimiter, service: str) -> None:
+        """Wait for the service's next request slot."""
+        await self.bucket(service).acquire()
+
+    def available(self: RateLimiter, service: str) -> bool:
+        """Whether the service has a request slot free right now."""
+        return self.bucket(service).available()
+
+    def pause(self: RateLimiter, service: str, retry_after: float | None) -> None:
+        """Back off the whole service after it answered 429."""
+        seconds = retry_after if retry_after is not None else self.default_pause
+        logger.warning(f"{service} rate limited; pausing requests for {seconds}s")
+        self.bucket(service).pause(seconds)
+
+
+@cache
+def get_rate_limiter() -> RateLimiter:
+    """The process-wide rate limiter, shared by all HTTPServices."""
+    return RateLimiter(config.http.rate_limits, config.http.rate_limit_pause)
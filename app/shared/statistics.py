@@ -1,11 +1,15 @@
-from datetime import datetime, timedelta
+import math
+from datetime import UTC, datetime, timedelta
+from itertools import groupby
 from typing import Any
 
 from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 
 from app.shared.database.connection import get_db_session
-from app.shared.database.models import Event, Submission
+from app.shared.database.models import Event, StageTimingRecord, Submission
+
+TIMING_PERCENTILES = (50, 90, 95, 99)
 
 
 class StatisticsService:
@@ -160,15 +164,51 @@ class StatisticsService:
                 "generated_at": datetime.now().isoformat(),
             }
 
+    def get_stage_timings(self, days: int = 7) -> dict[str, Any]:
+        """Get per-stage import latency percentiles (in seconds) over recent days"""
+        # recorded_at is stored as naive UTC
+        cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days)
+        with self._get_session() as db:
+            rows = (
+                db.query(StageTimingRecord.stage, StageTimingRecord.duration)
+                .filter(StageTimingRecord.recorded_at >= cutoff)
+                .order_by(StageTimingRecord.stage, StageTimingRecord.duration)
+                .all()
+            )
+
+        stages = {
+            stage: _summarize_durations([duration for _, duration in group])
+            for stage, group in groupby(rows, key=lambda row: row[0])
+        }
+        return {
+            "period_days": days,
+            "stages": stages,
+            "generated_at": datetime.now().isoformat(),
+        }
+
     def get_detailed_statistics(self) -> dict[str, Any]:
         """Get comprehensive statistics including trends"""
         return {
             **self.get_combined_statistics(),
             "trends": self.get_event_trends(),
             "trends_30_days": self.get_event_trends(30),
+            "stage_timings": self.get_stage_timings(),
         }
 
 
+def _summarize_durations(durations: list[float]) -> dict[str, Any]:
+    """Count, mean, max and nearest-rank percentiles of sorted durations"""
+    summary: dict[str, Any] = {
+        "count": len(durations),
+        "mean": round(sum(durations) / len(durations), 4),
+        "max": round(durations[-1], 4),
+    }
+    for percentile in TIMING_PERCENTILES:
+        rank = max(math.ceil(percentile / 100 * len(durations)), 1)
+        summary[f"p{percentile}"] = round(durations[rank - 1], 4)
+    return summary
+
+
 def get_statistics() -> StatisticsService:
     """Get an instance of the statistics service"""
     return StatisticsService()
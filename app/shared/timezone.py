@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 from typing import Any
+from zoneinfo import ZoneInfo
 
 from app.core.schemas import EventLocation
 
@@ -86,3 +88,36 @@ def get_timezone_from_location(location: EventLocation | dict[str, Any] | None)
             return timezone
 
     return "UTC"
+
+
+def get_timezone_from_offset(
+    start: datetime,
+    location: EventLocation | dict[str, Any] | None = None,
+) -> str | None:
+    """Determine timezone from the UTC offset a start time states.
+
+    The location's timezone is preferred when it has that offset at that
+    time, since it also knows about daylight saving; otherwise the matching
+    fixed-offset Etc/GMT zone is used.
+
+    Args:
+        start: Event start, aware if the source gave an offset
+        location: EventLocation object or dictionary with city, state, country
+
+    Returns:
+        Timezone string in IANA format, or None if the start time has no
+        offset or one without an IANA name (e.g. +05:30)
+    """
+    offset = start.utcoffset()
+    if offset is None:
+        return None
+
+    timezone = get_timezone_from_location(location)
+    if ZoneInfo(timezone).utcoffset(start.replace(tzinfo=None)) == offset:
+        return timezone
+
+    hours, remainder = divmod(offset, timedelta(hours=1))
+    if remainder:
+        return None
+    # Etc/GMT names count hours west of Greenwich, so their sign is inverted
+    return f"Etc/GMT{-hours:+d}" if hours else "UTC"
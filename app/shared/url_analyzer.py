@@ -1,9 +1,14 @@
 """URL analysis for event imports."""
 
-import re
+from collections.abc import Iterable
 from enum import StrEnum
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from app.extraction_agents.registry import RoutingTable, get_agent_registry
+
+# Query parameters that track where a visitor came from, not which event
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid"}
 
 
 class URLType(StrEnum):
@@ -16,7 +21,39 @@ class URLType(StrEnum):
 
 
 class URLAnalyzer:
-    """Simple URL analyzer for routing."""
+    """URL analyzer for routing, backed by the agents' compiled routing table."""
+
+    def __init__(self, routing_table: RoutingTable | None = None) -> None:
+        """Use the given routing table, or the registered agents' routes."""
+        self.routing_table = routing_table or get_agent_registry().routing_table
+
+    @staticmethod
+    def normalize(url: str) -> str:
+        """Normalize a URL so trivially different spellings compare equal.
+
+        Uses https, lowercases the host and drops ``www.``, default ports,
+        fragments, a trailing slash and tracking parameters (``utm_*``,
+        ``fbclid`` and the like). The rest of the query string is kept since
+        it can select the event. The result identifies a page; fetch the URL
+        as given, since not every site answers without ``www.``.
+        """
+        url = url.strip()
+        if not url.lower().startswith(("http://", "https://")):
+            url = "https://" + url
+
+        parsed = urlparse(url)
+        netloc = parsed.netloc.lower().removeprefix("www.")
+        netloc = netloc.removesuffix(":443").removesuffix(":80")
+        path = parsed.path.rstrip("/") or "/"
+        query = urlencode(
+            [
+                (name, value)
+                for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+                if not name.lower().startswith("utm_")
+                and name.lower() not in TRACKING_PARAMS
+            ]
+        )
+        return urlunparse(("https", netloc, path, parsed.params, query, ""))
 
     def analyze(self, url: str) -> dict[str, Any]:
         """Analyze a URL and return routing information.
@@ -25,59 +62,8 @@ class URLAnalyzer:
             Dict with 'type' and any extracted metadata
 
         """
-        # Ensure URL has a scheme
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
+        return self.routing_table.classify(url)
 
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower().replace("www.", "")
-        path = parsed.path
-
-        # Check for Resident Advisor
-        if domain in ["ra.co", "residentadvisor.net"]:
-            # Extract event ID if present
-            match = re.search(r"/events/(\d+)", path)
-            if match:
-                return {"type": URLType.RESIDENT_ADVISOR, "event_id": match.group(1)}
-
-        # Ticketmaster and affiliates
-        ticketmaster_domains = [
-            "ticketmaster.com",
-            "livenation.com",
-            "frontgatetickets.com",
-            "ticketweb.com",
-        ]
-        if any(t_domain in domain for t_domain in ticketmaster_domains):
-            # Regex to find TM/LiveNation event IDs (alphanumeric with dashes)
-            # Example: /event/G5vYZ9v1AUf-G
-            match = re.search(r"/event/([a-zA-Z0-9-]{16,})", path)
-            if match:
-                return {"type": URLType.TICKETMASTER, "event_id": match.group(1)}
-
-            # If no ID is found in the URL, that's okay. The agent can use search.
-            return {"type": URLType.TICKETMASTER}
-
-        # Check for Dice.fm
-        if domain in ["dice.fm"]:
-            # Dice URLs typically look like:
-            # https://dice.fm/event/{id}-{slug}
-            # or https://dice.fm/event/{slug}
-            match = re.search(r"/event/([^/?]+)", path)
-            if match:
-                event_slug = match.group(1)
-
-                # Try to extract ID if it's at the beginning of the slug
-                # Format: {ID}-{slug} where ID is typically alphanumeric
-                id_match = re.match(r"^([a-zA-Z0-9]{6,})-", event_slug)
-                if id_match:
-                    return {
-                        "type": URLType.DICE,
-                        "event_id": id_match.group(1),
-                        "slug": event_slug,
-                    }
-                # Return as dice type but without extracted ID
-                # The agent will use the slug to search for the event ID via API
-                return {"type": URLType.DICE, "slug": event_slug}
-
-        # Everything else is unknown (will be determined by content-type)
-        return {"type": URLType.UNKNOWN}
+    def analyze_many(self, urls: Iterable[str]) -> list[dict[str, Any]]:
+        """Analyze a list of URLs in one pass, preserving order."""
+        return self.routing_table.classify_many(urls)
@@ -6,7 +6,12 @@ from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from config.api import APIConfig
+from config.cassette import CassetteConfig
+from config.circuit_breaker import CircuitBreakerConfig
+from config.database import DatabaseConfig
 from config.http import HTTPConfig
+from config.importer import ImporterConfig
+from config.llm import LLMConfig
 from config.loader import load_config
 from config.paths import get_project_root
 from config.processing import ProcessingConfig
@@ -24,6 +29,21 @@ class Config(BaseSettings):
     # HTTP configurations
     http: HTTPConfig = Field(default_factory=HTTPConfig)
 
+    # Database configurations
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+
+    # Import orchestration configurations
+    importer: ImporterConfig = Field(default_factory=ImporterConfig)
+
+    # Circuit breakers for external services
+    circuit_breaker: CircuitBreakerConfig = Field(default_factory=CircuitBreakerConfig)
+
+    # LLM provider settings
+    llm: LLMConfig = Field(default_factory=LLMConfig)
+
+    # Record/replay of upstream traffic
+    cassette: CassetteConfig = Field(default_factory=CassetteConfig)
+
     # Processing configurations
     processing: ProcessingConfig = Field(default_factory=ProcessingConfig)
 
@@ -0,0 +1,24 @@
+"""Record/replay settings for upstream HTTP traffic."""
+
+from pathlib import Path
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+from config.paths import get_user_data_dir
+
+
+class CassetteConfig(BaseSettings):
+    """Record real upstream exchanges to a cassette file, or replay them."""
+
+    # off: normal operation. record: call upstream services and save every
+    # exchange. replay: answer every request from the cassette, offline.
+    mode: Literal["off", "record", "replay"] = Field("off", alias="CASSETTE_MODE")
+    path: Path = Field(
+        default_factory=lambda: get_user_data_dir() / "cassettes" / "default.json",
+        alias="CASSETTE_PATH",
+    )
+    # Replayed responses wait this multiple of their recorded latency
+    # (0 answers immediately, 1 reproduces the recording)
+    latency_scale: float = Field(0.0, alias="CASSETTE_LATENCY_SCALE")
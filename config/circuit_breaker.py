@@ -0,0 +1,40 @@
+"""Circuit breaker settings for external services."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class CircuitBreakerConfig(BaseSettings):
+    """When to stop calling a failing upstream service, and for how long."""
+
+    # Services with a breaker: HTTPService service= names plus the LLM
+    # providers. Others are always called.
+    services: set[str] = Field(
+        default_factory=lambda: {
+            "Zyte",
+            "RA",
+            "Dice API",
+            "Dice Search",
+            "Ticketmaster",
+            "GoogleImageSearch",
+            "GoogleGenreSearch",
+            "TicketFairy",
+            "Claude",
+            "OpenAI",
+        }
+    )
+
+    # Outcomes from the last window_seconds decide whether a circuit opens:
+    # at least min_calls calls, of which failure_rate or more failed
+    window_seconds: float = 60
+    min_calls: int = 5
+    failure_rate: float = 0.5
+
+    # A service that answers, but slowly, opens its circuit too: calls taking
+    # slow_call_seconds or longer count as slow, and the circuit opens once
+    # slow_call_rate or more of the window's calls were slow
+    slow_call_seconds: float = 60
+    slow_call_rate: float = 0.8
+
+    # How long an open circuit fails fast before letting a probe call through
+    open_seconds: float = 30
@@ -0,0 +1,24 @@
+"""Database (SQLite) performance settings."""
+
+from typing import Literal
+
+from pydantic_settings import BaseSettings
+
+
+class DatabaseConfig(BaseSettings):
+    """SQLite connection profile, applied as pragmas on every new connection."""
+
+    # WAL lets readers run alongside the single writer instead of blocking on it
+    journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = "WAL"
+    # NORMAL is durable in WAL mode except for the last commits on power loss
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    # How long a connection waits for a lock held by another process
+    busy_timeout_ms: int = 20_000
+    mmap_size: int = 256 * 1024 * 1024
+    # Page cache per connection in KiB (passed to SQLite as a negative value)
+    cache_size_kib: int = 64 * 1024
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    foreign_keys: bool = True
+
+    # Pooled connections for readers; all writes are serialized on one thread
+    read_pool_size: int = 4
@@ -1,7 +1,19 @@
 """HTTP configuration settings."""
 
+from pathlib import Path
+
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
+from config.paths import get_user_data_dir
+
+
+class RateLimit(BaseModel):
+    """Token bucket settings for one upstream service."""
+
+    rate: float  # Sustained requests per second
+    burst: int = 1  # Requests that may be sent back to back
+
 
 class HTTPConfig(BaseSettings):
     """HTTP client configurations."""
@@ -15,3 +27,69 @@ class HTTPConfig(BaseSettings):
     max_connections: int = 100
     max_keepalive_connections: int = 30
     user_agent: str = "EventImporter/1.0"
+
+    # Resolved addresses are cached for dns_cache_ttl seconds (None keeps
+    # them for the session's lifetime, 0 resolves every new connection).
+    # Idle pooled connections are closed after keepalive_timeout seconds.
+    dns_cache_ttl: int | None = 300
+    keepalive_timeout: float = 30.0
+
+    # Per-host DNS, connect, time-to-first-byte and pool-wait timings of
+    # every session, served at /api/v1/statistics/connections
+    connection_telemetry_enabled: bool = True
+    connection_telemetry_samples: int = 256
+
+    # Separate, long-lived pool for downloading image candidates, so slow
+    # image hosts never hold connections the API clients need
+    image_max_connections: int = 16
+    image_max_connections_per_host: int = 4
+
+    # In debug mode, responses still holding their pooled connection after
+    # this many seconds are reported as leaks
+    response_leak_seconds: float = 10.0
+
+    # Persistent response cache for GET requests (get_json and download).
+    # Only services listed in response_cache_services use it; entries follow
+    # the origin's Cache-Control and are revalidated with ETag/Last-Modified.
+    response_cache_enabled: bool = False
+    response_cache_path: Path = Field(
+        default_factory=lambda: get_user_data_dir() / "http_cache.db"
+    )
+    response_cache_max_bytes: int = 256 * 1024 * 1024
+    response_cache_services: set[str] = Field(
+        default_factory=lambda: {"Ticketmaster", "Dice API", "ImageValidator"}
+    )
+
+    # Request rate limits, keyed by the service name passed to HTTPService.
+    # Services without an entry are not throttled. A 429 pauses the service
+    # for its Retry-After period (or rate_limit_pause seconds without one).
+    rate_limits: dict[str, RateLimit] = Field(
+        default_factory=lambda: {
+            "Zyte": RateLimit(rate=8, burst=16),
+            "RA": RateLimit(rate=2, burst=4),
+            "Dice API": RateLimit(rate=2, burst=4),
+            "Dice Search": RateLimit(rate=2, burst=4),
+            "Ticketmaster": RateLimit(rate=5, burst=5),
+            "GoogleImageSearch": RateLimit(rate=1, burst=5),
+            "GoogleGenreSearch": RateLimit(rate=1, burst=5),
+            "TicketFairy": RateLimit(rate=2, burst=4),
+        }
+    )
+    rate_limit_pause: float = 30
+
+    # Hedged requests (get_json/post_json only). For the services listed, a
+    # request still unanswered after the service's recent hedge_percentile
+    # latency is sent once more and the first answer wins. Only list
+    # services whose requests are safe to send twice. A hedge is skipped
+    # when the service's rate limit has no token to spare, or once
+    # hedge_max_share of its recent requests were hedged.
+    hedge_services: set[str] = Field(
+        default_factory=lambda: {
+            "GoogleImageSearch",
+            "GoogleGenreSearch",
+            "Dice Search",
+        }
+    )
+    hedge_percentile: float = 90
+    hedge_max_share: float = 0.1
+    hedge_min_samples: int = 20
@@ -0,0 +1,49 @@
+"""Import orchestration settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ImporterConfig(BaseSettings):
+    """Configuration for import orchestration (batching and caching)."""
+
+    # Maximum number of imports running at once in a batch
+    batch_concurrency: int = 8
+
+    # Per-source caps, keyed by the source bucket an URL routes to.
+    # Anything that is not a first-party API source is scraped through Zyte
+    # and shares the "web" bucket.
+    source_concurrency: dict[str, int] = Field(
+        default_factory=lambda: {
+            "ra.co": 2,
+            "dice.fm": 4,
+            "ticketmaster.com": 4,
+            "web": 4,
+        }
+    )
+
+    # How long (in seconds) an imported event is served straight from the
+    # database before a re-import goes back to the source, per source bucket.
+    # Sources without an entry (or with 0) are never served from cache.
+    cache_ttl: dict[str, int] = Field(
+        default_factory=lambda: {
+            "ra.co": 6 * 3600,
+            "dice.fm": 6 * 3600,
+            "ticketmaster.com": 6 * 3600,
+            "web": 24 * 3600,
+        }
+    )
+
+    # How long (in seconds) the content type probed for a host and path
+    # pattern is reused when picking between the web and image agents
+    probe_cache_ttl: int = 3600
+    probe_cache_size: int = 2048
+
+    # How long (in seconds) the cheapest page fetch tier that worked for a
+    # domain is remembered, so later web imports start there
+    fetch_tier_cache_ttl: int = 24 * 3600
+    fetch_tier_cache_size: int = 2048
+
+    # Visible text an unrendered page needs before it is used without
+    # rendering it in a browser (pages with JSON-LD event data always are)
+    fetch_min_text_length: int = 500
@@ -0,0 +1,25 @@
+"""LLM provider settings."""
+
+from pathlib import Path
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+from config.paths import get_user_data_dir
+
+
+class LLMConfig(BaseSettings):
+    """Settings shared by the Claude and OpenAI providers."""
+
+    # Persistent cache of LLM responses, keyed by provider, model,
+    # temperature, tool schema and prompt (or image). Identical calls during
+    # re-imports, rebuild previews and retries are answered from it. Entries
+    # expire after cache_ttl seconds; least recently used ones are evicted
+    # beyond cache_max_bytes.
+    cache_enabled: bool = Field(False, alias="LLM_CACHE_ENABLED")
+    cache_path: Path = Field(
+        default_factory=lambda: get_user_data_dir() / "llm_cache.db",
+        alias="LLM_CACHE_PATH",
+    )
+    cache_ttl: float = 7 * 24 * 3600
+    cache_max_bytes: int = 64 * 1024 * 1024
@@ -7,4 +7,5 @@ class ProcessingConfig(BaseSettings):
     """Configuration for data processing rules."""
 
     long_description_min_length: int = 200
+    long_description_max_length: int = 500
     short_description_max_length: int = 100
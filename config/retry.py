@@ -9,6 +9,11 @@ class RetryConfig(BaseSettings):
     max_attempts: int = 3
     delay: float = 1.0
     backoff: float = 2.0
+    jitter: float = 0.5  # Up to this many random seconds added to each wait
+
+    # Shared by every retry and LLM provider fallback within one import
+    budget_retries: int = 6
+    budget_sleep: float = 20.0
 
 
 def get_retry_config() -> RetryConfig:
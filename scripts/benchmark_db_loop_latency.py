@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Measure event loop latency while concurrent imports persist events.
+
+Runs the same simulated import workload twice against a throwaway SQLite
+database: once calling ``save_event`` directly on the event loop (the old
+behaviour) and once through ``run_db``. A probe task sleeps in short intervals
+and records how late it wakes up, which is how long the loop was blocked.
+
+Usage:
+    uv run python scripts/benchmark_db_loop_latency.py --imports 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.shared.database.connection import run_db
+from app.shared.database.models import Base
+from app.shared.database.utils import save_event
+
+PROBE_INTERVAL = 0.005
+
+
+def _event_data(i: int) -> dict:
+    return {
+        "title": f"Benchmark Event {i}",
+        "venue": "Benchmark Hall",
+        "date": "2026-01-01",
+        "lineup": [f"Artist {n}" for n in range(10)],
+        "long_description": "x" * 2000,
+        "source_url": f"https://example.com/event/{i}",
+    }
+
+
+def _session_scope(db_path: Path) -> Callable:
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False, "timeout": 20},
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+
+    @contextmanager
+    def scope() -> Generator[Session, None, None]:
+        db = factory()
+        try:
+            yield db
+            db.commit()
+        finally:
+            db.close()
+
+    return scope
+
+
+def _hold_write_lock(scope: Callable, seconds: float, stop: threading.Event) -> None:
+    """Simulate a slow writer (e.g. a bulk submission) holding the lock."""
+    while not stop.is_set():
+        with scope() as db:
+            db.execute(text("BEGIN IMMEDIATE"))
+            time.sleep(seconds)
+        time.sleep(seconds)
+
+
+async def _probe(lags: list[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(loop.time() - start - PROBE_INTERVAL)
+
+
+async def _run(mode: str, scope: Callable, imports: int, concurrency: int) -> dict:
+    def persist(i: int) -> None:
+        with scope() as db:
+            save_event(f"https://example.com/event/{mode}/{i}", _event_data(i), db=db)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def simulated_import(i: int) -> None:
+        async with semaphore:
+            await asyncio.sleep(0.01)  # stand-in for network / LLM time
+            if mode == "blocking":
+                persist(i)
+            else:
+                await run_db(persist, i)
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(simulated_import(i) for i in range(imports)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    return {
+        "mode": mode,
+        "elapsed": elapsed,
+        "p50": statistics.median(lags_ms),
+        "p99": lags_ms[int(len(lags_ms) * 0.99) - 1],
+        "max": lags_ms[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--imports", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument(
+        "--lock-ms",
+        type=float,
+        default=50,
+        help="How long a background writer holds the write lock (0 to disable)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scope = _session_scope(Path(tmp) / "bench.db")
+        stop = threading.Event()
+        if args.lock_ms:
+            threading.Thread(
+                target=_hold_write_lock,
+                args=(scope, args.lock_ms / 1000, stop),
+                daemon=True,
+            ).start()
+
+        print(
+            f"{'mode':<10} {'elapsed':>9} {'lag p50':>9} {'lag p99':>9} {'lag max':>9}"
+        )
+        try:
+            for mode in ("blocking", "executor"):
+                r = asyncio.run(_run(mode, scope, args.imports, args.concurrency))
+                print(
+                    f"{r['mode']:<10} {r['elapsed']:>8.2f}s {r['p50']:>7.1f}ms "
+                    f"{r['p99']:>7.1f}ms {r['max']:>7.1f}ms"
+                )
+        finally:
+            stop.set()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Measure peak memory of the image rating and flyer import paths.
+
+Serves a generated JPEG from a local server and traces allocations (with
+tracemalloc) while each path handles it. The "copying" paths replay what the
+code did before downloads were returned as a view of one buffer: a growing
+bytearray copied into bytes, then wrapped in BytesIO for every Pillow pass.
+The "zero-copy" paths are the current ImageService code. The flyer path stops
+after base64 encoding, where the LLM request would be sent.
+
+Usage:
+    uv run python scripts/benchmark_image_memory.py --size 1600
+"""
+
+import argparse
+import asyncio
+import base64
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from io import BytesIO
+
+import aiohttp
+from aiohttp import web
+from PIL import Image
+
+from app.services.image import ImageService
+from app.shared.http import HTTPService
+from config import config
+
+
+def _jpeg(size: int) -> bytes:
+    """A noisy JPEG, so it doesn't compress to nothing."""
+    image = Image.effect_noise((size, size), 64).convert("RGB")
+    output = BytesIO()
+    image.save(output, format="JPEG", quality=90)
+    return output.getvalue()
+
+
+async def _serve(body: bytes) -> tuple[web.AppRunner, str]:
+    """Start a local server returning the image."""
+
+    async def image(_request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="image/jpeg")
+
+    app = web.Application()
+    app.router.add_get("/{name}", image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/flyer.jpg"
+
+
+async def _copying_download(session: aiohttp.ClientSession, url: str) -> bytes:
+    """HTTPService.download before: chunks into a bytearray, then bytes()."""
+    async with session.get(url) as response:
+        data = bytearray()
+        async for chunk in response.content.iter_chunked(8192):
+            data.extend(chunk)
+        return bytes(data)
+
+
+def _dimensions(data: bytes) -> tuple[int, int]:
+    with Image.open(BytesIO(data)) as img:
+        return img.size
+
+
+async def _measure(run: Callable[[], Awaitable[object]], repeat: int) -> int:
+    """Highest traced allocation peak over several runs, in bytes."""
+    worst = 0
+    for _ in range(repeat):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = await run()
+        worst = max(worst, tracemalloc.get_traced_memory()[1] - baseline)
+        del result
+    return worst
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1600, help="Image edge, px")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    image = _jpeg(args.size)
+    runner, url = await _serve(image)
+    image_service = ImageService(config, HTTPService(config))
+    image_service.max_image_size = len(image)
+    session = aiohttp.ClientSession()
+
+    async def copying_rate() -> object:
+        data = await _copying_download(session, url)
+        _dimensions(data)  # validate_and_download
+        return _dimensions(data), len(data)  # rate_image
+
+    async def copying_flyer() -> str:
+        data = await _copying_download(session, url)
+        _dimensions(data)
+        return base64.b64encode(data).decode("utf-8")
+
+    async def flyer() -> str:
+        result = await image_service.validate_and_download(url)
+        return base64.b64encode(result.data).decode("utf-8")
+
+    runs = [
+        ("rate_image", "copying", copying_rate),
+        ("rate_image", "zero-copy", lambda: image_service.rate_image(url)),
+        ("flyer import", "copying", copying_flyer),
+        ("flyer import", "zero-copy", flyer),
+    ]
+    try:
+        # Warm up connections and imports outside the traced runs
+        await copying_rate()
+        await image_service.rate_image(url)
+        tracemalloc.start()
+        print(f"image: {len(image) / 1024:.0f}KB")
+        print(f"{'path':<13} {'download':<10} {'peak':>9} {'x image':>8} {'time':>9}")
+        for path, variant, run in runs:
+            start = time.perf_counter()
+            peak = await _measure(run, args.repeat)
+            elapsed = (time.perf_counter() - start) / args.repeat
+            print(
+                f"{path:<13} {variant:<10} {peak / 1024:>7.0f}KB "
+                f"{peak / len(image):>7.2f}x {elapsed * 1000:>7.1f}ms"
+            )
+    finally:
+        tracemalloc.stop()
+        await session.close()
+        await image_service.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Measure the per-candidate cost of image download sessions.
+
+Downloads the same set of image candidates from a local server the way
+``ImageService.rate_image`` used to (a new SSL context, connector and session
+per candidate) and through the shared download session. The server is local
+plain HTTP, so the gap shown is session setup, CA bundle loading and TCP
+connects only; against real hosts every fresh session also pays a full TLS
+handshake.
+
+Usage:
+    uv run python scripts/benchmark_image_sessions.py --candidates 15
+"""
+
+import argparse
+import asyncio
+import ssl
+import time
+from collections.abc import Awaitable, Callable
+
+import aiohttp
+import certifi
+from aiohttp import web
+
+from app.services.image import ImageService
+from app.shared.http import HTTPService
+from config import config
+
+IMAGE = b"\xff\xd8\xff\xe0" + b"\x00" * 150_000
+
+
+async def _serve() -> tuple[web.AppRunner, str]:
+    """Start a local server returning a JPEG-sized payload."""
+
+    async def image(_request: web.Request) -> web.Response:
+        return web.Response(body=IMAGE, content_type="image/jpeg")
+
+    app = web.Application()
+    app.router.add_get("/{name}", image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def _per_candidate_session(url: str) -> bytes:
+    """What rate_image did before: a throwaway session per candidate."""
+    ssl_context = ssl.create_default_context(cafile=certifi.where())
+    connector = aiohttp.TCPConnector(
+        limit=config.http.max_connections,
+        limit_per_host=config.http.max_keepalive_connections,
+        ssl=ssl_context,
+    )
+    async with (
+        aiohttp.ClientSession(connector=connector) as session,
+        session.get(url) as response,
+    ):
+        return await response.read()
+
+
+async def _time(
+    download: Callable[[str], Awaitable[bytes]], urls: list[str], repeat: int
+) -> float:
+    """Best wall time of several sequential passes over the candidates."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for url in urls:
+            await download(url)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    runner, base_url = await _serve()
+    urls = [f"{base_url}/candidate-{i}.jpg" for i in range(args.candidates)]
+    image_service = ImageService(config, HTTPService(config))
+    try:
+        runs = [
+            ("per-candidate", _per_candidate_session),
+            (
+                "shared",
+                lambda url: image_service.downloads.download(
+                    url, service="ImageValidator"
+                ),
+            ),
+        ]
+        print(f"{'session':<14} {'total':>9} {'per candidate':>14}")
+        for name, download in runs:
+            elapsed = await _time(download, urls, args.repeat)
+            print(
+                f"{name:<14} {elapsed * 1000:>7.1f}ms "
+                f"{elapsed / len(urls) * 1000:>12.2f}ms"
+            )
+    finally:
+        await image_service.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Benchmark the import pipeline offline from a recorded cassette.
+
+``record`` imports the given URLs for real and saves every upstream exchange
+(HTTPService requests and Claude/OpenAI calls) to a cassette, along with the
+URL list. ``replay`` runs the same imports again entirely from the cassette
+and reports throughput and per-stage latency percentiles. Replayed responses
+wait their recorded latency times ``--latency-scale``; the default of 0
+answers at once and measures only the pipeline's own overhead.
+
+Imports are saved to a throwaway database, never the local one.
+
+Usage:
+    uv run python scripts/benchmark_replay.py record ra.json https://ra.co/events/1908868
+    uv run python scripts/benchmark_replay.py replay ra.json --repeat 5 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from app.core.importer import EventImporter
+from app.core.schemas import ImportResult
+from app.shared.cassette import Cassette, get_cassette
+from app.shared.database import connection
+from config import config
+
+
+def _use_cassette(path: Path, mode: str, latency_scale: float = 0.0) -> Cassette:
+    """Make every service in this process record to or replay from path."""
+    config.cassette.mode = mode
+    config.cassette.path = path
+    config.cassette.latency_scale = latency_scale
+    get_cassette.cache_clear()
+    return get_cassette()
+
+
+@contextmanager
+def _scratch_database() -> Iterator[None]:
+    """Point the session factory at a temporary database."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = connection.create_db_engine(
+            f"sqlite:///{directory}/benchmark.db", config.database
+        )
+        connection.init_db(engine)
+        connection.SessionLocal.configure(bind=engine)
+        try:
+            yield
+        finally:
+            connection.SessionLocal.configure(bind=connection.engine)
+            engine.dispose()
+
+
+async def _record(urls: list[str], cassette: Cassette) -> None:
+    importer = EventImporter(config)
+    try:
+        for url in urls:
+            try:
+                result = await importer.import_event(url, ignore_cache=True)
+            except Exception as e:
+                print(f"failed   {url}: {e}")
+            else:
+                print(f"{result.status.value:<8} {url}")
+    finally:
+        await importer.close()
+    cassette.metadata["imports"] = urls
+    cassette.save()
+
+
+async def _replay(
+    urls: list[str], cassette: Cassette, repeat: int, concurrency: int
+) -> list[ImportResult]:
+    importer = EventImporter(config)
+    semaphore = asyncio.Semaphore(concurrency)
+    results: list[ImportResult] = []
+
+    async def run(url: str) -> bool:
+        async with semaphore:
+            try:
+                result = await importer.import_event(url, ignore_cache=True)
+            except Exception as e:
+                print(f"      failed: {url}: {e}")
+                return False
+        results.append(result)
+        return bool(result)
+
+    try:
+        print(f"{'pass':<5} {'imports':>7} {'failed':>6} {'wall':>9} {'imports/s':>10}")
+        for number in range(1, repeat + 1):
+            cassette.rewind()
+            start = time.perf_counter()
+            succeeded = await asyncio.gather(*(run(url) for url in urls))
+            elapsed = time.perf_counter() - start
+            failed = succeeded.count(False)
+            print(
+                f"{number:<5} {len(urls):>7} {failed:>6} {elapsed * 1000:>7.0f}ms "
+                f"{len(urls) / elapsed:>10.2f}"
+            )
+    finally:
+        await importer.close()
+    return results
+
+
+def _print_stages(results: list[ImportResult]) -> None:
+    durations: dict[str, list[float]] = defaultdict(list)
+    for result in results:
+        for timing in result.timings:
+            durations[timing.stage].append(timing.duration * 1000)
+
+    print(f"\n{'stage':<40} {'count':>6} {'p50':>9} {'p95':>9} {'max':>9}")
+    for stage, values in sorted(durations.items()):
+        values.sort()
+        p50 = statistics.median(values)
+        p95 = values[min(int(len(values) * 0.95), len(values) - 1)]
+        print(
+            f"{stage:<40} {len(values):>6} {p50:>7.1f}ms {p95:>7.1f}ms "
+            f"{values[-1]:>7.1f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="Import URLs live and record them")
+    record.add_argument("cassette", type=Path)
+    record.add_argument("urls", nargs="+")
+    replay = commands.add_parser("replay", help="Re-run recorded imports offline")
+    replay.add_argument("cassette", type=Path)
+    replay.add_argument("--repeat", type=int, default=3)
+    replay.add_argument("--concurrency", type=int, default=1)
+    replay.add_argument("--latency-scale", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with _scratch_database():
+        if args.command == "record":
+            cassette = _use_cassette(args.cassette, "record")
+            asyncio.run(_record(args.urls, cassette))
+            return
+
+        cassette = _use_cassette(args.cassette, "replay", args.latency_scale)
+        urls = cassette.metadata.get("imports", [])
+        if not urls:
+            parser.error(f"{args.cassette} records no imports")
+        results = asyncio.run(_replay(urls, cassette, args.repeat, args.concurrency))
+        _print_stages(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Compare SQLite read/write throughput under mixed load.
+
+Runs reader threads (event lookups and list queries, like the API) next to
+writer threads (``save_event``, like a bulk import) against a throwaway
+database: with SQLite defaults, with the configured performance profile (WAL +
+pragmas), and with the profile plus writes serialized on one thread as
+``run_db_write`` does. "locked" counts writes that failed with
+"database is locked".
+
+Usage:
+    uv run python scripts/benchmark_sqlite_profile.py --seconds 5
+"""
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.shared.database.connection import create_db_engine
+from app.shared.database.models import Base, Event
+from app.shared.database.utils import get_event, save_event
+from config import config
+
+SEED_EVENTS = 500
+
+
+def _event_data(i: int, revision: int = 0) -> dict:
+    return {
+        "title": f"Benchmark Event {i} r{revision}",
+        "venue": "Benchmark Hall",
+        "date": "2026-01-01",
+        "lineup": [f"Artist {n}" for n in range(10)],
+        "long_description": "x" * 2000,
+        "source_url": f"https://example.com/event/{i}",
+    }
+
+
+def _baseline_engine(url: str) -> Engine:
+    """The engine as configured before the performance profile."""
+    return create_engine(url, connect_args={"check_same_thread": False, "timeout": 20})
+
+
+def _run(engine: Engine, readers: int, writers: int, seconds: float) -> dict:
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+
+    def write(i: int, revision: int) -> None:
+        with factory() as db:
+            save_event(
+                f"https://example.com/event/{i}", _event_data(i, revision), db=db
+            )
+            db.commit()
+
+    for i in range(SEED_EVENTS):
+        write(i, 0)
+
+    stop = threading.Event()
+    read_latencies: list[float] = []
+    write_count = 0
+    write_errors = 0
+    write_lock = threading.Lock()
+
+    def reader(n: int) -> None:
+        i = n
+        while not stop.is_set():
+            start = time.perf_counter()
+            with factory() as db:
+                get_event(url=f"https://example.com/event/{i % SEED_EVENTS}", db=db)
+                db.query(Event).order_by(Event.scraped_at.desc()).limit(50).all()
+            read_latencies.append(time.perf_counter() - start)
+            i += readers
+
+    def writer(n: int) -> None:
+        nonlocal write_count, write_errors
+        revision = n * 1_000_000
+        while not stop.is_set():
+            revision += 1
+            try:
+                write(revision % SEED_EVENTS, revision)
+            except OperationalError:  # "database is locked"
+                with write_lock:
+                    write_errors += 1
+                continue
+            with write_lock:
+                write_count += 1
+
+    with ThreadPoolExecutor(max_workers=readers + writers) as pool:
+        for n in range(readers):
+            pool.submit(reader, n)
+        for n in range(writers):
+            pool.submit(writer, n)
+        time.sleep(seconds)
+        stop.set()
+
+    engine.dispose()
+    latencies_ms = sorted(lat * 1000 for lat in read_latencies)
+    return {
+        "reads": len(latencies_ms) / seconds,
+        "writes": write_count / seconds,
+        "errors": write_errors,
+        "read_p50": statistics.median(latencies_ms) if latencies_ms else 0.0,
+        "read_p99": latencies_ms[int(len(latencies_ms) * 0.99) - 1]
+        if latencies_ms
+        else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--readers", type=int, default=config.database.read_pool_size)
+    parser.add_argument(
+        "--writers",
+        type=int,
+        default=4,
+        help="Concurrent writer threads for the unserialized runs",
+    )
+    args = parser.parse_args()
+
+    def tuned(url: str) -> Engine:
+        return create_db_engine(url, config.database)
+
+    runs = [
+        ("default", _baseline_engine, args.writers),
+        ("tuned", tuned, args.writers),
+        ("tuned+1w", tuned, 1),  # writes serialized, as run_db_write does
+    ]
+    print(
+        f"{'profile':<10} {'reads/s':>9} {'writes/s':>9} {'locked':>7} "
+        f"{'read p50':>9} {'read p99':>9}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, make_engine, writers in runs:
+            engine = make_engine(f"sqlite:///{Path(tmp) / f'{name}.db'}")
+            r = _run(engine, args.readers, writers, args.seconds)
+            print(
+                f"{name:<10} {r['reads']:>9.0f} {r['writes']:>9.0f} "
+                f"{r['errors']:>7} {r['read_p50']:>7.2f}ms {r['read_p99']:>7.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
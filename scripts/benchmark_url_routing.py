@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Measure URL routing throughput.
+
+Classifies a mixed list of provider and generic URLs with the previous
+hard-coded analyzer (``urlparse``, list membership and uncompiled
+``re.search`` per URL) and with the routing table compiled from the agent
+registry, one URL at a time and in bulk.
+
+Usage:
+    uv run python scripts/benchmark_url_routing.py --urls 20000
+"""
+
+import argparse
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import urlparse
+
+from app.extraction_agents.registry import get_agent_registry
+
+SAMPLE_URLS = [
+    "https://ra.co/events/1234567",
+    "https://www.residentadvisor.net/events/9876543",
+    "https://www.ticketmaster.com/event/G5vYZ9v1AUf-GAAAAA",
+    "https://concerts.livenation.com/some-show/event/1C005F5BA1234567",
+    "https://dice.fm/event/q2r5ro-some-event",
+    "https://dice.fm/event/some-event-no-id",
+    "https://example.com/events/cool-party",
+    "https://www.shrineauditorium.com/events/detail/event_id=875456",
+    "https://ra.co/news/123",
+    "https://cdn.example.com/flyers/2025/january/event.png",
+]
+
+
+def _legacy_analyze(url: str) -> dict[str, Any]:
+    """The analyzer as it was before the routing table."""
+    if not url.startswith(("http://", "https://")):
+        url = "https://" + url
+
+    parsed = urlparse(url)
+    domain = parsed.netloc.lower().replace("www.", "")
+    path = parsed.path
+
+    if domain in ["ra.co", "residentadvisor.net"]:
+        match = re.search(r"/events/(\d+)", path)
+        if match:
+            return {"type": "resident_advisor", "event_id": match.group(1)}
+
+    ticketmaster_domains = [
+        "ticketmaster.com",
+        "livenation.com",
+        "frontgatetickets.com",
+        "ticketweb.com",
+    ]
+    if any(t_domain in domain for t_domain in ticketmaster_domains):
+        match = re.search(r"/event/([a-zA-Z0-9-]{16,})", path)
+        if match:
+            return {"type": "ticketmaster", "event_id": match.group(1)}
+        return {"type": "ticketmaster"}
+
+    if domain in ["dice.fm"]:
+        match = re.search(r"/event/([^/?]+)", path)
+        if match:
+            event_slug = match.group(1)
+            id_match = re.match(r"^([a-zA-Z0-9]{6,})-", event_slug)
+            if id_match:
+                return {
+                    "type": "dice",
+                    "event_id": id_match.group(1),
+                    "slug": event_slug,
+                }
+            return {"type": "dice", "slug": event_slug}
+
+    return {"type": "unknown"}
+
+
+def _time(run: Callable[[], object], repeat: int) -> float:
+    """Best wall time of several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    urls = (SAMPLE_URLS * (args.urls // len(SAMPLE_URLS) + 1))[: args.urls]
+    table = get_agent_registry().routing_table
+
+    # Both must agree before their speed is worth comparing
+    for url in SAMPLE_URLS:
+        assert table.classify(url) == _legacy_analyze(url), url
+
+    runs = [
+        ("legacy", lambda: [_legacy_analyze(url) for url in urls]),
+        ("compiled", lambda: [table.classify(url) for url in urls]),
+        ("bulk", lambda: table.classify_many(urls)),
+    ]
+    print(f"{'router':<10} {'total':>9} {'per url':>9} {'urls/s':>11}")
+    for name, run in runs:
+        elapsed = _time(run, args.repeat)
+        print(
+            f"{name:<10} {elapsed * 1000:>7.1f}ms {elapsed / len(urls) * 1e6:>7.2f}us "
+            f"{len(urls) / elapsed:>11,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,12 +11,15 @@ from app.services.image import ImageService
 from app.services.llm.providers.claude import Claude
 from app.services.llm.providers.openai import OpenAI
 from app.services.llm.service import LLMService
+from app.shared.circuit_breaker import get_circuit_breakers
 from app.shared.database.connection import (
     get_db_session,
     init_db,
 )
 from app.shared.database.models import Base
 from app.shared.http import HTTPService
+from app.shared.http_cache import get_response_cache
+from app.shared.rate_limit import get_rate_limiter
 from config import config
 
 TEST_DATABASE_URL = "sqlite:///./test.db"
@@ -42,6 +45,30 @@ def db_session(engine):
     connection.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Start every test with closed circuits."""
+    get_circuit_breakers.cache_clear()
+    yield
+    get_circuit_breakers.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """Start every test with full, unpaused rate limit buckets."""
+    get_rate_limiter.cache_clear()
+    yield
+    get_rate_limiter.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_response_cache():
+    """Build the HTTP response cache from each test's config."""
+    get_response_cache.cache_clear()
+    yield
+    get_response_cache.cache_clear()
+
+
 @pytest.fixture(scope="function")
 def http_service() -> HTTPService:
     """Return an HTTPService instance."""
@@ -8,7 +8,7 @@ import clicycle
 import pytest
 from dotenv import load_dotenv
 
-from app.services.image import ImageService
+from app.services.image import DownloadedImage, ImageService
 
 # Load environment variables
 load_dotenv()
@@ -34,7 +34,7 @@ async def test_rate_image_logic(capsys, image_service: ImageService, monkeypatch
                 b"x\x9cc`\x00\x00\x00\x02\x00\x01\xe2!\xb3`\x82\x00\x00\x00\x00IEND"
                 b"\xaeB`\x82"
             )
-            return valid_png_data, "image/png"
+            return DownloadedImage(memoryview(valid_png_data), "image/png", 1, 1)
         # Simulate a failed download or invalid image
         return None
 
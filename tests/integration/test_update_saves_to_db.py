@@ -5,6 +5,7 @@ from contextlib import contextmanager
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.core.importer import EventImporter
 from app.core.schemas import EventData
@@ -16,7 +17,13 @@ from config import config
 @pytest.fixture
 def test_db():
     """Create a test database."""
-    engine = create_engine("sqlite:///:memory:")
+    # Database calls run on the database executor, so the connection has to be
+    # shareable across threads (like the application engine)
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
     Base.metadata.create_all(engine)
     session_local = sessionmaker(bind=engine)
     session = session_local()
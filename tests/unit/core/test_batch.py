@@ -0,0 +1,106 @@
+"""Tests for the batch import engine."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.batch import WEB_SOURCE, BatchImporter
+from app.core.schemas import BatchImportSummary, ImportResult, ImportStatus
+
+
+def _make_importer(delays: dict[str, float], sources: dict[str, str] | None = None):
+    """Create a fake importer that tracks how many imports run at once."""
+    importer = MagicMock()
+    importer.active = {}
+    importer.peak = {}
+    sources = sources or {}
+    importer.get_source_for_url.side_effect = lambda url: sources.get(url, WEB_SOURCE)
+
+    async def import_event(url, **_kwargs):
+        source = importer.get_source_for_url(url)
+        importer.active[source] = importer.active.get(source, 0) + 1
+        importer.active["*"] = importer.active.get("*", 0) + 1
+        for key in (source, "*"):
+            importer.peak[key] = max(importer.peak.get(key, 0), importer.active[key])
+        try:
+            await asyncio.sleep(delays.get(url, 0.01))
+            if url.endswith("/fail"):
+                raise ValueError("boom")
+            return ImportResult(request_id="r", status=ImportStatus.SUCCESS, url=url)
+        finally:
+            importer.active[source] -= 1
+            importer.active["*"] -= 1
+
+    importer.import_event = import_event
+    return importer
+
+
+async def _collect(batch: BatchImporter, urls: list[str]) -> list[ImportResult]:
+    return [result async for result in batch.run(urls)]
+
+
+@pytest.mark.asyncio
+async def test_results_stream_in_completion_order():
+    """Faster imports are yielded before slower ones."""
+    urls = ["https://a.test/slow", "https://a.test/fast"]
+    importer = _make_importer({urls[0]: 0.05, urls[1]: 0.0})
+
+    results = await _collect(BatchImporter(importer, concurrency=2), urls)
+
+    assert [str(r.url) for r in results] == [urls[1], urls[0]]
+
+
+@pytest.mark.asyncio
+async def test_global_and_source_caps_are_respected():
+    """Neither the global cap nor a per-source cap is exceeded."""
+    ra_urls = [f"https://ra.co/events/{i}" for i in range(6)]
+    web_urls = [f"https://venue.test/{i}" for i in range(6)]
+    importer = _make_importer({}, dict.fromkeys(ra_urls, "ra.co"))
+
+    batch = BatchImporter(importer, concurrency=3, source_limits={"ra.co": 1})
+    results = await _collect(batch, ra_urls + web_urls)
+
+    assert len(results) == 12
+    assert importer.peak["*"] <= 3
+    assert importer.peak["ra.co"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_become_results_and_are_counted():
+    """An exception for one URL does not abort the batch."""
+    urls = ["https://a.test/ok", "https://a.test/fail"]
+    summary = BatchImportSummary()
+    batch = BatchImporter(_make_importer({}), concurrency=2, summary=summary)
+
+    results = await _collect(batch, urls)
+
+    failed = [r for r in results if r.status == ImportStatus.FAILED]
+    assert len(failed) == 1
+    assert failed[0].error == "boom"
+    assert summary.total == 2
+    assert summary.succeeded == 1
+    assert summary.failed == 1
+    assert summary.completed == 2
+
+
+@pytest.mark.asyncio
+async def test_stopping_early_cancels_pending_imports():
+    """Breaking out of the stream cancels the remaining imports."""
+    urls = ["https://a.test/fast"] + [f"https://a.test/slow{i}" for i in range(3)]
+    importer = _make_importer({url: 10 for url in urls[1:]})
+    batch = BatchImporter(importer, concurrency=4)
+
+    stream = batch.run(urls)
+    first = await anext(stream)
+    await stream.aclose()
+
+    assert str(first.url) == urls[0]
+    assert importer.active["*"] == 0
+
+
+def test_summary_throughput():
+    """Throughput is reported in imports per minute."""
+    summary = BatchImportSummary(total=10, succeeded=8, failed=2, elapsed=30.0)
+    assert summary.throughput == 20.0
+    assert BatchImportSummary().throughput == 0.0
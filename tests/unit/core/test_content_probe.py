@@ -0,0 +1,110 @@
+"""Test content-type probing and its per-host cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import ClientResponse
+
+from app.core.content_probe import ContentProbe
+from app.core.errors import APIError
+from app.core.schemas import ImportMethod
+
+
+def _response(content_type: str) -> MagicMock:
+    response = MagicMock(spec=ClientResponse)
+    response.headers = {"content-type": content_type}
+    return response
+
+
+@pytest.fixture
+def http():
+    """HTTP service whose HEAD requests report an image."""
+    http = AsyncMock()
+    http.head = AsyncMock(return_value=_response("image/jpeg"))
+    return http
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://cdn.example.com/flyers/party.JPG", ImportMethod.IMAGE),
+        ("https://cdn.example.com/flyers/party.webp", ImportMethod.IMAGE),
+        ("https://venue.com/events/party.html", ImportMethod.WEB),
+    ],
+)
+async def test_extension_skips_network(http, url, expected):
+    """Obvious file extensions are decided without a request."""
+    probe = ContentProbe(ttl=60)
+
+    assert await probe.detect(url, http) == expected
+    http.head.assert_not_called()
+
+
+async def test_caches_by_host_and_path_pattern(http):
+    """URLs under the same host and directory share one probe."""
+    probe = ContentProbe(ttl=60)
+
+    for image_id in ("abc123", "def456", "ghi789"):
+        url = f"https://img.flyerhost.com/i/{image_id}"
+        assert await probe.detect(url, http) == ImportMethod.IMAGE
+    assert http.head.await_count == 1
+
+    await probe.detect("https://img.flyerhost.com/events/abc123", http)
+    assert http.head.await_count == 2
+
+
+async def test_cache_expires():
+    """Entries are re-probed once the TTL passes."""
+    probe = ContentProbe(ttl=60)
+    http = AsyncMock()
+    http.head = AsyncMock(return_value=_response("text/html"))
+
+    with patch("app.core.content_probe.time.monotonic", return_value=1000.0):
+        await probe.detect("https://venue.com/events/1", http)
+    with patch("app.core.content_probe.time.monotonic", return_value=1030.0):
+        await probe.detect("https://venue.com/events/2", http)
+    assert http.head.await_count == 1
+
+    with patch("app.core.content_probe.time.monotonic", return_value=1061.0):
+        await probe.detect("https://venue.com/events/3", http)
+    assert http.head.await_count == 2
+
+
+async def test_ranged_get_when_head_refused():
+    """A refused HEAD falls back to a one-byte ranged GET, read headers only."""
+    http = AsyncMock()
+    http.head = AsyncMock(side_effect=APIError("URLAnalyzer", "HTTP 405", 405))
+    stream = MagicMock()
+    stream.__aenter__.return_value = _response("image/png")
+    http.stream = MagicMock(return_value=stream)
+
+    method = await ContentProbe(ttl=60).detect("https://s3.example.com/b/key", http)
+
+    assert method == ImportMethod.IMAGE
+    assert http.stream.call_args.args == ("GET", "https://s3.example.com/b/key")
+    assert http.stream.call_args.kwargs["headers"] == {"Range": "bytes=0-0"}
+    stream.__aexit__.assert_awaited_once()
+
+
+async def test_failures_are_not_cached():
+    """A failed probe defaults to web without poisoning the cache."""
+    probe = ContentProbe(ttl=60)
+    http = AsyncMock()
+    http.head = AsyncMock(side_effect=APIError("URLAnalyzer", "HTTP 404", 404))
+
+    assert await probe.detect("https://venue.com/p/1", http) == ImportMethod.WEB
+    http.stream.assert_not_called()
+
+    http.head = AsyncMock(return_value=_response("image/jpeg"))
+    assert await probe.detect("https://venue.com/p/2", http) == ImportMethod.IMAGE
+
+
+async def test_cache_is_bounded(http):
+    """The least recently used entries are evicted past max_entries."""
+    probe = ContentProbe(ttl=60, max_entries=2)
+
+    for host in ("a.com", "b.com", "c.com"):
+        await probe.detect(f"https://{host}/x/1", http)
+    await probe.detect("https://a.com/x/2", http)
+
+    assert http.head.await_count == 4
@@ -0,0 +1,156 @@
+"""Test import deadline propagation and cancellation."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.deadline import (
+    DeadlineExceededError,
+    deadline_scope,
+    enforce_deadline,
+    time_left,
+)
+from app.core.enrichment import EnrichmentGraph, EnrichmentStage, StageOutcome
+from app.core.errors import APIError, retry_on_error
+from app.core.importer import EventImporter
+from app.core.schemas import EventData, ImportMethod, ImportStatus
+from config import config
+
+URL = "https://example.com/event/123"
+
+
+def _stage(name: str, delay: float, field: str, value: object) -> EnrichmentStage:
+    async def run(_event_data: EventData) -> StageOutcome:
+        await asyncio.sleep(delay)
+        return StageOutcome(updates={field: value})
+
+    return EnrichmentStage(
+        name=name, run=run, inputs=frozenset(), outputs=frozenset({field})
+    )
+
+
+async def test_time_left_is_capped_by_deadline():
+    """Timeouts shrink to the remaining budget, and only under a deadline."""
+    assert time_left(30) == 30
+    with deadline_scope(5):
+        assert 4 < time_left(30) <= 5
+        assert time_left(1) == 1
+
+
+async def test_nested_scope_never_extends_deadline():
+    """An inner scope keeps the earlier of the two deadlines."""
+    with deadline_scope(1) as outer, deadline_scope(60) as inner:
+        assert inner is outer
+
+
+async def test_time_left_raises_once_expired():
+    """No new work is started after the deadline."""
+    with deadline_scope(0.01):
+        await asyncio.sleep(0.02)
+        with pytest.raises(DeadlineExceededError):
+            time_left(30)
+
+
+async def test_enforce_deadline_cancels_work():
+    """Work still running at the deadline is cancelled."""
+    with deadline_scope(0.05), pytest.raises(DeadlineExceededError):
+        async with enforce_deadline():
+            await asyncio.sleep(10)
+
+
+async def test_retries_stop_at_deadline():
+    """A retry that would sleep past the deadline is not attempted."""
+    calls = 0
+
+    @retry_on_error(max_attempts=5, delay=1, backoff=1)
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        raise APIError("Test", "unavailable")
+
+    with deadline_scope(0.5), pytest.raises(APIError):
+        await flaky()
+    assert calls == 1
+
+
+async def test_enrichment_keeps_finished_stages():
+    """Stages cut off by the deadline are reported; finished ones are kept."""
+    fast = _stage("fast", 0, "title", "Fast")
+    slow = _stage("slow", 10, "genres", ["Slow"])
+    event_data = EventData(title="Original", source_url=URL)
+
+    with deadline_scope(0.05):
+        event_data, failures = await EnrichmentGraph([fast, slow]).run(event_data)
+
+    assert event_data.title == "Fast"
+    assert [failure.service for failure in failures] == ["slow"]
+    assert failures[0].error == "Deadline exceeded"
+
+
+@pytest.fixture
+def importer():
+    """Importer whose agent is mocked and whose database writes are skipped."""
+    importer = EventImporter(config)
+    agent = MagicMock()
+    agent.import_method = ImportMethod.WEB
+    importer._select_agent = AsyncMock(return_value=agent)
+    with (
+        patch("app.core.importer.get_fresh_event", return_value=None),
+        patch("app.core.importer.save_event") as save,
+        patch("app.core.importer.save_stage_timings"),
+    ):
+        importer.save_event = save
+        yield importer
+
+
+async def test_import_fails_when_extraction_overruns(importer):
+    """Extraction still running at the deadline fails the import."""
+
+    async def slow_import(*_args, **_kwargs):
+        await asyncio.sleep(10)
+
+    agent = importer._select_agent.return_value
+    agent.import_event = AsyncMock(side_effect=slow_import)
+
+    with pytest.raises(DeadlineExceededError):
+        await importer.import_event(URL, timeout=0.05)
+
+
+async def test_import_keeps_partial_result_when_enrichment_overruns(importer):
+    """An extracted event is saved even if enrichment runs out of time."""
+    event_data = EventData(title="Partial", venue="Venue", source_url=URL)
+    agent = importer._select_agent.return_value
+    agent.import_event = AsyncMock(return_value=event_data)
+    importer._build_enrichment_graph = MagicMock(
+        return_value=EnrichmentGraph([_stage("genre", 10, "genres", ["Never"])])
+    )
+
+    result = await importer.import_event(URL, timeout=0.05)
+
+    assert result.status == ImportStatus.SUCCESS
+    assert result.event_data.title == "Partial"
+    assert [failure.service for failure in result.service_failures] == ["genre"]
+    importer.save_event.assert_called_once()
+
+
+async def test_shorter_deadline_stops_waiting_on_shared_import(importer):
+    """A caller joining a longer import gives up at its own deadline."""
+    release = asyncio.Event()
+
+    async def gated_import(url, *_args, **_kwargs):
+        await release.wait()
+        return EventData(title="Shared", venue="Venue", source_url=url)
+
+    agent = importer._select_agent.return_value
+    agent.import_event = AsyncMock(side_effect=gated_import)
+    importer.process_event = AsyncMock(side_effect=lambda data, *_, **__: (data, []))
+
+    leader = asyncio.create_task(importer.import_event(URL))
+    await asyncio.sleep(0)
+    with pytest.raises(DeadlineExceededError):
+        await importer.import_event(URL, timeout=0.05)
+
+    release.set()
+    result = await leader
+    assert result.status == ImportStatus.SUCCESS
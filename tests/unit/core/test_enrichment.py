@@ -0,0 +1,175 @@
+"""Test the enrichment stage scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.enrichment import EnrichmentGraph, EnrichmentStage, StageOutcome
+from app.core.importer import EventImporter
+from app.core.schemas import (
+    EventData,
+    EventLocation,
+    EventTime,
+    GenreResult,
+    ImageResult,
+    ServiceFailure,
+)
+from config import config
+
+
+def _stage(name, run, inputs=(), outputs=()):
+    return EnrichmentStage(
+        name=name, run=run, inputs=frozenset(inputs), outputs=frozenset(outputs)
+    )
+
+
+async def _noop(_event_data):
+    return StageOutcome()
+
+
+@pytest.fixture
+def event_data():
+    """Minimal extracted event."""
+    return EventData(title="Test Event", venue="Venue", lineup=["A", "B"])
+
+
+def test_dependencies_follow_declared_fields():
+    """Stages depend only on earlier stages that write what they touch."""
+    graph = EnrichmentGraph(
+        [
+            _stage("timezone", _noop, {"time"}, {"time"}),
+            _stage("descriptions", _noop, {"title", "time"}, {"long_description"}),
+            _stage("genre", _noop, {"title", "genres"}, {"genres"}),
+            _stage("summary", _noop, {"long_description", "genres"}, {"cost"}),
+        ]
+    )
+
+    assert graph.dependencies == {
+        "timezone": set(),
+        "descriptions": {"timezone"},
+        "genre": set(),
+        "summary": {"descriptions", "genre"},
+    }
+
+
+def test_duplicate_stage_names_rejected():
+    """Stage names identify dependencies, so they must be unique."""
+    with pytest.raises(ValueError, match="Duplicate"):
+        EnrichmentGraph([_stage("a", _noop), _stage("a", _noop)])
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_run_concurrently(event_data):
+    """A slow stage doesn't delay stages that don't read its outputs."""
+    genre_done = asyncio.Event()
+
+    async def slow_descriptions(_data):
+        # Only finishes once the genre stage has run alongside it
+        await asyncio.wait_for(genre_done.wait(), timeout=1)
+        return StageOutcome(updates={"long_description": "Long"})
+
+    async def genres(_data):
+        genre_done.set()
+        return StageOutcome(updates={"genres": ["Techno"]})
+
+    graph = EnrichmentGraph(
+        [
+            _stage("descriptions", slow_descriptions, {"title"}, {"long_description"}),
+            _stage("genre", genres, {"title", "genres"}, {"genres"}),
+        ]
+    )
+    result, failures = await graph.run(event_data)
+
+    assert result.long_description == "Long"
+    assert result.genres == ["Techno"]
+    assert failures == []
+
+
+@pytest.mark.asyncio
+async def test_dependent_stage_sees_upstream_updates(event_data):
+    """A stage starts only after the fields it reads are written."""
+    seen = {}
+
+    async def write_genres(_data):
+        await asyncio.sleep(0.01)
+        return StageOutcome(updates={"genres": ["House"]})
+
+    async def read_genres(data):
+        seen["genres"] = data.genres
+        return StageOutcome()
+
+    graph = EnrichmentGraph(
+        [
+            _stage("genre", write_genres, {"genres"}, {"genres"}),
+            _stage("reader", read_genres, {"genres"}),
+        ]
+    )
+    await graph.run(event_data)
+
+    assert seen["genres"] == ["House"]
+
+
+@pytest.mark.asyncio
+async def test_failures_are_collected_and_undeclared_updates_ignored(event_data):
+    """Stage errors become service failures; other stages still apply."""
+
+    async def broken(_data):
+        raise RuntimeError("LLM down")
+
+    async def sneaky(_data):
+        return StageOutcome(
+            updates={"genres": ["Jazz"], "title": "Hijacked"},
+            service_failure=ServiceFailure(service="genre", error="partial"),
+        )
+
+    graph = EnrichmentGraph(
+        [
+            _stage("descriptions", broken, {"title"}, {"long_description"}),
+            _stage("genre", sneaky, {"genres"}, {"genres"}),
+        ]
+    )
+    result, failures = await graph.run(event_data)
+
+    assert result.genres == ["Jazz"]
+    assert result.title == "Test Event"
+    assert {f.service for f in failures} == {"descriptions", "genre"}
+
+
+@pytest.mark.asyncio
+async def test_importer_runs_descriptions_off_the_critical_path(event_data):
+    """Genre and image search start without waiting for descriptions."""
+    importer = EventImporter(config)
+    searches_started = asyncio.Event()
+    started = []
+
+    async def describe(data, _request_id):
+        await asyncio.wait_for(searches_started.wait(), timeout=1)
+        return data.model_copy(update={"long_description": "Generated"})
+
+    async def genres(data, _request_id):
+        started.append("genre")
+        if len(started) == 2:
+            searches_started.set()
+        return GenreResult(original_genres=data.genres, enhanced_genres=["Techno"])
+
+    async def image(data, _request_id):
+        started.append("image")
+        if len(started) == 2:
+            searches_started.set()
+        return ImageResult(enhanced_image_url="https://img.test/a.jpg")
+
+    agent = MagicMock()
+    agent.enhance_descriptions = AsyncMock(side_effect=describe)
+    importer._enhance_genres = genres
+    importer._enhance_image = image
+    event_data.time = EventTime(start="20:00")
+    event_data.location = EventLocation(city="Los Angeles", state="CA")
+
+    result, failures = await importer.process_event(event_data, "req", agent=agent)
+
+    assert failures == []
+    assert result.long_description == "Generated"
+    assert result.genres == ["Techno"]
+    assert result.images["full"] == "https://img.test/a.jpg"
+    assert result.time.timezone == "America/Los_Angeles"
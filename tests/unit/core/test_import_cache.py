@@ -0,0 +1,90 @@
+"""Test the cache-first import path."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.importer import EventImporter
+from app.core.schemas import EventData, ImportMethod, ImportStatus
+from config import config
+
+URL = "https://example.com/event/123"
+
+
+@pytest.fixture
+def cached_event():
+    """Stored event data as returned by the database layer."""
+    data = EventData(
+        title="Cached Event", venue="Test Venue", source_url=URL
+    ).model_dump(mode="json")
+    data["_db_id"] = 1
+    return data
+
+
+@pytest.fixture
+def importer():
+    """Create an importer whose agent selection is mocked out."""
+    importer = EventImporter(config)
+    importer._select_agent = AsyncMock()
+    return importer
+
+
+@pytest.mark.asyncio
+async def test_fresh_event_served_from_cache(importer, cached_event):
+    """A fresh stored event is returned without running an agent."""
+    with patch(
+        "app.core.importer.get_fresh_event", return_value=cached_event
+    ) as mock_fresh:
+        result = await importer.import_event(URL)
+
+    assert result.status == ImportStatus.SUCCESS
+    assert result.method_used == ImportMethod.CACHE
+    assert result.event_data.title == "Cached Event"
+    importer._select_agent.assert_not_called()
+    max_age = mock_fresh.call_args[0][1]
+    assert max_age.total_seconds() == config.importer.cache_ttl["web"]
+
+
+@pytest.mark.asyncio
+async def test_ignore_cache_forces_fresh_import(importer, cached_event):
+    """ignore_cache skips the database lookup entirely."""
+    importer._select_agent.side_effect = RuntimeError("agent ran")
+
+    with (
+        patch(
+            "app.core.importer.get_fresh_event", return_value=cached_event
+        ) as mock_fresh,
+        pytest.raises(RuntimeError, match="agent ran"),
+    ):
+        await importer.import_event(URL, ignore_cache=True)
+
+    mock_fresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_runs_agent(importer):
+    """A missing or stale event falls through to a real import."""
+    importer._select_agent.side_effect = RuntimeError("agent ran")
+
+    with (
+        patch("app.core.importer.get_fresh_event", return_value=None),
+        pytest.raises(RuntimeError, match="agent ran"),
+    ):
+        await importer.import_event(URL)
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_cache(importer, cached_event, monkeypatch):
+    """Sources with a TTL of 0 are never served from cache."""
+    monkeypatch.setitem(config.importer.cache_ttl, "web", 0)
+    importer._select_agent.side_effect = RuntimeError("agent ran")
+
+    with (
+        patch(
+            "app.core.importer.get_fresh_event", return_value=cached_event
+        ) as mock_fresh,
+        pytest.raises(RuntimeError, match="agent ran"),
+    ):
+        await importer.import_event(URL)
+
+    mock_fresh.assert_not_called()
@@ -0,0 +1,147 @@
+"""Test that concurrent imports of the same URL share one import."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.importer import EventImporter
+from app.core.schemas import EventData, ImportMethod, ImportStatus
+from app.shared.url_analyzer import URLAnalyzer
+from config import config
+
+URL = "https://example.com/event/123"
+
+
+@pytest.fixture
+def importer():
+    """Create an importer whose agent blocks until released."""
+    importer = EventImporter(config)
+    release = asyncio.Event()
+
+    async def agent_import(url, request_id, **_kwargs):
+        await importer.send_progress(
+            request_id, ImportStatus.RUNNING, "Extracting", 0.5
+        )
+        await release.wait()
+        return EventData(title="Shared Event", venue="Venue", source_url=url)
+
+    agent = MagicMock()
+    agent.import_method = ImportMethod.WEB
+    agent.import_event = AsyncMock(side_effect=agent_import)
+    importer._select_agent = AsyncMock(return_value=agent)
+    importer.process_event = AsyncMock(side_effect=lambda data, *_, **__: (data, []))
+    importer.agent = agent
+    importer.release = release
+    return importer
+
+
+@pytest.fixture(autouse=True)
+def no_database():
+    """Skip the cache lookup and database save."""
+    with (
+        patch("app.core.importer.get_fresh_event", return_value=None),
+        patch("app.core.importer.save_event"),
+    ):
+        yield
+
+
+async def _start(importer, url, updates, **kwargs):
+    async def callback(progress):
+        updates.append(progress)
+
+    task = asyncio.create_task(
+        importer.import_event(url, progress_callback=callback, **kwargs)
+    )
+    await asyncio.sleep(0)
+    return task
+
+
+@pytest.mark.asyncio
+async def test_concurrent_imports_share_one_agent_run(importer):
+    """Callers with equivalent URLs await the same import."""
+    first_updates, second_updates = [], []
+    first = await _start(importer, URL, first_updates)
+    await asyncio.sleep(0.01)
+    # Joins late, with a differently spelled URL
+    second = await _start(importer, "HTTPS://Example.com/event/123/", second_updates)
+
+    importer.release.set()
+    first_result, second_result = await asyncio.gather(first, second)
+
+    importer.agent.import_event.assert_awaited_once()
+    assert first_result.event_data.title == second_result.event_data.title
+    assert first_result.event_data is not second_result.event_data
+    assert first_result.request_id != second_result.request_id
+
+    # Each caller sees the full progress stream under its own request_id
+    for result, updates in (
+        (first_result, first_updates),
+        (second_result, second_updates),
+    ):
+        assert {u.request_id for u in updates} == {result.request_id}
+        assert [u.status for u in updates][-1] == ImportStatus.SUCCESS
+        assert "Extracting" in [u.message for u in updates]
+
+    assert importer._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_different_options_do_not_share(importer):
+    """Imports with different options run separately."""
+    first = await _start(importer, URL, [])
+    second = await _start(importer, URL, [], ignore_cache=True)
+
+    importer.release.set()
+    await asyncio.gather(first, second)
+
+    assert importer.agent.import_event.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others(importer):
+    """One caller going away leaves the shared import running."""
+    first = await _start(importer, URL, [])
+    second = await _start(importer, URL, [])
+
+    first.cancel()
+    importer.release.set()
+    result = await second
+
+    assert result.status == ImportStatus.SUCCESS
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_failure_is_raised_to_every_caller(importer):
+    """A failed shared import raises for all callers."""
+    importer.agent.import_event.side_effect = RuntimeError("agent failed")
+
+    results = await asyncio.gather(
+        importer.import_event(URL),
+        importer.import_event(URL),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    importer.agent.import_event.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("HTTPS://Example.com/event/1/", "https://example.com/event/1"),
+        ("https://example.com:443/event/1#tickets", "https://example.com/event/1"),
+        ("example.com/event?id=1", "https://example.com/event?id=1"),
+        ("https://example.com", "https://example.com/"),
+        ("http://www.example.com/event/1", "https://example.com/event/1"),
+        (
+            "https://example.com/event?id=1&utm_source=ig&fbclid=x",
+            "https://example.com/event?id=1",
+        ),
+    ],
+)
+def test_normalize_url(url, expected):
+    """Trivially different spellings normalize to the same URL."""
+    assert URLAnalyzer.normalize(url) == expected
@@ -14,6 +14,8 @@ from app.extraction_agents.providers.ra import ResidentAdvisor
 from app.extraction_agents.providers.ticketmaster import Ticketmaster
 from app.extraction_agents.providers.web import Web
 from config import Config
+from config.importer import ImporterConfig
+from config.runtime import RuntimeConfig
 
 # Path to test fixtures
 FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
@@ -52,6 +54,7 @@ def config():
     config.http = MagicMock()
     config.http.timeout = 30
     config.http.max_retries = 3
+    config.http.response_cache_enabled = False
     # Legacy attributes for backward compatibility
     config.llm = MagicMock()
     config.llm.claude_api_key = "test-claude-key"
@@ -63,6 +66,8 @@ def config():
     config.ticketfairy.api_key = None
     config.zyte = MagicMock()
     config.zyte.api_key = "test-zyte-key"
+    config.importer = ImporterConfig()
+    config.runtime = RuntimeConfig()
     return config
 
 
@@ -207,6 +212,13 @@ class TestAgentSelection:
         agent = await importer._select_agent("https://dice.fm/event/test-event", "test-id")
         assert isinstance(agent, Dice)
 
+    @pytest.mark.asyncio
+    async def test_select_agent_reuses_instances(self, importer):
+        """Test that agents are created once and reused across imports."""
+        first = await importer._select_agent("https://ra.co/events/1", "id-1")
+        second = await importer._select_agent("https://ra.co/events/2", "id-2")
+        assert first is second
+
     @pytest.mark.asyncio
     async def test_select_agent_unknown_web_page(self, importer):
         """Test that unknown URLs with HTML content get the Web agent."""
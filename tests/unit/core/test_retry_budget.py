@@ -0,0 +1,128 @@
+"""Test the per-import retry budget shared by nested retry layers."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.errors import APIError, CircuitOpenError, retry_on_error
+from app.core.retry_budget import retry_budget_scope
+from app.core.timing import SpanRecorder
+from app.services.llm.service import LLMOperation, LLMService
+from config import config
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    """Retries don't actually wait."""
+    with patch("app.core.errors.asyncio.sleep", AsyncMock()) as sleep:
+        yield sleep
+
+
+def _nested_failure() -> tuple[list[str], object]:
+    calls: list[str] = []
+
+    @retry_on_error(max_attempts=3, delay=0.01)
+    async def inner():
+        calls.append("inner")
+        raise APIError("Test", "unavailable")
+
+    @retry_on_error(max_attempts=3, delay=0.01)
+    async def outer():
+        await inner()
+
+    return calls, outer
+
+
+async def test_budget_caps_retries_across_nested_layers():
+    """Nested decorators share one budget instead of multiplying attempts."""
+    calls, outer = _nested_failure()
+    with pytest.raises(APIError):
+        await outer()
+    assert len(calls) == 9
+
+    calls, outer = _nested_failure()
+    with retry_budget_scope(max_retries=2), pytest.raises(APIError):
+        await outer()
+    assert len(calls) == 3
+
+
+async def test_budget_caps_total_sleep(no_sleep):
+    """No retry is made whose wait would overrun the sleep budget."""
+    calls = 0
+
+    @retry_on_error(max_attempts=5, delay=1, backoff=1)
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        raise APIError("Test", "unavailable")
+
+    with retry_budget_scope(max_sleep=1.6) as budget, pytest.raises(APIError):
+        await flaky()
+
+    assert calls == 2
+    assert budget.retries == 1
+    assert 1 <= no_sleep.await_args.args[0] == budget.slept <= 1.6
+
+
+async def test_attempts_and_waits_recorded_as_stages():
+    """Every attempt and backoff shows up in the import's stage timings."""
+    outcomes = [APIError("Test", "unavailable"), "ok"]
+
+    @retry_on_error(max_attempts=3, delay=0.01)
+    async def flaky():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    recorder = SpanRecorder()
+    with recorder.activate(), retry_budget_scope():
+        assert await flaky() == "ok"
+
+    assert [timing.stage for timing in recorder.spans] == [
+        "retry.flaky",
+        "retry.backoff",
+        "retry.flaky",
+    ]
+
+
+async def test_calls_that_do_not_retry_record_nothing():
+    """A call that succeeds first time adds no stage timings."""
+
+    @retry_on_error(max_attempts=3, delay=0.01)
+    async def steady():
+        return "ok"
+
+    recorder = SpanRecorder()
+    with recorder.activate(), retry_budget_scope():
+        assert await steady() == "ok"
+
+    assert recorder.spans == []
+
+
+async def test_spent_budget_skips_llm_fallback():
+    """With no retries left the primary error is raised, not retried on OpenAI."""
+    service = LLMService(config)
+    service.fallback_provider = MagicMock()
+    fallback = AsyncMock(return_value="ok")
+    operation = LLMOperation(
+        "analyze_text", AsyncMock(side_effect=APIError("Claude", "HTTP 500")), fallback
+    )
+
+    with retry_budget_scope(max_retries=0), pytest.raises(APIError):
+        await service._execute_with_fallback(operation)
+
+    fallback.assert_not_called()
+
+
+async def test_open_circuit_falls_back_without_budget():
+    """Skipping Claude behind an open circuit is not charged as a retry."""
+    service = LLMService(config)
+    service.fallback_provider = MagicMock()
+    fallback = AsyncMock(return_value="ok")
+    operation = LLMOperation(
+        "analyze_text", AsyncMock(side_effect=CircuitOpenError("Claude", 30)), fallback
+    )
+
+    with retry_budget_scope(max_retries=0):
+        assert await service._execute_with_fallback(operation) == "ok"
@@ -0,0 +1,78 @@
+"""Test per-stage import timing."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.importer import EventImporter
+from app.core.schemas import EventData, ImportMethod
+from app.core.timing import SpanRecorder, span, timed
+from config import config
+
+URL = "https://example.com/event/123"
+
+
+async def test_span_outside_import_is_noop():
+    """Spans without an active recorder are simply not recorded."""
+    with span("anything"):
+        pass
+
+
+async def test_recorder_collects_spans_from_child_tasks():
+    """Tasks started while a recorder is active record into it."""
+
+    @timed("child")
+    async def child():
+        await asyncio.sleep(0.01)
+
+    recorder = SpanRecorder()
+    with recorder.activate(), span("parent"):
+        await asyncio.gather(child(), child())
+
+    stages = [timing.stage for timing in recorder.spans]
+    assert stages.count("child") == 2
+    assert stages[-1] == "parent"
+    parent = recorder.spans[-1]
+    assert parent.duration >= max(s.duration for s in recorder.spans[:2])
+
+
+async def test_span_recorded_when_block_raises():
+    """A failing stage still reports how long it ran."""
+    recorder = SpanRecorder()
+    with recorder.activate(), pytest.raises(ValueError), span("failing"):
+        raise ValueError("boom")
+
+    assert [timing.stage for timing in recorder.spans] == ["failing"]
+
+
+async def test_import_result_carries_stage_timings():
+    """Imports report and persist the time spent in each stage."""
+    importer = EventImporter(config)
+
+    async def agent_import(url, _request_id, **_kwargs):
+        with span("extraction.fake"):
+            return EventData(title="Timed Event", venue="Venue", source_url=url)
+
+    agent = MagicMock()
+    agent.import_method = ImportMethod.WEB
+    agent.import_event = AsyncMock(side_effect=agent_import)
+    importer._select_agent = AsyncMock(return_value=agent)
+    importer.process_event = AsyncMock(side_effect=lambda data, *_, **__: (data, []))
+
+    with (
+        patch("app.core.importer.get_fresh_event", return_value=None),
+        patch("app.core.importer.save_event"),
+        patch("app.core.importer.save_stage_timings") as save_timings,
+    ):
+        result = await importer.import_event(URL)
+
+    stages = [timing.stage for timing in result.timings]
+    assert stages == [
+        "import.cache_lookup",
+        "import.routing",
+        "extraction.fake",
+        "import.save",
+    ]
+    save_timings.assert_called_once()
+    assert save_timings.call_args.args[0] == result.timings
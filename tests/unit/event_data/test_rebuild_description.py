@@ -175,7 +175,10 @@ class TestRebuildDescription:
             assert response.data.short_description == "New short description"
             assert response.data.long_description == sample_event_data.long_description
             mock_importer.rebuild_description.assert_called_with(
-                123, description_type="short", supplementary_context="Make it exciting"
+                123,
+                description_type="short",
+                supplementary_context="Make it exciting",
+                fresh=False,
             )
 
 
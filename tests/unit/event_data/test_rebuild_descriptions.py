@@ -164,7 +164,7 @@ class TestRebuildDescriptions:
 
             # Verify importer was called correctly
             mock_importer.rebuild_description.assert_called_with(
-                123, description_type="short", supplementary_context=None
+                123, description_type="short", supplementary_context=None, fresh=False
             )
 
     @pytest.mark.asyncio
@@ -208,6 +208,7 @@ class TestRebuildDescriptions:
                 123,
                 description_type="long",
                 supplementary_context="Holiday special with surprise guests",
+                fresh=False,
             )
 
     @pytest.mark.asyncio
@@ -0,0 +1,148 @@
+"""Tests for the extraction agent registry and URL routing table."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.extraction_agents import registry
+from app.extraction_agents.providers.dice import Dice
+from app.extraction_agents.providers.ra import ResidentAdvisor
+from app.extraction_agents.providers.ticketmaster import Ticketmaster
+from app.extraction_agents.providers.web import Web
+from app.extraction_agents.registry import (
+    AgentRegistry,
+    RoutingTable,
+    URLRoute,
+    get_agent_registry,
+)
+
+EXAMPLE_ROUTE = URLRoute(
+    url_type="example",
+    source="example.com",
+    domains=("example.com",),
+    patterns=(r"/shows/(?P<event_id>\d+)",),
+)
+
+
+def test_routes_subdomains_by_suffix():
+    """Subdomains match, unrelated hosts sharing a suffix string don't."""
+    table = RoutingTable([EXAMPLE_ROUTE])
+
+    assert table.classify("https://tickets.example.com/shows/42") == {
+        "type": "example",
+        "event_id": "42",
+    }
+    assert table.classify("https://notexample.com/shows/42") == {"type": "unknown"}
+
+
+def test_require_match():
+    """Routes that require a pattern match leave other paths unrouted."""
+    lenient = URLRoute(
+        url_type="lenient",
+        source="lenient.com",
+        domains=("lenient.com",),
+        require_match=False,
+    )
+    table = RoutingTable([EXAMPLE_ROUTE, lenient])
+
+    assert table.classify("example.com/about") == {"type": "unknown"}
+    assert table.classify("https://lenient.com/anything") == {"type": "lenient"}
+
+
+def test_host_is_normalized():
+    """Case, www. and ports don't affect routing."""
+    table = RoutingTable([EXAMPLE_ROUTE])
+
+    assert table.classify("HTTPS://WWW.Example.com:8443/shows/7")["event_id"] == "7"
+
+
+def test_classify_many_preserves_order():
+    """Bulk classification matches classifying one by one."""
+    table = get_agent_registry().routing_table
+    urls = [
+        "https://dice.fm/event/q2r5ro-some-event",
+        "https://example.com/events/cool-party",
+        "ra.co/events/123",
+        "https://www.livenation.com/event/G5vYZ9v1AUf-G",
+    ]
+
+    assert table.classify_many(urls) == [table.classify(url) for url in urls]
+    assert [r["type"] for r in table.classify_many(urls)] == [
+        "dice",
+        "unknown",
+        "resident_advisor",
+        "ticketmaster",
+    ]
+
+
+def test_source_for():
+    """URL types resolve to their source buckets."""
+    table = get_agent_registry().routing_table
+
+    assert table.source_for("resident_advisor") == "ra.co"
+    assert table.source_for("dice") == "dice.fm"
+    assert table.source_for("unknown") is None
+
+
+def test_duplicate_url_type_rejected():
+    """Two routes can't claim the same URL type."""
+    with pytest.raises(ValueError, match="Duplicate route"):
+        RoutingTable([EXAMPLE_ROUTE, EXAMPLE_ROUTE])
+
+
+def test_registry_skips_agents_without_route():
+    """Method-selected agents aren't part of URL routing."""
+    agents = AgentRegistry([ResidentAdvisor, Web])
+
+    assert agents.agent_for("resident_advisor") is ResidentAdvisor
+    assert list(agents.agents) == ["resident_advisor"]
+
+
+def test_builtin_agents_are_registered():
+    """The shipped providers are registered under their URL types."""
+    agents = get_agent_registry()
+
+    assert agents.agent_for("resident_advisor") is ResidentAdvisor
+    assert agents.agent_for("ticketmaster") is Ticketmaster
+    assert agents.agent_for("dice") is Dice
+
+
+class ExampleAgent(Web):
+    """A third-party agent routing example.com."""
+
+    route = EXAMPLE_ROUTE
+
+
+def _entry_point(name: str, agent: type | None = None) -> MagicMock:
+    entry_point = MagicMock()
+    entry_point.name = name
+    if agent is None:
+        entry_point.load.side_effect = AttributeError("no such agent")
+    else:
+        entry_point.load.return_value = agent
+    return entry_point
+
+
+def test_plugins_add_to_builtin_agents():
+    """A plugin adds its agent; a broken one is skipped, not fatal."""
+    plugins = [_entry_point("example", ExampleAgent), _entry_point("broken")]
+    get_agent_registry.cache_clear()
+    try:
+        with patch.object(registry, "entry_points", return_value=plugins):
+            agents = get_agent_registry()
+        assert agents.agent_for("example") is ExampleAgent
+        assert agents.agent_for("dice") is Dice
+        assert agents.agent_for("resident_advisor") is ResidentAdvisor
+    finally:
+        get_agent_registry.cache_clear()
+
+
+def test_falls_back_to_builtin_agents_without_entry_points():
+    """Without entry point metadata, the shipped providers are loaded."""
+    get_agent_registry.cache_clear()
+    try:
+        with patch.object(registry, "entry_points", return_value=[]):
+            agents = get_agent_registry()
+        assert agents.agent_for("dice") is Dice
+    finally:
+        get_agent_registry.cache_clear()
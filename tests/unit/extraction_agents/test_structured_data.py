@@ -0,0 +1,193 @@
+"""Tests for the structured data fast path of the web agent."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.extraction_agents.providers.web import Web
+from app.extraction_agents.structured_data import (
+    StructuredDataStats,
+    extract_structured_data,
+    missing_fields,
+)
+from config import Config
+
+URL = "https://venue.example/events/ellen-allien"
+
+EVENT = {
+    "@context": "https://schema.org",
+    "@type": "MusicEvent",
+    "name": "Ellen Allien All Night Long",
+    "startDate": "2025-06-01T22:00:00-07:00",
+    "endDate": "2025-06-02T04:00:00-07:00",
+    "location": {
+        "@type": "Place",
+        "name": "Monarch",
+        "address": {
+            "@type": "PostalAddress",
+            "streetAddress": "101 6th St",
+            "addressLocality": "San Francisco",
+            "addressRegion": "CA",
+            "addressCountry": "US",
+        },
+    },
+    "performer": [{"@type": "MusicGroup", "name": "Ellen Allien"}],
+    "offers": {"@type": "Offer", "price": "25", "priceCurrency": "USD", "url": URL},
+    "image": ["https://venue.example/flyer.jpg"],
+}
+
+
+def _page(*blocks: object, head: str = "") -> str:
+    scripts = "".join(
+        f'<script type="application/ld+json">{json.dumps(block)}</script>'
+        for block in blocks
+    )
+    return f"<html><head>{head}{scripts}</head><body><p>Doors 10pm</p></body></html>"
+
+
+def test_json_ld_event_is_parsed():
+    """A JSON-LD Event inside @graph maps onto EventData."""
+    event = extract_structured_data(
+        _page({"@graph": [{"@type": "WebPage"}, EVENT]}), URL
+    )
+
+    assert event.title == "Ellen Allien All Night Long"
+    assert (event.venue, event.date, event.end_date) == (
+        "Monarch",
+        "2025-06-01",
+        "2025-06-02",
+    )
+    assert (event.time.start, event.time.end) == ("22:00", "04:00")
+    assert event.location.city == "San Francisco"
+    assert event.lineup == ["Ellen Allien"]
+    assert event.cost == "25 USD"
+    assert event.images["full"] == "https://venue.example/flyer.jpg"
+    assert missing_fields(event) == []
+
+
+@pytest.mark.parametrize(
+    "start, city, timezone",
+    [
+        ("2025-06-01T22:00:00-07:00", "San Francisco", "America/Los_Angeles"),
+        ("2025-06-01T22:00:00-07:00", "Oakland", "Etc/GMT+7"),
+        ("2025-06-01T22:00:00Z", "Oakland", "UTC"),
+        ("2025-06-01T22:00:00", "Oakland", None),
+    ],
+)
+def test_timezone_comes_from_the_stated_offset(start, city, timezone):
+    """The start time's UTC offset decides the timezone, not a location guess."""
+    place = {**EVENT["location"]}
+    place["address"] = {**place["address"], "addressLocality": city}
+
+    event = extract_structured_data(
+        _page({**EVENT, "startDate": start, "location": place}), URL
+    )
+
+    assert event.time.timezone == timezone
+
+
+def test_microdata_and_opengraph_fill_gaps():
+    """Microdata is read when there is no JSON-LD; OpenGraph fills the rest."""
+    html = (
+        '<html><head><meta property="og:description" content="A night of techno">'
+        '<meta property="og:image" content="https://venue.example/og.jpg"></head>'
+        '<body><div itemscope itemtype="https://schema.org/Event">'
+        '<h1 itemprop="name">Ellen Allien</h1>'
+        '<time itemprop="startDate" datetime="2025-06-01">June 1</time>'
+        '<div itemprop="location" itemscope itemtype="https://schema.org/Place">'
+        '<span itemprop="name">Monarch</span></div></div></body></html>'
+    )
+
+    event = extract_structured_data(html, URL)
+
+    assert (event.title, event.venue, event.date) == (
+        "Ellen Allien",
+        "Monarch",
+        "2025-06-01",
+    )
+    assert event.long_description == "A night of techno"
+    assert event.images["full"] == "https://venue.example/og.jpg"
+    assert missing_fields(event) == ["time"]
+
+
+def test_opengraph_alone_is_not_an_event():
+    """Without a schema.org Event the page goes through full extraction."""
+    head = (
+        '<meta property="og:title" content="DJ Shadow at The Fillmore | Livenation">'
+        '<meta property="og:description" content="Get tickets now">'
+    )
+
+    assert extract_structured_data(_page(head=head), URL) is None
+
+
+def test_listing_pages_are_not_guessed():
+    """Several events on a page are only used if one is this page's."""
+    other = {**EVENT, "name": "Another Night", "url": "https://venue.example/other"}
+
+    assert extract_structured_data(_page(EVENT, other), URL) is None
+    assert extract_structured_data(_page({**EVENT, "url": URL}, other), URL).title == (
+        "Ellen Allien All Night Long"
+    )
+
+
+@pytest.fixture
+def web(monkeypatch):
+    """A web agent with mocked page fetching and LLM services."""
+    stats = StructuredDataStats()
+    monkeypatch.setattr(
+        "app.extraction_agents.providers.web.get_structured_data_stats", lambda: stats
+    )
+    llm = MagicMock()
+    agent = Web(
+        Config(), services={"http": MagicMock(), "llm": llm, "zyte": MagicMock()}
+    )
+    return agent, llm, stats
+
+
+async def test_complete_structured_data_skips_the_llm(web):
+    """All required fields present: no LLM call at all."""
+    agent, llm, stats = web
+    agent.fetcher.fetch_html = AsyncMock(return_value=_page(EVENT))
+    llm.extract_from_html = AsyncMock()
+    llm.extract_event_data = AsyncMock()
+
+    event = await agent._try_html_extraction(URL, "request")
+
+    assert event.venue == "Monarch"
+    assert event.time.timezone == "America/Los_Angeles"
+    llm.extract_from_html.assert_not_awaited()
+    llm.extract_event_data.assert_not_awaited()
+    assert stats.snapshot()["bypass_rate"] == 1.0
+
+
+async def test_only_missing_fields_are_asked_for(web):
+    """Missing fields go to a small prompt, not full HTML extraction."""
+    agent, llm, stats = web
+    agent.fetcher.fetch_html = AsyncMock(
+        return_value=_page({**EVENT, "startDate": "2025-06-01"})
+    )
+    llm.extract_from_html = AsyncMock()
+    llm.extract_event_data = AsyncMock(
+        return_value={
+            "time": {"start": "10pm"},
+            "venue": "Elsewhere",
+            "genres": ["Techno"],
+        }
+    )
+
+    event = await agent._try_html_extraction(URL, "request")
+
+    assert (event.venue, event.time.start) == ("Monarch", "22:00")
+    assert event.genres == ["Techno"]
+    prompt = llm.extract_event_data.await_args.args[0]
+    assert "missing: time" in prompt
+    assert "Doors 10pm" in prompt
+    llm.extract_from_html.assert_not_awaited()
+    assert stats.snapshot() | {"bypass_rate": None} == {
+        "pages": 1,
+        "bypassed": 0,
+        "partial": 1,
+        "full_llm": 0,
+        "bypass_rate": None,
+    }
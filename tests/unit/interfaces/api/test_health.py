@@ -5,7 +5,9 @@ from unittest.mock import patch
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.errors import APIError
 from app.interfaces.api.server import create_app
+from app.shared.circuit_breaker import get_circuit_breakers
 
 
 @pytest.fixture
@@ -63,3 +65,19 @@ def test_health_check_with_api_keys(client):
         assert "image" in features
         assert "ai_extraction" in features
         assert "ticketfairy" in integrations
+
+
+async def test_health_check_reports_open_circuits(client):
+    """Open circuit breakers mark the service as degraded."""
+    breakers = get_circuit_breakers()
+    breaker = breakers.get("Zyte")
+    for _ in range(breakers.settings.min_calls):
+        with pytest.raises(APIError):
+            async with breaker.guard():
+                raise APIError("Zyte", "HTTP 503", 503)
+
+    data = client.get("/api/v1/health").json()
+
+    assert data["status"] == "degraded"
+    assert data["circuit_breakers"]["Zyte"]["state"] == "open"
+    assert data["circuit_breakers"]["Zyte"]["failure_rate"] == 1.0
@@ -6,7 +6,7 @@ from unittest.mock import patch
 import pytest
 from click.testing import CliRunner
 
-from app.core.schemas import EventData, EventLocation, EventTime
+from app.core.schemas import BatchImportSummary, EventData, EventLocation, EventTime
 from app.interfaces.cli.commands import cli
 from app.shared.database.models import Event
 
@@ -169,3 +169,61 @@ class TestEventsCLI:
             assert args[1] == "api"  # method
             assert args[2] == 30  # timeout
             assert args[3] is True  # ignore_cache
+
+    def test_import_requires_url_or_file(self, runner):
+        """Test importing without a URL or --file is a usage error."""
+        result = runner.invoke(cli, ["events", "import"])
+
+        assert result.exit_code == 2
+        assert "Missing URL" in result.output
+
+    def test_import_from_file(self, runner, tmp_path):
+        """Test importing a file of URLs runs a batch import."""
+        url_file = tmp_path / "urls.txt"
+        url_file.write_text(
+            "# weekend\nhttps://example.com/a\n\nhttps://example.com/b\n"
+        )
+        summary = BatchImportSummary(total=2, succeeded=2, elapsed=3.0)
+
+        with patch(
+            "app.interfaces.cli.import_event._perform_batch_import"
+        ) as mock_batch:
+            mock_batch.return_value = summary
+            result = runner.invoke(
+                cli,
+                ["events", "import", "--file", str(url_file), "-c", "4", "-t", "30"],
+            )
+
+        assert result.exit_code == 0
+        assert "Imported 2/2 events" in result.output
+        assert "40.0 imports/min" in result.output
+        mock_batch.assert_called_once_with(
+            ["https://example.com/a", "https://example.com/b"], 4, 30, False
+        )
+
+    def test_import_from_file_rejects_method(self, runner, tmp_path):
+        """Test --method is refused for batch imports, which can't force it."""
+        url_file = tmp_path / "urls.txt"
+        url_file.write_text("https://example.com/a\n")
+
+        result = runner.invoke(
+            cli, ["events", "import", "-f", str(url_file), "-m", "web"]
+        )
+
+        assert result.exit_code == 2
+        assert "--method cannot be used with --file" in result.output
+
+    def test_import_from_file_reports_failures(self, runner, tmp_path):
+        """Test a batch with failed imports exits non-zero."""
+        url_file = tmp_path / "urls.txt"
+        url_file.write_text("https://example.com/a\n")
+        summary = BatchImportSummary(total=1, failed=1, elapsed=1.0)
+
+        with patch(
+            "app.interfaces.cli.import_event._perform_batch_import"
+        ) as mock_batch:
+            mock_batch.return_value = summary
+            result = runner.invoke(cli, ["events", "import", "-f", str(url_file)])
+
+        assert result.exit_code == 1
+        assert "1 imports failed" in result.output
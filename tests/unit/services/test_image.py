@@ -0,0 +1,51 @@
+"""Tests for the image service download session."""
+
+from io import BytesIO
+from unittest.mock import AsyncMock, patch
+
+from PIL import Image
+
+from app.services.image import DownloadedImage, ImageService
+
+
+async def test_rate_image_reuses_download_session(image_service: ImageService):
+    """Rating candidates downloads through one long-lived session."""
+    download = AsyncMock(return_value=b"not an image")
+
+    with (
+        patch("app.services.image.HTTPService") as http_service_class,
+        patch.object(image_service.downloads, "download", download),
+    ):
+        for i in range(3):
+            await image_service.rate_image(f"https://example.com/{i}.jpg")
+
+    http_service_class.assert_not_called()
+    assert download.await_count == 3
+
+
+async def test_download_session_has_its_own_pool(image_service: ImageService):
+    """Image downloads don't share the API session's connection pool."""
+    downloads = image_service.downloads
+
+    assert downloads is not image_service.http
+    assert downloads.max_connections == image_service.config.http.image_max_connections
+    assert (
+        downloads.max_connections_per_host
+        == image_service.config.http.image_max_connections_per_host
+    )
+
+
+async def test_validate_and_download_keeps_download_buffer(
+    image_service: ImageService,
+):
+    """The validated image is the downloaded buffer, not a copy of it."""
+    png = BytesIO()
+    Image.new("RGB", (640, 520)).save(png, format="PNG")
+    data = memoryview(png.getvalue())
+    download = AsyncMock(return_value=data)
+
+    with patch.object(image_service.downloads, "download", download):
+        result = await image_service.validate_and_download("https://x.com/a.png")
+
+    assert result == DownloadedImage(data, "image/jpeg", 640, 520)
+    assert result.data is data
@@ -0,0 +1,75 @@
+"""Tests for the persistent LLM response cache."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.llm.cache import LLMResponseCache, fresh_llm_responses
+from app.services.llm.providers.claude import Claude
+from config import Config
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """A cache in a temporary file."""
+    return LLMResponseCache(tmp_path / "llm.db", ttl=60, max_bytes=1024)
+
+
+@pytest.fixture
+def claude(cache):
+    """Claude with a mocked client, answering through the cache."""
+    config = Config()
+    config.api.anthropic_api_key = "test-key"
+    provider = Claude(config)
+    provider.response_cache = cache
+    response = MagicMock(content=[MagicMock(text="techno")])
+    provider.client = MagicMock()
+    provider.client.messages.create = AsyncMock(return_value=response)
+    return provider
+
+
+async def test_identical_calls_are_answered_from_cache(claude, cache):
+    """A repeated prompt is not sent again; a different one is."""
+    assert await claude.analyze_text("genres?") == "techno"
+    assert await claude.analyze_text("genres?") == "techno"
+    assert claude.client.messages.create.await_count == 1
+
+    await claude.analyze_text("venue?")
+    assert claude.client.messages.create.await_count == 2
+    assert cache.stats()["Claude.analyze_text"] == {
+        "hits": 1,
+        "misses": 2,
+        "hit_rate": 0.333,
+    }
+
+
+async def test_fresh_responses_bypass_lookups(claude):
+    """Inside fresh_llm_responses() every call reaches the provider."""
+    await claude.analyze_text("genres?")
+    with fresh_llm_responses():
+        await claude.analyze_text("genres?")
+
+    assert claude.client.messages.create.await_count == 2
+
+
+def test_key_covers_model_temperature_and_tool():
+    """Anything that changes the answer changes the key."""
+    base = {"model": "m", "temperature": 0.1, "tool": {"name": "t"}, "prompt": "p"}
+    key = LLMResponseCache.key(**base)
+
+    assert LLMResponseCache.key(**base) == key
+    for change in ({"model": "n"}, {"temperature": 0.2}, {"tool": {"name": "u"}}):
+        assert LLMResponseCache.key(**{**base, **change}) != key
+
+
+async def test_entries_expire_and_are_evicted(cache):
+    """Entries past the TTL are misses; the file stays under max_bytes."""
+    await cache.store("old", {"genres": ["house"]})
+    with patch("app.services.llm.cache.time.time", return_value=time.time() + 120):
+        assert await cache.get("op", "old") is None
+
+    for index in range(20):
+        await cache.store(f"key{index}", "x" * 100)
+    assert await cache.get("op", "key19") == "x" * 100
+    assert await cache.get("op", "key0") is None
@@ -0,0 +1,128 @@
+"""Tests for local description post-processing."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.schemas import EventData
+from app.extraction_agents.providers.ra import ResidentAdvisor
+from app.extraction_agents.providers.web import Web
+from app.services.llm.descriptions import DescriptionStats, fit_descriptions
+from app.services.llm.service import LLMService
+from config import Config
+from config.processing import ProcessingConfig
+
+LIMITS = ProcessingConfig()
+LONG = (
+    "Berlin techno pioneer Ellen Allien returns for an extended set of raw, "
+    "driving techno. Expect deep cuts from her BPitch Control catalogue and "
+    "fresh material from her latest album, played on a system built for it."
+)
+
+
+def test_short_description_is_cut_at_a_boundary():
+    """An over-long short description keeps its first sentence, in whole words."""
+    event = EventData(
+        title="Ellen Allien",
+        long_description=LONG,
+        short_description="Ellen Allien plays an extended techno set at the club "
+        "all night long with special guests. Tickets on sale now",
+    )
+
+    fitted = fit_descriptions(event, LIMITS)
+
+    assert len(fitted.short_description) <= LIMITS.short_description_max_length
+    assert fitted.short_description.endswith("special guests")
+    assert fitted.long_description == event.long_description
+
+
+def test_missing_short_description_comes_from_long():
+    """The long description's first sentence becomes the short one if it fits."""
+    event = EventData(
+        title="Ellen Allien",
+        long_description="Ellen Allien plays all night. " + LONG,
+    )
+
+    assert fit_descriptions(event, LIMITS).short_description == (
+        "Ellen Allien plays all night"
+    )
+
+
+def test_short_long_description_is_completed_from_facts():
+    """Lineup and venue complete a long description below the minimum."""
+    event = EventData(
+        title="Ellen Allien All Night Long",
+        venue="Monarch",
+        date="2025-06-01",
+        lineup=["Ellen Allien", "Sassmouth", "Dreamcast"],
+        long_description="An all night techno session with a Berlin legend, "
+        "playing from open to close on the main floor",
+    )
+
+    fitted = fit_descriptions(event, LIMITS)
+
+    assert len(fitted.long_description) >= LIMITS.long_description_min_length
+    assert "Featuring Ellen Allien, Sassmouth and Dreamcast" in fitted.long_description
+    assert fitted.long_description.startswith(event.long_description)
+    assert fitted.long_description.endswith("on 2025-06-01.")
+
+
+def test_long_descriptions_are_never_shortened():
+    """A source description beyond the prompt's maximum is kept whole."""
+    long = " ".join([LONG] * 10)
+    event = EventData(title="Ellen Allien", long_description=long)
+
+    fitted = fit_descriptions(event, LIMITS)
+
+    assert fitted.long_description == event.long_description
+    assert len(fitted.long_description) > LIMITS.long_description_max_length
+
+
+@pytest.fixture
+def web():
+    """A web agent whose LLM service answers description calls."""
+    llm = LLMService.__new__(LLMService)
+    llm.config = Config()
+    llm.generate_descriptions = AsyncMock(side_effect=lambda event, **_: event)
+    agent = Web(
+        Config(), services={"http": MagicMock(), "llm": llm, "zyte": MagicMock()}
+    )
+    return agent, llm
+
+
+async def test_llm_is_only_called_when_local_fixes_fall_short(web, monkeypatch):
+    """Fitted descriptions skip the LLM; unfixable ones are counted and sent."""
+    agent, llm = web
+    stats = DescriptionStats()
+    monkeypatch.setattr(
+        "app.extraction_agents.base.get_description_stats", lambda: stats
+    )
+
+    event = EventData(title="Ellen Allien", long_description=LONG + " " + LONG)
+    fitted = await agent.enhance_descriptions(event, "request")
+    llm.generate_descriptions.assert_not_awaited()
+    assert fitted.short_description
+
+    await agent.enhance_descriptions(EventData(title="Ellen Allien"), "request")
+    llm.generate_descriptions.assert_awaited_once()
+    assert stats.snapshot() | {"mean_llm_latency": None} == {
+        "checked": 2,
+        "fixed_locally": 1,
+        "llm_calls": 1,
+        "llm_failures": 0,
+        "llm_share": 0.5,
+        "mean_llm_latency": None,
+    }
+
+
+async def test_api_agents_keep_llm_generated_descriptions(web):
+    """Only web and image answers are fitted; API events go to the LLM."""
+    _, llm = web
+    agent = ResidentAdvisor(Config(), services={"http": MagicMock(), "llm": llm})
+
+    event = EventData(title="Ellen Allien", long_description=LONG + " " + LONG)
+
+    await agent.enhance_descriptions(event, "request")
+
+    llm.generate_descriptions.assert_awaited_once()
+    assert llm.generate_descriptions.await_args.args[0] == event
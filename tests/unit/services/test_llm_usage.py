@@ -0,0 +1,110 @@
+"""Tests for Claude prompt caching and token usage tracking."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.deadline import DeadlineExceededError, deadline_scope
+from app.core.schemas import EventData
+from app.services.llm.prompts import EventPrompts
+from app.services.llm.providers.claude import CACHE_BREAKPOINT, Claude
+from app.services.llm.usage import TokenUsage
+from config import Config
+
+INSTRUCTIONS = EventPrompts.build_extraction_instructions(True, True)
+
+
+@pytest.fixture
+def claude():
+    """Claude with a mocked client answering one tool call."""
+    config = Config()
+    config.api.anthropic_api_key = "test-key"
+    provider = Claude(config)
+    provider.response_cache = None
+    provider.usage = TokenUsage()
+    tool_use = MagicMock(type="tool_use", input={"genres": ["techno"]})
+    usage = MagicMock(
+        input_tokens=40,
+        output_tokens=10,
+        cache_read_input_tokens=900,
+        cache_creation_input_tokens=0,
+    )
+    provider.client = MagicMock()
+    provider.client.messages.create = AsyncMock(
+        return_value=MagicMock(content=[tool_use], usage=usage)
+    )
+    return provider
+
+
+async def test_static_prefix_is_marked_for_caching(claude):
+    """The last tool and the system prompt carry a cache breakpoint."""
+    result = await claude._call_with_tool("event", system=INSTRUCTIONS)
+    assert result == {"genres": ["techno"]}
+
+    kwargs = claude.client.messages.create.await_args.kwargs
+    assert kwargs["system"] == [
+        {"type": "text", "text": INSTRUCTIONS, "cache_control": CACHE_BREAKPOINT}
+    ]
+    assert kwargs["tools"][-1]["cache_control"] == CACHE_BREAKPOINT
+    assert kwargs["messages"] == [{"role": "user", "content": "event"}]
+    assert "cache_control" not in claude.EXTRACTION_TOOL
+
+
+async def test_short_prefixes_are_not_marked(claude):
+    """Prefixes below the cache minimum, like genre calls, get no breakpoint."""
+    await claude.enhance_genres(EventData(title="Event", genres=["house"]))
+
+    kwargs = claude.client.messages.create.await_args.kwargs
+    assert kwargs["tools"] == [claude.GENRE_TOOL]
+    assert "system" not in kwargs
+
+
+async def test_usage_is_recorded_per_operation(claude):
+    """Token counts add up per operation, split by prompt cache reads."""
+    await claude._call_with_tool("one", system=INSTRUCTIONS)
+    await claude._call_with_tool("two", system=INSTRUCTIONS)
+
+    stats = claude.usage.snapshot()["Claude.extract_event_data"]
+    assert stats["calls"] == stats["cache_read_calls"] == 2
+    assert stats["input_tokens"] == 80
+    assert stats["cache_read_tokens"] == 1800
+    assert stats["mean_latency_cache_read"] is not None
+    assert stats["mean_latency_uncached"] is None
+
+
+async def test_cache_writes_and_reads_are_kept_apart_per_operation(claude):
+    """Each operation reports the cache tokens from its own responses."""
+    claude.client.messages.create.return_value.usage = MagicMock(
+        input_tokens=50,
+        output_tokens=5,
+        cache_read_input_tokens=None,
+        cache_creation_input_tokens=1100,
+    )
+    await claude._call_with_tool("event", system=INSTRUCTIONS)
+    claude.client.messages.create.return_value.usage = MagicMock(
+        input_tokens=30,
+        output_tokens=5,
+        cache_read_input_tokens=0,
+        cache_creation_input_tokens=0,
+    )
+    await claude.enhance_genres(EventData(title="Event", genres=["house"]))
+
+    stats = claude.usage.snapshot()
+    assert stats["Claude.extract_event_data"]["cache_write_tokens"] == 1100
+    assert stats["Claude.extract_event_data"]["cache_read_tokens"] == 0
+    assert stats["Claude.enhance_genres"]["cache_write_tokens"] == 0
+    assert stats["Claude.enhance_genres"]["cache_read_calls"] == 0
+    assert stats["Claude.enhance_genres"]["input_tokens"] == 30
+
+
+async def test_expired_deadline_is_not_an_api_error(claude):
+    """Tool and vision calls past the deadline raise DeadlineExceededError."""
+    with deadline_scope(0.01):
+        await asyncio.sleep(0.02)
+        with pytest.raises(DeadlineExceededError):
+            await claude._call_with_tool("event", system=INSTRUCTIONS)
+        with pytest.raises(DeadlineExceededError):
+            await claude._call_with_vision("event", "aW1n", "image/png")
+
+    claude.client.messages.create.assert_not_awaited()
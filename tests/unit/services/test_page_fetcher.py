@@ -0,0 +1,64 @@
+"""Tests for tiered page fetching."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.errors import APIError
+from app.services.page_fetcher import FetchTier, PageFetcher, is_sufficient
+from config import Config
+
+URL = "https://www.venue.example/events/1"
+
+STATIC_PAGE = (
+    f"<html><body><p>{'Ellen Allien plays all night. ' * 30}</p></body></html>"
+)
+APP_SHELL = (
+    '<html><body><div id="root"></div><script src="/app.js"></script>'
+    "<noscript>You need to enable JavaScript to run this app.</noscript>"
+    "</body></html>"
+)
+RENDERED_PAGE = "<html><body><h1>Ellen Allien</h1></body></html>"
+
+
+@pytest.fixture
+def fetcher():
+    """A fetcher whose three tiers are mocked."""
+    http, zyte = MagicMock(), MagicMock()
+    http.get_text = AsyncMock(return_value=STATIC_PAGE)
+    zyte.fetch_http_body = AsyncMock(return_value=STATIC_PAGE)
+    zyte.fetch_html = AsyncMock(return_value=RENDERED_PAGE)
+    return PageFetcher(Config(), http, zyte)
+
+
+def test_sufficiency_check():
+    """Visible text or JSON-LD event data suffice; app shells don't."""
+    assert is_sufficient(STATIC_PAGE, URL, 500)
+    assert not is_sufficient(APP_SHELL, URL, 500)
+    event = json.dumps({"@type": "MusicEvent", "description": "Techno " * 40})
+    json_ld = f'<script type="application/ld+json">{event}</script>'
+    assert is_sufficient(f"<html><head>{json_ld}</head><body></body></html>", URL, 500)
+
+
+async def test_static_pages_skip_zyte(fetcher):
+    """A sufficient direct fetch is used, and remembered for the domain."""
+    assert await fetcher.fetch_html(URL) == STATIC_PAGE
+
+    fetcher.zyte.fetch_http_body.assert_not_awaited()
+    fetcher.zyte.fetch_html.assert_not_awaited()
+    assert fetcher._get_cached("venue.example") is FetchTier.HTTP
+
+
+async def test_tiers_escalate_and_later_imports_start_at_the_winner(fetcher):
+    """Blocked and client-rendered pages end up in the browser, once."""
+    fetcher.http.get_text.side_effect = APIError("Web", "Forbidden", status_code=403)
+    fetcher.zyte.fetch_http_body.return_value = APP_SHELL
+
+    assert await fetcher.fetch_html(URL) == RENDERED_PAGE
+    assert await fetcher.fetch_html("https://venue.example/events/2") == RENDERED_PAGE
+
+    assert fetcher.http.get_text.await_count == 1
+    assert fetcher.zyte.fetch_http_body.await_count == 1
+    assert fetcher.zyte.fetch_html.await_count == 2
+    assert fetcher._get_cached("venue.example") is FetchTier.ZYTE_BROWSER
@@ -0,0 +1,46 @@
+"""Fixtures for the shared service tests."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+BLOB = bytes(range(256)) * 1024
+
+
+@pytest.fixture
+def blob() -> bytes:
+    """The binary body served at /blob."""
+    return BLOB
+
+
+@pytest.fixture
+async def server():
+    """Local server with a JSON body, a binary blob and a body that never ends."""
+    finish = asyncio.Event()
+
+    async def small(_request: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    async def endless(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(b"x")
+        await finish.wait()
+        return response
+
+    async def blob(_request: web.Request) -> web.Response:
+        return web.Response(body=BLOB)
+
+    app = web.Application()
+    app.router.add_route("*", "/small", small)
+    app.router.add_get("/endless", endless)
+    app.router.add_get("/blob", blob)
+    runner = web.AppRunner(app, shutdown_timeout=0)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    finish.set()
+    await runner.cleanup()
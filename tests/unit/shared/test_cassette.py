@@ -0,0 +1,90 @@
+"""Test recording and replaying upstream exchanges."""
+
+import json
+from unittest.mock import patch
+
+import aiohttp
+import httpx
+import pytest
+
+from app.core.errors import CassetteError
+from app.shared.cassette import Cassette, CassetteTransport
+from app.shared.http import HTTPService
+from config import Config
+
+LLM_URL = "https://api.anthropic.com/v1/messages"
+
+
+def _http_with(cassette: Cassette) -> HTTPService:
+    http = HTTPService(Config())
+    http.cassette = cassette
+    return http
+
+
+async def test_replays_http_service_exchanges_offline(tmp_path, server, blob):
+    """What HTTPService recorded is served again without the network."""
+    path = tmp_path / "cassette.json"
+    recording = _http_with(Cassette(path, "record"))
+    assert await recording.get_json(f"{server}/small", params={"q": 1}) == {"ok": True}
+    assert await recording.download(f"{server}/blob") == blob
+    await recording.close()
+    recording.cassette.save()
+
+    replaying = _http_with(Cassette(path, "replay"))
+    offline = patch.object(
+        aiohttp.ClientSession, "_request", side_effect=AssertionError("network")
+    )
+    with offline:
+        assert await replaying.get_json(f"{server}/small", params={"q": 1}) == {
+            "ok": True
+        }
+        assert await replaying.download(f"{server}/blob") == blob
+        with pytest.raises(CassetteError, match="No recorded response"):
+            await replaying.get(f"{server}/other")
+    await replaying.close()
+
+
+def test_credentials_are_redacted(tmp_path):
+    """API keys in query strings never reach the file, yet still match."""
+    cassette = Cassette(tmp_path / "cassette.json", "record")
+    url = "https://www.googleapis.com/customsearch/v1?key=secret&q=artist"
+    cassette.record("GET", url, None, 200, [], b"{}", 0.1)
+    cassette.save()
+
+    assert "secret" not in cassette.path.read_text()
+    replay = Cassette(cassette.path, "replay")
+    other_key = url.replace("secret", "another")
+    assert replay.find("GET", other_key, None).body == b"{}"
+
+
+def test_rejects_other_format_versions(tmp_path):
+    """A cassette in an unknown format asks to be re-recorded."""
+    path = tmp_path / "cassette.json"
+    path.write_text(json.dumps({"version": 0, "interactions": []}))
+
+    with pytest.raises(CassetteError, match="record it again"):
+        Cassette(path, "replay")
+
+
+async def test_llm_transport_records_and_replays(tmp_path):
+    """SDK requests replay by body, falling back to the next one for the URL."""
+    path = tmp_path / "cassette.json"
+    answers = iter([b'{"answer": 1}', b'{"answer": 2}'])
+    network = httpx.MockTransport(
+        lambda _request: httpx.Response(200, content=next(answers))
+    )
+    recording = Cassette(path, "record")
+    async with httpx.AsyncClient(
+        transport=CassetteTransport(recording, network)
+    ) as client:
+        await client.post(LLM_URL, json={"prompt": "first"})
+        await client.post(LLM_URL, json={"prompt": "second"})
+    recording.save()
+
+    replaying = Cassette(path, "replay")
+    async with httpx.AsyncClient(transport=CassetteTransport(replaying)) as client:
+        second = await client.post(LLM_URL, json={"prompt": "second"})
+        changed = await client.post(LLM_URL, json={"prompt": "first, today"})
+
+    assert second.json() == {"answer": 2}
+    assert changed.json() == {"answer": 1}
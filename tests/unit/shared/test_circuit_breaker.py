@@ -0,0 +1,158 @@
+"""Test circuit breakers for external services."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from anthropic import APITimeoutError, InternalServerError
+
+from app.core.deadline import deadline_scope
+from app.core.errors import (
+    APIError,
+    AuthenticationError,
+    CircuitOpenError,
+    RequestTimeoutError,
+)
+from app.core.importer import EventImporter
+from app.core.schemas import EventData
+from app.services.llm.service import LLMOperation, LLMService, _is_outage
+from app.shared.circuit_breaker import CircuitBreaker, CircuitState
+from app.shared.http import HTTPService
+from config import config
+from config.circuit_breaker import CircuitBreakerConfig
+
+SETTINGS = CircuitBreakerConfig(min_calls=2, failure_rate=0.5, open_seconds=30)
+
+
+async def _fail(breaker: CircuitBreaker, error: Exception | None = None) -> None:
+    error = error or APIError("Zyte", "HTTP 502", 502)
+    with pytest.raises(type(error)):
+        async with breaker.guard(HTTPService._is_outage):
+            raise error
+
+
+async def test_opens_after_failure_rate_and_fails_fast():
+    """Once enough recent calls fail, calls are refused without running."""
+    breaker = CircuitBreaker("Zyte", SETTINGS)
+    await _fail(breaker)
+    assert breaker.state == CircuitState.CLOSED
+    await _fail(breaker)
+
+    assert breaker.state == CircuitState.OPEN
+    call = AsyncMock()
+    with pytest.raises(CircuitOpenError):
+        async with breaker.guard():
+            await call()
+    call.assert_not_called()
+
+
+async def test_client_errors_do_not_open_circuit():
+    """A 404 says the request was bad, not that the service is down."""
+    breaker = CircuitBreaker("Ticketmaster", SETTINGS)
+    for _ in range(3):
+        await _fail(breaker, APIError("Ticketmaster", "HTTP 404", 404))
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_timeouts_from_the_deadline_do_not_open_circuit():
+    """A timeout shortened to an import's remaining time is not an outage."""
+    timeout = RequestTimeoutError("Zyte request timed out")
+    assert HTTPService._is_outage(timeout)
+    with deadline_scope(0.01):
+        await asyncio.sleep(0.02)
+        assert not HTTPService._is_outage(timeout)
+
+
+async def test_slow_calls_open_circuit():
+    """A service that answers, but too slowly, is treated as down."""
+    settings = SETTINGS.model_copy(update={"slow_call_seconds": 0.01})
+    breaker = CircuitBreaker("Claude", settings)
+    for _ in range(settings.min_calls):
+        async with breaker.guard():
+            await asyncio.sleep(0.02)
+
+    assert breaker.state == CircuitState.OPEN
+
+
+def _wrapped(cause: Exception) -> APIError:
+    """An error as the providers raise it, wrapped in APIError."""
+    try:
+        raise APIError("Claude", str(cause)) from cause
+    except APIError as e:
+        return e
+
+
+def _status_error(error_class: type[Exception], status: int) -> Exception:
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(status, request=request)
+    return error_class("error", response=response, body=None)
+
+
+@pytest.mark.parametrize(
+    "cause, outage",
+    [
+        (_status_error(InternalServerError, 529), True),
+        (APITimeoutError(httpx.Request("POST", "https://api.anthropic.com")), True),
+        (AuthenticationError("Claude"), False),
+        (json.JSONDecodeError("Expecting value", "", 0), False),
+        (ValueError("1 validation error for EventData"), False),
+    ],
+)
+def test_llm_errors_judged_by_their_cause(cause, outage):
+    """Only provider errors that say Claude is unhealthy count against it."""
+    assert _is_outage(_wrapped(cause)) is outage
+
+
+@pytest.mark.parametrize("probe_fails, expected", [(False, "closed"), (True, "open")])
+async def test_half_open_probe(probe_fails, expected):
+    """After open_seconds one probe decides whether the circuit closes."""
+    breaker = CircuitBreaker("Zyte", SETTINGS)
+    await _fail(breaker)
+    await _fail(breaker)
+
+    with patch("app.shared.circuit_breaker.time.monotonic", return_value=1e12):
+        if probe_fails:
+            await _fail(breaker)
+        else:
+            async with breaker.guard():
+                assert breaker.state == CircuitState.HALF_OPEN
+                assert breaker.is_open  # only one probe at a time
+
+    assert breaker.state == expected
+
+
+async def test_llm_goes_straight_to_fallback_while_claude_is_open():
+    """An open Claude circuit skips the primary provider entirely."""
+    service = LLMService(config)
+    service.fallback_provider = MagicMock()
+    primary = AsyncMock(side_effect=APIError("Claude", "overloaded", 529))
+    fallback = AsyncMock(return_value="ok")
+
+    for _ in range(service.circuit_breakers.settings.min_calls):
+        operation = LLMOperation("analyze_text", primary, fallback)
+        assert await service._execute_with_fallback(operation) == "ok"
+    primary.reset_mock()
+
+    operation = LLMOperation("analyze_text", primary, fallback)
+    assert await service._execute_with_fallback(operation) == "ok"
+    primary.assert_not_called()
+
+
+async def test_optional_enrichment_skipped_while_open():
+    """Image enhancement is skipped while image search is down."""
+    importer = EventImporter(config)
+    breaker = importer.circuit_breakers.get("GoogleImageSearch")
+    for _ in range(importer.circuit_breakers.settings.min_calls):
+        await _fail(breaker)
+    importer._enhance_image = AsyncMock()
+    event_data = EventData(title="Event")
+
+    _, failures = await importer.process_event(
+        event_data, "request-id", enhance_genres=False
+    )
+
+    importer._enhance_image.assert_not_called()
+    assert [(f.service, f.error) for f in failures] == [("image", "Circuit open")]
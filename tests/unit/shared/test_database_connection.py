@@ -0,0 +1,66 @@
+"""Tests for database connection helpers."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.shared.database.connection import create_db_engine, run_db, run_db_write
+from config.database import DatabaseConfig
+
+
+@pytest.mark.asyncio
+async def test_run_db_runs_off_the_event_loop_thread():
+    """Blocking database work runs on the database executor."""
+    loop_thread = threading.get_ident()
+
+    def work(a, b=0):
+        return threading.get_ident(), a + b
+
+    worker_thread, total = await run_db(work, 1, b=2)
+
+    assert total == 3
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_run_db_propagates_exceptions():
+    """Errors raised by the database call reach the awaiting caller."""
+
+    def fail():
+        raise ValueError("locked")
+
+    with pytest.raises(ValueError, match="locked"):
+        await run_db(fail)
+
+
+def test_create_db_engine_applies_profile(tmp_path):
+    """New connections get the configured pragmas."""
+    profile = DatabaseConfig(cache_size_kib=2048, busy_timeout_ms=1234)
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'events.db'}", profile)
+
+    with engine.connect() as conn:
+
+        def pragma(name):
+            return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("busy_timeout") == 1234
+        assert pragma("cache_size") == -2048
+        assert pragma("temp_store") == 2  # MEMORY
+        assert pragma("foreign_keys") == 1
+
+    assert engine.pool.size() == profile.read_pool_size + 1
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_run_db_write_serializes_on_one_thread():
+    """All writes run on the same dedicated writer thread."""
+    threads = await asyncio.gather(
+        *(run_db_write(threading.get_ident) for _ in range(5))
+    )
+
+    assert len(set(threads)) == 1
+    assert threads[0] != threading.get_ident()
@@ -1,11 +1,13 @@
 """Tests for database utility functions."""
 
+from datetime import timedelta
+
 import pytest
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from app.core.schemas import EventData
-from app.shared.database.utils import get_event, save_event
+from app.shared.database.utils import get_event, get_fresh_event, save_event
 
 
 @pytest.fixture
@@ -106,3 +108,61 @@ def test_get_event_twice(db_session: Session, sample_event):
     assert first_get is not None
     assert second_get is not None
     assert first_get["title"] == second_get["title"]
+
+
+def test_get_fresh_event_within_ttl(db_session: Session, sample_event):
+    """Test a recently saved event is returned as fresh."""
+    url = "https://example.com/event/123"
+    save_event(url=url, event_data=sample_event.model_dump(), db=db_session)
+
+    fresh = get_fresh_event(url, timedelta(hours=1), db=db_session)
+
+    assert fresh is not None
+    assert fresh["title"] == "Test Event"
+    assert "_db_id" in fresh
+
+
+@pytest.mark.parametrize(
+    "spelling",
+    [
+        "https://example.com/event/123/",
+        "http://www.example.com/event/123",
+        "https://Example.com/event/123?utm_source=newsletter",
+    ],
+)
+def test_get_fresh_event_matches_url_spellings(
+    db_session: Session, sample_event, spelling
+):
+    """Test a stored event is found under other spellings of its URL."""
+    url = "https://example.com/event/123"
+    save_event(url=url, event_data=sample_event.model_dump(), db=db_session)
+
+    assert get_fresh_event(spelling, timedelta(hours=1), db=db_session) is not None
+    assert (
+        get_fresh_event(
+            "https://example.com/event/124", timedelta(hours=1), db=db_session
+        )
+        is None
+    )
+
+
+def test_get_fresh_event_expired(db_session: Session, sample_event):
+    """Test an event older than the TTL is not returned."""
+    url = "https://example.com/event/123"
+    event = save_event(url=url, event_data=sample_event.model_dump(), db=db_session)
+    event.updated_at = event.updated_at - timedelta(days=2)
+    db_session.flush()
+
+    assert get_fresh_event(url, timedelta(days=1), db=db_session) is None
+
+
+def test_resave_unchanged_event_refreshes_freshness(db_session: Session, sample_event):
+    """Test re-saving identical data marks the event as fresh again."""
+    url = "https://example.com/event/123"
+    event = save_event(url=url, event_data=sample_event.model_dump(), db=db_session)
+    event.updated_at = event.updated_at - timedelta(days=2)
+    db_session.flush()
+
+    save_event(url=url, event_data=sample_event.model_dump(), db=db_session)
+
+    assert get_fresh_event(url, timedelta(days=1), db=db_session) is not None
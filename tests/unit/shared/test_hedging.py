@@ -0,0 +1,83 @@
+"""Test hedged requests."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.errors import APIError
+from app.shared.hedging import Hedger
+from app.shared.http import HTTPService
+from config import Config
+
+SERVICE = "GoogleImageSearch"
+
+
+@pytest.fixture
+def hedger():
+    """Hedger for one service that hedges after five samples."""
+    hedger = Hedger({SERVICE}, percentile=90, max_share=0.5, min_samples=5)
+    hedger.stats(SERVICE).latencies.extend([0.01] * 5)
+    return hedger
+
+
+def _attempts(*delays: float, fail: bool = False):
+    """A send() whose successive calls take the given times."""
+    calls = iter(enumerate(delays))
+
+    async def send():
+        number, delay = next(calls)
+        await asyncio.sleep(delay)
+        if fail:
+            raise APIError(SERVICE, f"attempt {number} failed")
+        return number
+
+    return send
+
+
+async def test_slow_request_is_hedged(hedger):
+    """A request slower than p90 is raced by a hedge that answers first."""
+    result = await asyncio.wait_for(hedger.run(SERVICE, _attempts(1, 0.01)), 0.5)
+    assert result == 1
+
+    await hedger.settle()
+    stats = hedger.snapshot()[SERVICE]
+    assert stats["hedges"] == stats["hedge_wins"] == 1
+    assert stats["latency_saved"] > 0.5
+
+
+async def test_fast_request_is_not_hedged(hedger):
+    """Requests answering within p90 are sent once."""
+    send = AsyncMock(return_value="ok")
+
+    assert await hedger.run(SERVICE, send) == "ok"
+    send.assert_awaited_once()
+    assert hedger.stats(SERVICE).hedges == 0
+
+
+async def test_hedges_respect_quota(hedger):
+    """No hedge without a rate limit token or beyond the hedge share."""
+    assert await hedger.run(SERVICE, _attempts(0.05), lambda: False) == 0
+
+    hedger.stats(SERVICE).recent_hedges.extend([True] * 10)
+    assert await hedger.run(SERVICE, _attempts(0.05)) == 0
+    assert hedger.stats(SERVICE).hedges == 0
+
+
+async def test_original_error_raised_when_both_fail(hedger):
+    """If the hedge fails too, the caller sees the original attempt's error."""
+    with pytest.raises(APIError, match="attempt 0"):
+        await hedger.run(SERVICE, _attempts(0.05, 0.1, fail=True))
+
+
+async def test_http_service_hedges_listed_services(hedger):
+    """get_json hedges services in hedge_services, and only those."""
+    http = HTTPService(Config())
+    http.hedger = hedger
+    response = MagicMock(json=AsyncMock(return_value={"ok": True}))
+    http.get = AsyncMock(return_value=response)
+
+    assert await http.get_json("https://example.com", service=SERVICE) == {"ok": True}
+    assert await http.get_json("https://example.com", service="RA") == {"ok": True}
+    assert hedger.stats(SERVICE).requests == 1
+    assert "RA" not in hedger.snapshot()
@@ -0,0 +1,77 @@
+"""Test HTTPService response lifecycles against a local server."""
+
+import asyncio
+import logging
+
+import pytest
+
+from app.shared.http import HTTPService
+from config import Config
+
+
+@pytest.fixture
+async def http():
+    """HTTPService in debug mode, one connection per host, leaks reported at once."""
+    config = Config()
+    config.runtime.debug = True
+    config.http.response_leak_seconds = 0
+    service = HTTPService(config, max_connections=1, max_connections_per_host=1)
+    yield service
+    await service.close()
+
+
+async def test_helpers_return_released_responses(http, server):
+    """get/head/post hand back responses that no longer hold a connection."""
+    responses = [
+        await http.get(f"{server}/small"),
+        await http.head(f"{server}/small"),
+        await http.post(f"{server}/small", json={}),
+    ]
+
+    assert all(response.closed for response in responses)
+    assert await responses[0].json() == {"ok": True}
+    assert await http.get_text(f"{server}/small") == '{"ok": true}'
+    assert http.leak_detector.unreleased() == []
+
+
+async def test_stream_releases_unread_body_on_exit(http, server):
+    """Leaving the block frees the connection even if the body was not read."""
+    with pytest.raises(RuntimeError):
+        async with http.stream("GET", f"{server}/endless") as response:
+            assert not response.closed
+            raise RuntimeError
+
+    assert response.closed
+    # The only pooled connection is free again
+    assert await http.get_json(f"{server}/small") == {"ok": True}
+
+
+async def test_reports_leaks_when_pool_saturates(http, server, caplog):
+    """A request queued behind a leaked response reports the leak."""
+    session = await http._ensure_session()
+    leaked = await session.get(
+        f"{server}/endless", trace_request_ctx={"service": "Leaky"}
+    )
+
+    queued = asyncio.create_task(http.get(f"{server}/small"))
+    with caplog.at_level(logging.WARNING, logger="app.shared.http_leaks"):
+        await asyncio.sleep(0.1)
+        assert http.leak_detector.saturations == 1
+        leaked.release()
+        await asyncio.wait_for(queued, 1)
+
+    assert "Connection pool saturated" in caplog.text
+    assert f"Unreleased Leaky response (pool saturated): GET {server}/endless" in (
+        caplog.text
+    )
+
+
+async def test_download_returns_read_only_view(http, server, blob):
+    """Downloads are one read-only buffer, checked against max_size."""
+    data = await http.download(f"{server}/blob", max_size=len(blob))
+
+    assert isinstance(data, memoryview)
+    assert data.readonly
+    assert data == blob
+    with pytest.raises(ValueError, match="Response too large"):
+        await http.download(f"{server}/blob", max_size=len(blob) - 1)
@@ -0,0 +1,150 @@
+"""Test the persistent HTTP response cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import ClientResponse
+from fastapi.testclient import TestClient
+from multidict import CIMultiDict
+
+from app.interfaces.api.server import create_app
+from app.services.image import ImageService
+from app.shared.http import HTTPService
+from app.shared.http_cache import ResponseCache
+from config import config
+
+URL = "https://app.ticketmaster.com/discovery/v2/events/1.json"
+
+
+def _response(status: int, body: bytes = b"", **headers: str) -> MagicMock:
+    response = MagicMock(spec=ClientResponse)
+    response.status = status
+    response.headers = CIMultiDict(
+        {name.replace("_", "-"): value for name, value in headers.items()}
+    )
+    response.read = AsyncMock(return_value=body)
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """A cache file in a temporary directory."""
+    return ResponseCache(tmp_path / "http_cache.db", 1024, {"Ticketmaster"})
+
+
+@pytest.fixture
+def http(tmp_path, monkeypatch):
+    """HTTPService with the response cache enabled for Ticketmaster."""
+    monkeypatch.setattr(config.http, "response_cache_enabled", True)
+    monkeypatch.setattr(config.http, "response_cache_path", tmp_path / "cache.db")
+    monkeypatch.setattr(config.http, "response_cache_services", {"Ticketmaster"})
+    return HTTPService(config)
+
+
+def test_key_includes_params_and_selected_headers():
+    """Params and content-negotiation headers separate entries; others don't."""
+    base = ResponseCache.key("GET", URL, {"apikey": "a"}, {"Accept": "json"})
+
+    assert base == ResponseCache.key(
+        "GET", URL, {"apikey": "a"}, {"accept": "json", "User-Agent": "x"}
+    )
+    assert base != ResponseCache.key("GET", URL, {"apikey": "b"}, {"Accept": "json"})
+    assert base != ResponseCache.key("GET", URL, {"apikey": "a"}, {"Accept": "xml"})
+
+
+async def test_stores_and_serves_fresh_response(cache):
+    """Responses with max-age are fresh until it passes."""
+    key = cache.key("GET", URL)
+    await cache.store(key, {"Cache-Control": "max-age=60"}, b"{}")
+
+    entry = await cache.get(key)
+    assert entry.body == b"{}"
+    assert entry.fresh
+
+    with patch("app.shared.http_cache.time.time", return_value=entry.stored_at + 61):
+        assert not entry.fresh
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Cache-Control": "no-store", "ETag": '"v1"'},
+        {"Content-Type": "application/json"},
+    ],
+)
+async def test_skips_unusable_responses(cache, headers):
+    """no-store responses and ones that can't be reused or revalidated."""
+    key = cache.key("GET", URL)
+    await cache.store(key, headers, b"{}")
+
+    assert await cache.get(key) is None
+
+
+async def test_evicts_least_recently_used(cache):
+    """Entries beyond the size budget are dropped oldest-access first."""
+    headers = {"Cache-Control": "max-age=60"}
+    for name in ("a", "b"):
+        await cache.store(name, headers, b"x" * 400)
+    await cache.get("a")
+    await cache.store("c", headers, b"x" * 400)
+
+    assert await cache.get("a") is not None
+    assert await cache.get("b") is None
+    assert await cache.get("c") is not None
+
+
+async def test_get_json_serves_fresh_hits(http):
+    """A fresh cached response is returned without a request."""
+    response = _response(200, b'{"id": 1}', Cache_Control="max-age=60")
+    with patch.object(http, "get", AsyncMock(return_value=response)) as get:
+        for _ in range(2):
+            assert await http.get_json(URL, service="Ticketmaster") == {"id": 1}
+
+    assert get.await_count == 1
+    assert http.response_cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "revalidations": 0,
+    }
+
+
+async def test_get_json_revalidates_stale_response(http):
+    """A stale entry is revalidated with its ETag and reused on 304."""
+    first = _response(200, b'{"id": 1}', ETag='"v1"')
+    with patch.object(http, "get", AsyncMock(return_value=first)):
+        await http.get_json(URL, service="Ticketmaster")
+
+    with patch.object(http, "get", AsyncMock(return_value=_response(304))) as get:
+        assert await http.get_json(URL, service="Ticketmaster") == {"id": 1}
+
+    assert get.await_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert http.response_cache.revalidations == 1
+
+
+async def test_services_must_opt_in(http):
+    """Services not listed never touch the cache."""
+    response = _response(200, b"{}")
+    response.json = AsyncMock(return_value={})
+    with patch.object(http, "get", AsyncMock(return_value=response)):
+        await http.get_json(URL, service="GoogleGenreSearch")
+
+    assert http.response_cache.stats()["misses"] == 0
+
+
+def test_http_services_share_one_cache(http):
+    """Image downloads count against the same cache as every other request."""
+    image_service = ImageService(config, http)
+
+    assert image_service.downloads.response_cache is http.response_cache
+
+
+async def test_connections_endpoint_reports_hits(http):
+    """A repeated GET shows up as a hit in the connection statistics."""
+    response = _response(200, b'{"id": 1}', Cache_Control="max-age=60")
+    with patch.object(http, "get", AsyncMock(return_value=response)):
+        for _ in range(2):
+            await http.get_json(URL, service="Ticketmaster")
+
+    stats = TestClient(create_app()).get("/api/v1/statistics/connections").json()
+
+    assert stats["response_cache"] == {"hits": 1, "misses": 1, "revalidations": 0}
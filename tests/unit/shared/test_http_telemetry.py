@@ -0,0 +1,51 @@
+"""Test connection pool telemetry against a local server."""
+
+import asyncio
+
+import pytest
+
+from app.shared.http import HTTPService
+from app.shared.http_telemetry import ConnectionTelemetry
+from config import Config
+
+
+@pytest.fixture
+async def http():
+    """HTTPService with one connection per host, reporting to its own telemetry."""
+    service = HTTPService(Config(), max_connections=1, max_connections_per_host=1)
+    service.telemetry = ConnectionTelemetry(samples=8).pool("test", 1, 1)
+    yield service
+    await service.close()
+
+
+async def test_counts_connections_and_times_phases(http, server):
+    """The first request opens a connection, later ones reuse it."""
+    for _ in range(3):
+        await http.get_json(f"{server}/small")
+
+    stats = http.telemetry.snapshot()["hosts"]["127.0.0.1"]
+    assert stats["requests"] == 3
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 2
+    assert stats["connect"]["count"] == 1
+    assert stats["ttfb"]["count"] == 3
+    assert stats["pool_wait"] is None
+
+
+async def test_records_pool_waits(http, server):
+    """Requests queued behind a full pool record how long they waited."""
+    await asyncio.gather(*(http.get_json(f"{server}/small") for _ in range(3)))
+
+    stats = http.telemetry.snapshot()["hosts"]["127.0.0.1"]
+    assert stats["requests"] == 3
+    assert stats["pool_wait"]["count"] == 2
+
+
+async def test_keeps_a_bounded_window(http, server):
+    """Only the most recent samples per phase are kept."""
+    for _ in range(10):
+        await http.get_json(f"{server}/small")
+
+    stats = http.telemetry.snapshot()["hosts"]["127.0.0.1"]
+    assert stats["requests"] == 10
+    assert stats["ttfb"]["count"] == 8
@@ -0,0 +1,99 @@
+"""Test per-service rate limiting."""
+
+import asyncio
+import time
+from email.utils import formatdate
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp import ClientResponse
+
+from app.core.errors import RateLimitError
+from app.shared.http import HTTPService
+from app.shared.rate_limit import RateLimiter, TokenBucket, parse_retry_after
+from config import config
+from config.http import RateLimit
+
+
+async def _elapsed(coro) -> float:
+    start = time.monotonic()
+    await coro
+    return time.monotonic() - start
+
+
+async def test_bucket_allows_burst_then_throttles():
+    """Up to ``burst`` requests go out at once; the rest follow the rate."""
+    bucket = TokenBucket(rate=20, burst=2)
+
+    assert await _elapsed(asyncio.gather(bucket.acquire(), bucket.acquire())) < 0.03
+    assert await _elapsed(bucket.acquire()) >= 0.04
+
+
+async def test_pause_holds_every_caller():
+    """A paused bucket releases nobody until the pause is over."""
+    bucket = TokenBucket(rate=None)
+    bucket.pause(0.05)
+
+    elapsed = await _elapsed(asyncio.gather(*(bucket.acquire() for _ in range(3))))
+    assert 0.05 <= elapsed < 0.5
+
+
+async def test_available_reports_a_spare_token():
+    """Hedging asks whether a request could go out without waiting."""
+    bucket = TokenBucket(rate=1, burst=1)
+
+    assert bucket.available()
+    await bucket.acquire()
+    assert not bucket.available()
+    bucket.pause(0)
+    assert not bucket.available()
+
+
+async def test_unlisted_services_are_not_throttled():
+    """Only configured services get a rate."""
+    limiter = RateLimiter({"Ticketmaster": RateLimit(rate=1, burst=1)}, 30)
+
+    assert limiter.bucket("Ticketmaster").rate == 1
+    assert limiter.bucket("Other").rate is None
+    assert limiter.bucket("Other") is limiter.bucket("Other")
+
+
+@pytest.mark.parametrize(
+    "value, expected", [("120", 120), (" 5 ", 5), (None, None), ("soon", None)]
+)
+def test_parse_retry_after_seconds(value, expected):
+    """Retry-After given in seconds, missing or malformed."""
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    """Retry-After given as an HTTP date is converted to seconds from now."""
+    value = formatdate(time.time() + 60, usegmt=True)
+
+    assert 58 <= parse_retry_after(value) <= 60
+
+
+def test_429_pauses_the_service():
+    """A 429 holds back the whole service for its Retry-After period."""
+    http = HTTPService(config)
+    response = MagicMock(spec=ClientResponse)
+    response.status = 429
+    response.headers = {"Retry-After": "30"}
+
+    with pytest.raises(RateLimitError) as exc_info:
+        http._handle_response_error(response, "Ticketmaster")
+
+    assert exc_info.value.retry_after == 30
+    bucket = http.rate_limiter.bucket("Ticketmaster")
+    assert bucket.paused_until - time.monotonic() > 29
+    assert http.rate_limiter.bucket("Zyte").paused_until == 0
+
+
+def test_http_services_share_one_limiter():
+    """Every HTTPService draws from, and is paused by, the same buckets."""
+    images = HTTPService(config, pool="images")
+    http = HTTPService(config)
+
+    assert images.rate_limiter is http.rate_limiter
+    images.rate_limiter.pause("Ticketmaster", 30)
+    assert http.rate_limiter.bucket("Ticketmaster").paused_until > time.monotonic()
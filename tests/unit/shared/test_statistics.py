@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock
 
+from app.core.schemas import StageTiming
+from app.shared.database.utils import save_stage_timings
 from app.shared.statistics import StatisticsService
 
 
@@ -96,3 +98,32 @@ def test_get_submission_statistics(mocker):
     assert stats["by_service"]["ticketfairy"] == 150
     assert stats["success_rate"] == 66.67  # (100/150) * 100 rounded
     assert "last_updated" in stats
+
+
+def test_get_stage_timings(db_session):
+    """Test per-stage latency percentiles."""
+    save_stage_timings(
+        [
+            StageTiming(stage="llm.extract_from_html", start=0.0, duration=d / 10)
+            for d in range(1, 101)
+        ]
+        + [StageTiming(stage="import.save", start=0.0, duration=0.02)],
+        db=db_session,
+    )
+
+    stats = StatisticsService(db_session=db_session).get_stage_timings(days=1)
+
+    llm = stats["stages"]["llm.extract_from_html"]
+    assert llm["count"] == 100
+    assert llm["p50"] == 5.0
+    assert llm["p99"] == 9.9
+    assert llm["max"] == 10.0
+    assert stats["stages"]["import.save"] == {
+        "count": 1,
+        "mean": 0.02,
+        "max": 0.02,
+        "p50": 0.02,
+        "p90": 0.02,
+        "p95": 0.02,
+        "p99": 0.02,
+    }
@@ -1,7 +1,9 @@
 """Tests for timezone utilities."""
 
+from datetime import datetime
+
 from app.core.schemas import Coordinates, EventLocation
-from app.shared.timezone import get_timezone_from_location
+from app.shared.timezone import get_timezone_from_location, get_timezone_from_offset
 
 
 def test_get_timezone_from_location_with_coordinates():
@@ -88,3 +90,18 @@ def test_get_timezone_from_location_ambiguous_city():
     timezone = get_timezone_from_location(location)
     # The implementation doesn't consider state, only city name
     assert timezone == "America/Los_Angeles"
+
+
+def test_get_timezone_from_offset():
+    """A stated offset picks the location's zone only if that zone matches."""
+    berlin = EventLocation(city="Berlin", country="Germany")
+    summer = datetime.fromisoformat("2025-06-01T22:00:00+02:00")
+    winter = datetime.fromisoformat("2025-12-01T22:00:00+02:00")
+
+    assert get_timezone_from_offset(summer, berlin) == "Europe/Berlin"
+    assert get_timezone_from_offset(winter, berlin) == "Etc/GMT-2"
+    assert get_timezone_from_offset(summer.replace(tzinfo=None), berlin) is None
+    assert (
+        get_timezone_from_offset(datetime.fromisoformat("2025-06-01T22:00+05:30"))
+        is None
+    )